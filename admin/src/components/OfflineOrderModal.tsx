@@ -1,6 +1,6 @@
 import { useState, useEffect } from "react";
 import { User, AdminOfflineOrderCreateRequest } from "@/types";
-import { api } from "@/lib/api";
+import { api, apiAll } from "@/lib/api";
 import { X, Plus, Trash2, Loader2 } from "lucide-react";
 
 export default function OfflineOrderModal({ isOpen, onClose, onSuccess }: { isOpen: boolean, onClose: () => void, onSuccess: () => void }) {
@@ -21,8 +21,8 @@ export default function OfflineOrderModal({ isOpen, onClose, onSuccess }: { isOp
     useEffect(() => {
         if (isOpen && users.length === 0) {
             setLoadingUsers(true);
-            api<{users: User[]}>("/admin/users/all?limit=1000")
-                .then(res => setUsers(res.users || []))
+            apiAll<User>("/admin/users/all?limit=200")
+                .then(setUsers)
                 .catch(console.error)
                 .finally(() => setLoadingUsers(false));
                 
@@ -114,6 +114,60 @@ export async function apiFormData<T = unknown>(
     return res.json();
 }
 
+// ── Cursor-paginated lists ───────────────────────────────────────────────
+// List endpoints return a plain JSON array and hand out opaque cursors in the
+// X-Next-Cursor / X-Prev-Cursor headers; pass one back as `?cursor=`.
+export interface CursorPage<T> {
+    items: T[];
+    nextCursor: string | null;
+    prevCursor: string | null;
+}
+
+export async function apiPage<T = unknown>(
+    path: string,
+    cursor?: string | null
+): Promise<CursorPage<T>> {
+    const url = cursor
+        ? `${path}${path.includes("?") ? "&" : "?"}cursor=${encodeURIComponent(cursor)}`
+        : path;
+    const doFetch = () =>
+        fetch(`${API_URL}${url}`, {
+            headers: { "Content-Type": "application/json" },
+            credentials: "include",
+        });
+
+    let res = await doFetch();
+
+    if (res.status === 401) {
+        const refreshed = await waitForRefresh();
+        if (refreshed) res = await doFetch();
+        if (!refreshed || !res.ok) throw new Error("Unauthorized");
+    }
+
+    if (!res.ok) {
+        const body = await res.json().catch(() => ({}));
+        throw new Error(body.detail || `Request failed: ${res.status}`);
+    }
+
+    return {
+        items: await res.json(),
+        nextCursor: res.headers.get("X-Next-Cursor"),
+        prevCursor: res.headers.get("X-Prev-Cursor"),
+    };
+}
+
+// Every page of a list, for pickers that need the full set
+export async function apiAll<T = unknown>(path: string): Promise<T[]> {
+    const items: T[] = [];
+    let cursor: string | null = null;
+    do {
+        const page: CursorPage<T> = await apiPage<T>(path, cursor);
+        items.push(...page.items);
+        cursor = page.nextCursor;
+    } while (cursor);
+    return items;
+}
+
 // ── Blob download ────────────────────────────────────────────────────────
 export async function apiBlob(path: string): Promise<Blob> {
     const res = await fetch(`${API_URL}${path}`, {
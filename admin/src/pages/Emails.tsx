@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import { apiFormData, api } from "@/lib/api";
+import { apiFormData, apiAll } from "@/lib/api";
 import type { AuthUser } from "@/types";
 import { Send, Users, User, Type, Link as LinkIcon, Image as ImageIcon, CheckCircle2, AlertCircle } from "lucide-react";
 
@@ -35,7 +35,7 @@ export default function Emails() {
     const [error, setError] = useState<string | null>(null);
 
     useEffect(() => {
-        api<AuthUser[]>("/admin/users/all?admin=false&limit=200")
+        apiAll<AuthUser>("/admin/users/all?admin=false&limit=200")
             .then(setAvailableUsers)
             .catch(console.error);
     }, []);
@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
-import { api } from "@/lib/api";
+import { apiAll } from "@/lib/api";
 import type { Order, OrderStatus } from "@/types";
 import {
     Download, Trash2, Search, X, Loader2, CreditCard, Printer, Plus, Minus, ArrowUpRight, Plus as Add, SlidersHorizontal, ChevronLeft, ChevronRight
@@ -44,9 +44,10 @@ export default function Orders() {
 
     const fetchOrders = () => {
         setLoading(true);
-        let url = "/admin/orders/all?skip=0&limit=200";
+        // Search, totals and paging below run over the full list, so follow every cursor
+        let url = "/admin/orders/all?limit=200";
         if (statusFilter !== "All") url += `&status_filter=${statusFilter.toUpperCase().replace(/ /g, "_")}`;
-        api<Order[]>(url).then(setOrders).catch(console.error).finally(() => setLoading(false));
+        apiAll<Order>(url).then(setOrders).catch(console.error).finally(() => setLoading(false));
     };
 
     useEffect(() => { fetchOrders(); }, [statusFilter]);
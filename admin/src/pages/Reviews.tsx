@@ -23,7 +23,8 @@ export default function Reviews() {
         parent_id: "all",
         sub_id: "all",
         user_id: "",
-        skip: 0,
+        cursor: null as string | null,  // from the previous response's next_cursor / prev_cursor
+        page: 1,
         limit: 10
     });
 
@@ -41,13 +42,13 @@ export default function Reviews() {
     // Fetch reviews whenever filters change
     useEffect(() => {
         fetchReviews();
-    }, [filters.skip, activeTab, filters.parent_id, filters.sub_id]);
+    }, [filters.cursor, activeTab, filters.parent_id, filters.sub_id]);
 
     const fetchReviews = () => {
         setLoading(true);
         
         const params = new URLSearchParams();
-        params.append("skip", filters.skip.toString());
+        if (filters.cursor) params.append("cursor", filters.cursor);
         params.append("limit", filters.limit.toString());
         
         if (filters.user_id.trim()) {
@@ -83,11 +84,11 @@ export default function Reviews() {
     };
 
     const handleParentChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
-        setFilters(f => ({ ...f, parent_id: e.target.value, sub_id: "all", skip: 0 }));
+        setFilters(f => ({ ...f, parent_id: e.target.value, sub_id: "all", cursor: null, page: 1 }));
     };
 
     const handleSubChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
-        setFilters(f => ({ ...f, sub_id: e.target.value, skip: 0 }));
+        setFilters(f => ({ ...f, sub_id: e.target.value, cursor: null, page: 1 }));
     };
 
     const resetFilters = () => {
@@ -95,7 +96,8 @@ export default function Reviews() {
             parent_id: "all",
             sub_id: "all",
             user_id: "",
-            skip: 0,
+            cursor: null,
+            page: 1,
             limit: 10
         });
     };
@@ -127,7 +129,7 @@ export default function Reviews() {
                 <div className="flex flex-wrap items-center gap-3">
                     <div className="flex p-1 bg-white dark:bg-[#131b2e] border border-slate-200 dark:border-[#434655]/30 rounded-lg">
                         <button
-                            onClick={() => setActiveTab("product")}
+                            onClick={() => { setActiveTab("product"); setFilters(f => ({ ...f, cursor: null, page: 1 })); }}
                             className={`px-6 py-2 rounded text-[10px] font-bold uppercase tracking-widest transition-colors ${
                                 activeTab === "product" 
                                     ? "bg-[#1f70e3] text-white shadow-sm" 
@@ -137,7 +139,7 @@ export default function Reviews() {
                             Products
                         </button>
                         <button
-                            onClick={() => setActiveTab("service")}
+                            onClick={() => { setActiveTab("service"); setFilters(f => ({ ...f, cursor: null, page: 1 })); }}
                             className={`px-6 py-2 rounded text-[10px] font-bold uppercase tracking-widest transition-colors ${
                                 activeTab === "service" 
                                     ? "bg-[#1f70e3] text-white shadow-sm" 
@@ -229,18 +231,18 @@ export default function Reviews() {
                             <div className="flex items-center gap-2">
                                 <button
                                     className="p-1.5 text-slate-600 dark:text-[#c3c5d8] bg-slate-50 dark:bg-[#0b1326] border border-slate-200 dark:border-[#434655]/40 rounded hover:text-blue-600 dark:hover:text-[#adc6ff] hover:border-blue-400 dark:hover:border-[#adc6ff]/50 disabled:opacity-30 disabled:pointer-events-none transition-colors"
-                                    disabled={filters.skip === 0}
-                                    onClick={() => setFilters(f => ({ ...f, skip: Math.max(0, f.skip - f.limit) }))}
+                                    disabled={!reviewData.prev_cursor}
+                                    onClick={() => setFilters(f => ({ ...f, cursor: reviewData.prev_cursor ?? null, page: Math.max(1, f.page - 1) }))}
                                 >
                                     <ChevronLeft size={16} />
                                 </button>
                                 <span className="text-[10px] font-bold text-blue-600 dark:text-[#adc6ff] px-3 py-1 bg-[#1f70e3]/10 border border-[#1f70e3]/20 rounded font-mono">
-                                    PAGE {Math.floor(filters.skip / filters.limit) + 1}
+                                    PAGE {filters.page}
                                 </span>
                                 <button
                                     className="p-1.5 text-slate-600 dark:text-[#c3c5d8] bg-slate-50 dark:bg-[#0b1326] border border-slate-200 dark:border-[#434655]/40 rounded hover:text-blue-600 dark:hover:text-[#adc6ff] hover:border-blue-400 dark:hover:border-[#adc6ff]/50 disabled:opacity-30 disabled:pointer-events-none transition-colors"
-                                    disabled={filters.skip + filters.limit >= reviewData.total}
-                                    onClick={() => setFilters(f => ({ ...f, skip: f.skip + f.limit }))}
+                                    disabled={!reviewData.next_cursor}
+                                    onClick={() => setFilters(f => ({ ...f, cursor: reviewData.next_cursor ?? null, page: f.page + 1 }))}
                                 >
                                     <ChevronRight size={16} />
                                 </button>
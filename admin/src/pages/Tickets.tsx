@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
-import { api } from "@/lib/api";
+import { apiAll } from "@/lib/api";
 import type { Ticket } from "@/types";
 import { Loader2, Filter, ChevronRight, MessageSquare, Shield, User as UserIcon, Search } from "lucide-react";
 
@@ -40,13 +40,14 @@ export default function Tickets() {
 
     const fetchTickets = () => {
         setLoading(true);
-        let url = `/admin/tickets/all?skip=0&limit=100`;
+        // The summary counts cover every matching ticket, so follow every cursor
+        let url = `/admin/tickets/all?limit=200`;
         const params = new URLSearchParams();
         if (statusFilter !== "ALL") params.append("status_filter", statusFilter);
         if (priorityFilter !== "ALL") params.append("priority_filter", priorityFilter);
         if (params.toString()) url += `&${params.toString()}`;
         
-        api<Ticket[]>(url)
+        apiAll<Ticket>(url)
             .then(setTickets)
             .catch(console.error)
             .finally(() => setLoading(false));
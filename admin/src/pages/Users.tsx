@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
-import { api } from "@/lib/api";
+import { api, apiPage } from "@/lib/api";
 import type { AuthUser } from "@/types";
 import { Search, Shield, User, Trash2, Loader2, Users, ChevronRight } from "lucide-react";
 
@@ -27,13 +27,31 @@ export default function UsersPage() {
     const [loading, setLoading] = useState(true);
     const [search, setSearch] = useState("");
     const [adminFilter, setAdminFilter] = useState<boolean | null>(null);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+
+    const usersUrl = () => {
+        let url = `/admin/users/all?limit=100`;
+        if (adminFilter !== null) url += `&admin=${adminFilter}`;
+        if (search) url += `&query=${encodeURIComponent(search)}`;
+        return url;
+    };
 
     const fetchUsers = () => {
         setLoading(true);
-        let url = `/admin/users/all?skip=0&limit=100`;
-        if (adminFilter !== null) url += `&admin=${adminFilter}`;
-        if (search) url += `&query=${search}`;
-        api<AuthUser[]>(url).then(setUsers).catch(console.error).finally(() => setLoading(false));
+        apiPage<AuthUser>(usersUrl())
+            .then(page => { setUsers(page.items); setNextCursor(page.nextCursor); })
+            .catch(console.error)
+            .finally(() => setLoading(false));
+    };
+
+    const loadMore = () => {
+        if (!nextCursor) return;
+        setLoadingMore(true);
+        apiPage<AuthUser>(usersUrl(), nextCursor)
+            .then(page => { setUsers(prev => [...prev, ...page.items]); setNextCursor(page.nextCursor); })
+            .catch(console.error)
+            .finally(() => setLoadingMore(false));
     };
 
     useEffect(() => {
@@ -200,6 +218,18 @@ export default function UsersPage() {
                         </tbody>
                     </table>
                 </div>
+                {nextCursor && !loading && (
+                    <div className="border-t border-slate-200 dark:border-[#434655]/20 p-4 flex justify-center">
+                        <button
+                            onClick={loadMore}
+                            disabled={loadingMore}
+                            className="h-9 px-4 flex items-center gap-2 border border-slate-200 dark:border-[#434655]/40 rounded-lg text-[10px] font-bold uppercase tracking-widest text-slate-600 dark:text-[#c3c5d8] bg-white dark:bg-[#131b2e] cursor-pointer hover:border-blue-400 dark:hover:border-[#adc6ff] disabled:opacity-50 transition-colors"
+                        >
+                            {loadingMore && <Loader2 size={12} className="animate-spin" />}
+                            Load more
+                        </button>
+                    </div>
+                )}
             </div>
         </div>
     );
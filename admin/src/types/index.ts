@@ -381,7 +381,8 @@ export interface Review {
 
 export interface ReviewListResponse {
     total: number;
-    skip: number;
     limit: number;
+    next_cursor?: string | null;
+    prev_cursor?: string | null;
     reviews: Review[];
 }
@@ -0,0 +1,95 @@
+"""Add dashboard daily rollups
+
+Revision ID: b3c1d8e4f210
+Revises: eb354b3ed850
+Create Date: 2026-10-17 10:12:41.204113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c1d8e4f210'
+down_revision: Union[str, Sequence[str], None] = 'eb354b3ed850'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, rollup source, trigger events) — updates only matter when they can move a rollup
+TRACKED_TABLES = [
+    ('orders', 'order', 'INSERT OR DELETE OR UPDATE OF status, total_amount, amount_paid, is_offline, created_at'),
+    ('transactions', 'transaction', 'INSERT OR DELETE OR UPDATE OF amount, payment_mode, created_at'),
+    ('inquiry_groups', 'inquiry', 'INSERT OR DELETE OR UPDATE OF status, created_at'),
+    ('users', 'user', 'INSERT OR DELETE OR UPDATE OF created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dashboard_daily_rollups',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('is_offline', sa.Boolean(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('amount_paid', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('source', 'day', 'dimension', 'is_offline')
+    )
+    op.create_table('dashboard_dirty_days',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.PrimaryKeyConstraint('source', 'day')
+    )
+
+    # Day-range lookups when a rollup day is recomputed
+    op.create_index('ix_orders_created_at', 'orders', ['created_at'], unique=False)
+    op.create_index(op.f('ix_transactions_created_at'), 'transactions', ['created_at'], unique=False)
+    op.create_index(op.f('ix_inquiry_groups_created_at'), 'inquiry_groups', ['created_at'], unique=False)
+    op.create_index(op.f('ix_users_created_at'), 'users', ['created_at'], unique=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION dashboard_mark_dirty() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                INSERT INTO dashboard_dirty_days (source, day)
+                VALUES (TG_ARGV[0], (COALESCE(OLD.created_at, now()) AT TIME ZONE 'UTC')::date)
+                ON CONFLICT DO NOTHING;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                INSERT INTO dashboard_dirty_days (source, day)
+                VALUES (TG_ARGV[0], (COALESCE(NEW.created_at, now()) AT TIME ZONE 'UTC')::date)
+                ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, source, events in TRACKED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_dashboard_dirty AFTER {events} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION dashboard_mark_dirty('{source}')"
+        )
+        # Backfill: every existing day is dirty, the first dashboard load builds it
+        op.execute(
+            f"INSERT INTO dashboard_dirty_days (source, day) "
+            f"SELECT DISTINCT '{source}', (created_at AT TIME ZONE 'UTC')::date FROM {table} "
+            f"WHERE created_at IS NOT NULL ON CONFLICT DO NOTHING"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_dashboard_dirty ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS dashboard_mark_dirty()")
+
+    op.drop_index(op.f('ix_users_created_at'), table_name='users')
+    op.drop_index(op.f('ix_inquiry_groups_created_at'), table_name='inquiry_groups')
+    op.drop_index(op.f('ix_transactions_created_at'), table_name='transactions')
+    op.drop_index('ix_orders_created_at', table_name='orders')
+    op.drop_table('dashboard_dirty_days')
+    op.drop_table('dashboard_daily_rollups')
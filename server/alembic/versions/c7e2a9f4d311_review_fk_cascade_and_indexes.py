@@ -0,0 +1,41 @@
+"""Cascade review deletes in the database and index review lookups
+
+Revision ID: c7e2a9f4d311
+Revises: b3c1d8e4f210
+Create Date: 2026-10-17 14:03:27.518940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9f4d311'
+down_revision: Union[str, Sequence[str], None] = 'b3c1d8e4f210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (column, referenced table) — sub-product / sub-service relationships use
+# passive_deletes, so the database removes their reviews instead of the ORM
+REVIEW_TARGETS = [
+    ('product_id', 'sub_products'),
+    ('service_id', 'sub_services'),
+]
+
+
+def upgrade() -> None:
+    for column, target in REVIEW_TARGETS:
+        op.drop_constraint(f'reviews_{column}_fkey', 'reviews', type_='foreignkey')
+        op.create_foreign_key(
+            f'reviews_{column}_fkey', 'reviews', target, [column], ['id'], ondelete='CASCADE'
+        )
+        op.create_index(op.f(f'ix_reviews_{column}'), 'reviews', [column], unique=False)
+
+
+def downgrade() -> None:
+    for column, target in REVIEW_TARGETS:
+        op.drop_index(op.f(f'ix_reviews_{column}'), table_name='reviews')
+        op.drop_constraint(f'reviews_{column}_fkey', 'reviews', type_='foreignkey')
+        op.create_foreign_key(f'reviews_{column}_fkey', 'reviews', target, [column], ['id'])
@@ -0,0 +1,60 @@
+"""Add review_stats rating aggregates
+
+Revision ID: d41f6b9a2c57
+Revises: c7e2a9f4d311
+Create Date: 2026-10-17 15:41:09.302716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f6b9a2c57'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a9f4d311'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('review_stats',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=True),
+    sa.Column('service_id', sa.Integer(), nullable=True),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_total', sa.Integer(), nullable=False),
+    sa.Column('stars_1', sa.Integer(), nullable=False),
+    sa.Column('stars_2', sa.Integer(), nullable=False),
+    sa.Column('stars_3', sa.Integer(), nullable=False),
+    sa.Column('stars_4', sa.Integer(), nullable=False),
+    sa.Column('stars_5', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.CheckConstraint('(product_id IS NULL) <> (service_id IS NULL)', name='review_stats_single_target'),
+    sa.ForeignKeyConstraint(['product_id'], ['sub_products.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['service_id'], ['sub_services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('product_id'),
+    sa.UniqueConstraint('service_id')
+    )
+
+    # Backfill from existing reviews
+    for column in ('product_id', 'service_id'):
+        op.execute(f"""
+            INSERT INTO review_stats
+                ({column}, review_count, rating_total, stars_1, stars_2, stars_3, stars_4, stars_5)
+            SELECT {column}, count(*), sum(rating),
+                   count(*) FILTER (WHERE rating = 1),
+                   count(*) FILTER (WHERE rating = 2),
+                   count(*) FILTER (WHERE rating = 3),
+                   count(*) FILTER (WHERE rating = 4),
+                   count(*) FILTER (WHERE rating = 5)
+            FROM reviews
+            WHERE {column} IS NOT NULL
+            GROUP BY {column}
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table('review_stats')
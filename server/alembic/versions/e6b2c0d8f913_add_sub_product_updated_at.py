@@ -0,0 +1,26 @@
+"""Add sub_products.updated_at
+
+Revision ID: e6b2c0d8f913
+Revises: d41f6b9a2c57
+Create Date: 2026-10-17 17:22:45.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2c0d8f913'
+down_revision: Union[str, Sequence[str], None] = 'd41f6b9a2c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sub_products', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sub_products', 'updated_at')
@@ -0,0 +1,54 @@
+"""Composite indexes for keyset-paginated listings
+
+Revision ID: f2a7c4e91b06
+Revises: e6b2c0d8f913
+Create Date: 2026-10-17 20:41:09.362514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a7c4e91b06'
+down_revision: Union[str, Sequence[str], None] = 'e6b2c0d8f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, new index, columns, single-column index it supersedes or None).
+# Each superseded index is a leading prefix of its replacement, so equality
+# lookups (and FK checks) keep an index.
+INDEXES = [
+    ('orders', 'ix_orders_user_id_created_at_id', ['user_id', 'created_at', 'id'], ('ix_orders_user_id', ['user_id'])),
+    ('orders', 'ix_orders_status_created_at_id', ['status', 'created_at', 'id'], ('ix_orders_status', ['status'])),
+    ('orders', 'ix_orders_created_at_id', ['created_at', 'id'], ('ix_orders_created_at', ['created_at'])),
+    ('payment_declarations', 'ix_payment_declarations_status_created_at_id', ['status', 'created_at', 'id'], None),
+    ('payment_declarations', 'ix_payment_declarations_created_at_id', ['created_at', 'id'], None),
+    ('inquiry_groups', 'ix_inquiry_groups_user_id_created_at_id', ['user_id', 'created_at', 'id'], ('ix_inquiry_groups_user_id', ['user_id'])),
+    ('inquiry_groups', 'ix_inquiry_groups_status_created_at_id', ['status', 'created_at', 'id'], ('ix_inquiry_groups_status', ['status'])),
+    ('inquiry_groups', 'ix_inquiry_groups_created_at_id', ['created_at', 'id'], ('ix_inquiry_groups_created_at', ['created_at'])),
+    ('notifications', 'ix_notifications_user_id_created_at_id', ['user_id', 'created_at', 'id'], ('ix_notifications_user_id', ['user_id'])),
+    ('notifications', 'ix_notifications_created_at_id', ['created_at', 'id'], None),
+    ('email_logs', 'ix_email_logs_sent_at_id', ['sent_at', 'id'], None),
+    ('tickets', 'ix_tickets_user_id_updated_at_id', ['user_id', 'updated_at', 'id'], ('ix_tickets_user_id', ['user_id'])),
+    ('tickets', 'ix_tickets_updated_at_id', ['updated_at', 'id'], None),
+    ('reviews', 'ix_reviews_product_id_id', ['product_id', 'id'], ('ix_reviews_product_id', ['product_id'])),
+    ('reviews', 'ix_reviews_service_id_id', ['service_id', 'id'], ('ix_reviews_service_id', ['service_id'])),
+    ('reviews', 'ix_reviews_created_at_id', ['created_at', 'id'], None),
+]
+
+
+def upgrade() -> None:
+    for table, name, columns, superseded in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+        if superseded is not None:
+            op.drop_index(superseded[0], table_name=table)
+
+
+def downgrade() -> None:
+    for table, name, columns, superseded in reversed(INDEXES):
+        if superseded is not None:
+            op.create_index(superseded[0], table, superseded[1], unique=False)
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,183 @@
+"""
+Catalog response cache.
+
+The public product / service endpoints change only when an admin edits the
+catalog, so their serialized JSON responses are cached in two tiers:
+
+    process memory (LRU, `catalog_cache_local_ttl_seconds`)
+      → Redis  catalog:{version}:{key}  (`catalog_cache_ttl_seconds`)
+        → loader (Postgres)
+
+Invalidation is a version bump rather than a key sweep: admin writes call
+`catalog_cache.invalidate()`, which INCRs `catalog:version` and publishes the
+new version on `catalog:invalidate`. Every worker's listener adopts it and
+drops its local entries; Redis entries of older versions are never read
+again and simply expire. Entries are stored under the version that was
+current when the load STARTED, so a load racing an admin write can't
+resurrect stale data under the new version.
+
+Loaders receive a session the cache opens for that load. A single-flight
+load is shared by every concurrent request for the key and outlives a
+cancelled first caller, so it must not run on any one request's session.
+
+If a Pub/Sub message is lost, the local version is re-read from Redis at
+least every local TTL, which bounds staleness. Redis errors fall back to the
+loader — the cache never fails a request.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.pubsub import pubsub_hub
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "catalog:version"
+CATALOG_INVALIDATE_CHANNEL = "catalog:invalidate"
+
+
+def to_json(adapter: TypeAdapter, value: Any) -> bytes:
+    """Serialize ORM objects exactly as the route's response_model would."""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+Loader = Callable[[AsyncSession], Awaitable[bytes]]
+
+
+class CatalogCache:
+    def __init__(self, max_entries: int, local_ttl: float, redis_ttl: int):
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._entries: "OrderedDict[str, Tuple[str, float, bytes]]" = OrderedDict()  # key → (version, expires_at, body)
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._listener: Optional[asyncio.Task] = None
+
+    async def get_or_load(self, key: str, loader: Loader) -> bytes:
+        """Serialized response for `key`, calling `loader(db)` only when no tier has it."""
+        version = await self._current_version()
+        if version is None:
+            return await self._load(loader)
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version and entry[1] > now:
+            self._entries.move_to_end(key)
+            return entry[2]
+
+        # Single-flight: concurrent misses for the same key share one load
+        flight = (version, key)
+        pending = self._pending.get(flight)
+        if pending is None:
+            pending = self._pending[flight] = asyncio.ensure_future(self._fill(version, key, loader))
+            pending.add_done_callback(lambda _: self._pending.pop(flight, None))
+        return await asyncio.shield(pending)
+
+    @staticmethod
+    async def _load(loader: Loader) -> bytes:
+        async with AsyncSessionLocal() as db:
+            return await loader(db)
+
+    async def _fill(self, version: str, key: str, loader: Loader) -> bytes:
+        redis_key = f"catalog:{version}:{key}"
+        body = None
+        try:
+            body = await redis_client.get(redis_key)
+        except Exception as e:
+            logger.warning(f"Catalog cache read failed for {key}: {e}")
+
+        if body is None:
+            body = await self._load(loader)
+            try:
+                await redis_client.set(redis_key, body, ex=self.redis_ttl)
+            except Exception as e:
+                logger.warning(f"Catalog cache write failed for {key}: {e}")
+        elif isinstance(body, str):
+            body = body.encode()
+
+        if self._version == version:
+            self._store(version, key, body)
+        return body
+
+    def _store(self, version: str, key: str, body: bytes) -> None:
+        self._entries[key] = (version, time.monotonic() + self.local_ttl, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _current_version(self) -> Optional[str]:
+        self._ensure_listener()
+        now = time.monotonic()
+        if self._version is not None and now - self._version_checked_at < self.local_ttl:
+            return self._version
+        try:
+            version = await redis_client.get(CATALOG_VERSION_KEY) or "0"
+        except Exception as e:
+            logger.warning(f"Catalog version lookup failed: {e}")
+            return None
+        self._adopt(version)
+        self._version_checked_at = now
+        return self._version
+
+    def _adopt(self, version: str) -> None:
+        if version != self._version:
+            self._version = version
+            self._entries.clear()
+
+    # ── Invalidation ───────────────────────────────────────────
+
+    async def invalidate(self) -> None:
+        """Drop the cached catalog on every worker. Call after an admin write commits."""
+        self._entries.clear()
+        try:
+            version = str(await redis_client.incr(CATALOG_VERSION_KEY))
+            self._adopt(version)
+            self._version_checked_at = time.monotonic()
+            await redis_client.publish(CATALOG_INVALIDATE_CHANNEL, version)
+        except Exception as e:
+            # Other workers catch up on their next version check
+            self._version = None
+            logger.error(f"Catalog cache invalidation failed: {e}")
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        try:
+            queue = await pubsub_hub.subscribe(CATALOG_INVALIDATE_CHANNEL)
+        except Exception as e:
+            logger.warning(f"Catalog invalidation listener failed to subscribe: {e}")
+            return
+        try:
+            while True:
+                version = await queue.get()
+                if version is None:  # hub shutting down
+                    return
+                self._adopt(version)
+                self._version_checked_at = time.monotonic()
+        finally:
+            await pubsub_hub.unsubscribe(CATALOG_INVALIDATE_CHANNEL, queue)
+
+
+catalog_cache = CatalogCache(
+    max_entries=settings.catalog_cache_size,
+    local_ttl=settings.catalog_cache_local_ttl_seconds,
+    redis_ttl=settings.catalog_cache_ttl_seconds,
+)
@@ -38,6 +38,7 @@ class Settings(BaseSettings):
     razorpay_key_id: str = ""
     razorpay_key_secret: str = ""
     razorpay_webhook_secret: str = ""
+    mock_payment_latency_ms: int = 0  # simulated gateway latency for the mock provider
 
     # OTP
     otp_expire_seconds: int = 300  # 5 minutes
@@ -51,9 +52,44 @@ class Settings(BaseSettings):
     company_upi_id: str = ""
     company_website: str = ""
 
+    # UPI QR cache (rendered PNGs keyed by the UPI link)
+    upi_qr_cache_size: int = 512
+    upi_qr_cache_ttl_seconds: int = 3600
+
+    # Invoice PDF cache (rendered PDFs keyed by content hash)
+    invoice_cache_dir: str = ""  # defaults to <tmp>/invoice-cache
+    invoice_cache_max_mb: int = 200
+
+    # Invoice render process pool
+    invoice_render_workers: int = 2
+    invoice_render_queue: int = 8  # renders allowed to wait before returning 503
+
+    # Admin dashboard (overview payload cache; rollups are refreshed on a miss)
+    dashboard_cache_ttl_seconds: int = 30
+
+    # Device traffic counters (buffered in memory, flushed to Redis)
+    traffic_flush_interval_seconds: int = 30
+
+    # Online presence (HTTP activity writes are throttled per user and batched)
+    presence_write_interval_seconds: int = 60
+    presence_flush_interval_seconds: int = 5
+
+    # Public catalog response cache (memory → Redis → DB, invalidated by admin writes)
+    catalog_cache_size: int = 1024
+    catalog_cache_local_ttl_seconds: int = 60
+    catalog_cache_ttl_seconds: int = 3600
+
+    # Admin notification fan-out: cached admin ids (invalidated when User.admin changes)
+    admin_roster_ttl_seconds: int = 300
+
+    # Per-user notification counters in Redis (rebuilt from Postgres on a miss and by reconciliation)
+    notification_counter_ttl_seconds: int = 3600
+
     # Rate Limiter
     rate_limit_requests: int = 200
     rate_limit_window_seconds: int = 60
+    # Global limit: allow clients well under their limit locally, syncing to Redis at most this often (0 = check Redis every request)
+    rate_limit_local_sync_seconds: float = 1.0
 
     # CORS
     cors_origins: str = "http://localhost:3000,http://localhost:5173,http://localhost:5174"
@@ -68,6 +104,7 @@ class Settings(BaseSettings):
     brevo_smtp_password: str = ""
     brevo_sender_email: str = "noreply@example.com"
     brevo_sender_name: str = "NavArt"
+    smtp_pool_size: int = 3  # reusable authenticated SMTP sessions per worker
 
     @computed_field
     @property
@@ -3,7 +3,9 @@
 # ===========================================================================
 # This module provides a vendor-agnostic interface for sending emails.
 #
-# CURRENT IMPLEMENTATION: BrevoSMTPEmailService (uses aiosmtplib)
+# CURRENT IMPLEMENTATION: BrevoEmailService (REST) with BrevoSMTPEmailService
+# (aiosmtplib) as fallback. Connections are long-lived and shared — see
+# core/email/transport.py.
 #
 # VENDOR SWAPPING:
 #   To use a different provider (SendGrid, Mailgun, AWS SES, Resend, etc.):
@@ -23,18 +25,26 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+import html
 import logging
+import re
 
-import aiosmtplib
-from app.core.config import settings
-
-import httpx
 import base64
 from app.core.config import settings
+from app.core.email.transport import get_http_client, get_smtp_pool
 
 logger = logging.getLogger(__name__)
 
+# Per-recipient placeholders in batch sends, e.g. "Hi {{ params.name }},"
+# (the same syntax Brevo's messageVersions use server-side).
+_PARAM_PATTERN = re.compile(r"\{\{\s*params\.(\w+)\s*\}\}")
+
+
+def apply_params(body_html: str, params: Dict[str, str]) -> str:
+    """Fill `{{ params.<key> }}` placeholders locally (HTML-escaped)."""
+    return _PARAM_PATTERN.sub(lambda m: html.escape(str(params.get(m.group(1), ""))), body_html)
+
 
 class BaseEmailService(ABC):
     """
@@ -55,6 +65,29 @@ class BaseEmailService(ABC):
     ) -> Optional[str]:
         ...
 
+    async def send_batch(
+        self,
+        subject: str,
+        body_html: str,
+        recipients: List[Tuple[str, Dict[str, str]]],
+        attachments: Optional[List[Tuple[str, bytes, str]]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Send one rendered template to many recipients.
+        `recipients` is a list of (email, params) used to fill
+        `{{ params.<key> }}` placeholders. Returns message ids aligned with
+        `recipients` (None for failures). Providers with a native batch API
+        override this; the default sends one message per recipient.
+        """
+        results: List[Optional[str]] = []
+        for to, params in recipients:
+            body = apply_params(body_html, params)
+            if attachments:
+                results.append(await self.send_email_with_attachments(to, subject, body, attachments))
+            else:
+                results.append(await self.send_email(to, subject, body))
+        return results
+
 
 class BrevoEmailService(BaseEmailService):
     """
@@ -82,48 +115,96 @@ class BrevoEmailService(BaseEmailService):
             logger.error("BREVO_API_KEY is not configured.")
             return None
 
-        # Prepare attachments for JSON (Base64)
-        json_attachments = []
-        for name, content, mime in (attachments or []):
-            json_attachments.append({
-                "name": name,
-                "content": base64.b64encode(content).decode("utf-8")
-            })
-
         payload = {
             "sender": {"name": self.sender_name, "email": self.sender_email},
             "to": [{"email": to}],
             "subject": subject,
             "htmlContent": body_html,
         }
+        json_attachments = self._encode_attachments(attachments)
         if json_attachments:
             payload["attachment"] = json_attachments
 
+        data = await self._post(payload, context=to)
+        if data is None:
+            return None
+        message_id = data.get("messageId")
+        logger.info(f"Email sent via REST to {to}. Subject: {subject}. ID: {message_id}")
+        return message_id
+
+    @staticmethod
+    def _encode_attachments(attachments: Optional[List[Tuple[str, bytes, str]]]) -> list:
+        """Prepare attachments for JSON (Base64)."""
+        return [
+            {"name": name, "content": base64.b64encode(content).decode("utf-8")}
+            for name, content, mime in (attachments or [])
+        ]
+
+    async def _post(self, payload: dict, context: str) -> Optional[dict]:
+        """POST a payload to the Brevo send endpoint. Returns parsed JSON or None."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "api-key": self.api_key,
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                    },
-                    json=payload,
-                )
-                
-                if response.status_code >= 400:
-                    logger.error(f"Brevo API Error: {response.status_code} - {response.text}")
-                    return None
-                
-                data = response.json()
-                message_id = data.get("messageId")
-                logger.info(f"Email sent via REST to {to}. Subject: {subject}. ID: {message_id}")
-                return message_id
+            response = await get_http_client().post(
+                self.api_url,
+                headers={
+                    "api-key": self.api_key,
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+                json=payload,
+            )
+
+            if response.status_code >= 400:
+                logger.error(f"Brevo API Error: {response.status_code} - {response.text}")
+                return None
+
+            return response.json()
 
         except Exception as e:
-            logger.exception(f"Unexpected error calling Brevo REST API for {to}: {e}")
+            logger.exception(f"Unexpected error calling Brevo REST API for {context}: {e}")
             return None
 
+    async def send_batch(
+        self,
+        subject: str,
+        body_html: str,
+        recipients: List[Tuple[str, Dict[str, str]]],
+        attachments: Optional[List[Tuple[str, bytes, str]]] = None,
+    ) -> List[Optional[str]]:
+        """
+        One Brevo request for the whole batch using `messageVersions`;
+        Brevo fills `{{ params.<key> }}` per version server-side.
+        """
+        if not recipients:
+            return []
+        if not self.api_key:
+            logger.error("BREVO_API_KEY is not configured.")
+            return [None] * len(recipients)
+
+        payload = {
+            "sender": {"name": self.sender_name, "email": self.sender_email},
+            "subject": subject,
+            "htmlContent": body_html,
+            "messageVersions": [
+                {"to": [{"email": to}], "params": params}
+                for to, params in recipients
+            ],
+        }
+        json_attachments = self._encode_attachments(attachments)
+        if json_attachments:
+            payload["attachment"] = json_attachments
+
+        data = await self._post(payload, context=f"batch of {len(recipients)}")
+        if data is None:
+            return [None] * len(recipients)
+
+        message_ids = data.get("messageIds") or []
+        if len(message_ids) != len(recipients):
+            # Brevo accepted the batch but did not return one id per version
+            fallback = data.get("messageId")
+            message_ids = list(message_ids) + [fallback] * (len(recipients) - len(message_ids))
+        logger.info(f"Batch email sent via REST to {len(recipients)} recipients. Subject: {subject}")
+        return message_ids
+
     async def send_email(self, to: str, subject: str, body_html: str) -> Optional[str]:
         return await self._send_via_api(to, subject, body_html)
 
@@ -175,23 +256,21 @@ class BrevoSMTPEmailService(BaseEmailService):
             message.attach(part)
         return message
 
-    async def send_email(self, to: str, subject: str, body_html: str) -> Optional[str]:
-        msg = self._build_message(to, subject, body_html)
+    async def _send(self, msg) -> Optional[str]:
+        # Pooled session: connect + STARTTLS + AUTH happen once, not per message
         try:
-            await aiosmtplib.send(msg, hostname=self.host, port=self.port, username=self.username, password=self.password, start_tls=True)
+            async with get_smtp_pool().connection() as smtp:
+                await smtp.send_message(msg)
             return msg["Message-ID"]
         except Exception as e:
             logger.error(f"SMTP Fallback failed: {e}")
             return None
 
+    async def send_email(self, to: str, subject: str, body_html: str) -> Optional[str]:
+        return await self._send(self._build_message(to, subject, body_html))
+
     async def send_email_with_attachments(self, to: str, subject: str, body_html: str, attachments=None) -> Optional[str]:
-        msg = self._build_message(to, subject, body_html, attachments)
-        try:
-            await aiosmtplib.send(msg, hostname=self.host, port=self.port, username=self.username, password=self.password, start_tls=True)
-            return msg["Message-ID"]
-        except Exception as e:
-            logger.error(f"SMTP Fallback failed: {e}")
-            return None
+        return await self._send(self._build_message(to, subject, body_html, attachments))
 
 
 # Factory
@@ -213,17 +292,17 @@ async def check_smtp_connection():
         return False
         
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                "https://api.brevo.com/v3/account",
-                headers={"api-key": settings.brevo_api_key}
-            )
-            if response.status_code == 200:
-                color_print("Brevo (REST): API Key Valid", GREEN)
-                return True
-            else:
-                color_print(f"Brevo (REST): API Key Invalid ({response.status_code})", RED)
-                return False
+        response = await get_http_client().get(
+            "https://api.brevo.com/v3/account",
+            headers={"api-key": settings.brevo_api_key},
+            timeout=5.0,
+        )
+        if response.status_code == 200:
+            color_print("Brevo (REST): API Key Valid", GREEN)
+            return True
+        else:
+            color_print(f"Brevo (REST): API Key Invalid ({response.status_code})", RED)
+            return False
     except Exception as e:
         color_print(f"Brevo (REST): Connection Failed - {e}", RED)
         return False
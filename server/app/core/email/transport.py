@@ -0,0 +1,177 @@
+# ===========================================================================
+# Email Transport Layer
+# ===========================================================================
+# Long-lived connections shared by every email sent from this process:
+#
+#   - get_http_client() → one keep-alive httpx.AsyncClient for REST providers
+#                         (HTTP/2 when the optional `h2` package is installed)
+#   - get_smtp_pool()   → a small pool of connected + authenticated SMTP
+#                         sessions, reused across messages and health-checked
+#                         with NOOP after sitting idle
+#
+# Both are created lazily on first use and closed from the app lifespan via
+# close_email_transport(), so an OTP, quote or invoice email costs one request
+# instead of a fresh TCP + TLS (+ STARTTLS + AUTH) handshake.
+#
+# Connections belong to the event loop that opened them, so the transports are
+# kept per running loop: a Celery task's `asyncio.run` gets its own set instead
+# of reusing one bound to a previous task's closed loop.
+# ===========================================================================
+
+import asyncio
+import importlib.util
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiosmtplib
+import httpx
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+# Idle SMTP sessions are NOOP-probed before reuse; relays drop idle clients
+SMTP_HEALTH_CHECK_AFTER = 30.0
+SMTP_TIMEOUT = 15.0
+
+class _PooledSMTP:
+    """An SMTP session plus the time it was last known to be healthy."""
+
+    def __init__(self, smtp: aiosmtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of authenticated SMTP sessions.
+
+    Usage:
+        async with get_smtp_pool().connection() as smtp:
+            await smtp.send_message(msg)
+    """
+
+    def __init__(self, size: int, start_tls: bool = True):
+        self._size = size
+        self._start_tls = start_tls
+        self._idle: list[_PooledSMTP] = []
+        self._slots = asyncio.Semaphore(size)
+        self._closed = False
+
+    async def _open(self) -> _PooledSMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.brevo_smtp_host,
+            port=settings.brevo_smtp_port,
+            username=settings.brevo_smtp_user or None,
+            password=settings.brevo_smtp_password or None,
+            start_tls=self._start_tls,
+            timeout=SMTP_TIMEOUT,
+        )
+        await smtp.connect()  # connect + STARTTLS + AUTH, once per session
+        return _PooledSMTP(smtp)
+
+    async def _is_healthy(self, conn: _PooledSMTP) -> bool:
+        if not conn.smtp.is_connected:
+            return False
+        if time.monotonic() - conn.last_used < SMTP_HEALTH_CHECK_AFTER:
+            return True
+        try:
+            await conn.smtp.noop()
+            return True
+        except Exception:
+            return False
+
+    async def _acquire(self) -> _PooledSMTP:
+        while self._idle:
+            conn = self._idle.pop()
+            if await self._is_healthy(conn):
+                return conn
+            _discard(conn)
+        return await self._open()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """Borrow a session; broken sessions are dropped instead of returned."""
+        async with self._slots:
+            conn = await self._acquire()
+            try:
+                yield conn.smtp
+            except Exception:
+                _discard(conn)
+                raise
+            conn.last_used = time.monotonic()
+            if self._closed:
+                await _quit(conn)
+            else:
+                self._idle.append(conn)
+
+    async def close(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(_quit(conn) for conn in idle), return_exceptions=True)
+
+
+def _discard(conn: _PooledSMTP) -> None:
+    try:
+        conn.smtp.close()
+    except Exception:
+        pass
+
+
+async def _quit(conn: _PooledSMTP) -> None:
+    try:
+        await asyncio.wait_for(conn.smtp.quit(), timeout=2.0)
+    except Exception:
+        _discard(conn)
+
+
+class _LoopTransports:
+    """The HTTP client and SMTP pool of one event loop."""
+
+    def __init__(self):
+        self.http: Optional[httpx.AsyncClient] = None
+        self.smtp = SMTPConnectionPool(size=settings.smtp_pool_size)
+
+
+# Dropped with their loop once it is garbage collected
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopTransports]" = weakref.WeakKeyDictionary()
+
+
+def _loop_transports() -> _LoopTransports:
+    loop = asyncio.get_running_loop()
+    transports = _transports.get(loop)
+    if transports is None:
+        transports = _transports[loop] = _LoopTransports()
+    return transports
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive HTTP client for email REST APIs."""
+    transports = _loop_transports()
+    if transports.http is None or transports.http.is_closed:
+        transports.http = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
+    return transports.http
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Pooled SMTP sessions for the running loop."""
+    return _loop_transports().smtp
+
+
+async def close_email_transport() -> None:
+    """Close the running loop's HTTP client and pooled SMTP sessions (app shutdown)."""
+    transports = _transports.pop(asyncio.get_running_loop(), None)
+    if transports is None:
+        return
+    if transports.http is not None:
+        await transports.http.aclose()
+    await transports.smtp.close()
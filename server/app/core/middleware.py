@@ -1,17 +1,18 @@
 import logging
 import time
 import uuid
+from collections import OrderedDict
+from typing import Optional
 
 from fastapi import Request, status
 from starlette.responses import JSONResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
-from app.core.redis import redis_client
 from app.core.config import settings
 from app.core.logging_config import correlation_id
 from jose import jwt, JWTError
-import asyncio
-from user_agents import parse
-from datetime import datetime, timezone
+from app.core.traffic import traffic_counter
+from app.core.presence import presence_buffer
+from app.core.rate_limiter import LocalPreCheck, SlidingWindowLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +79,20 @@ class RateLimitMiddleware:
     """
     Pure ASGI middleware for rate limiting.
     Unlike BaseHTTPMiddleware, this does NOT interfere with WebSocket upgrades.
+
+    Each check is one atomic Redis call (sliding window, see rate_limiter.py),
+    and clients well under the limit are answered from an in-process
+    pre-check between syncs. Works on the raw scope — no Request object.
     """
+    BYPASS_PATHS = frozenset({"/", "/ping", "/health", "/favicon.ico"})
+
     def __init__(self, app: ASGIApp, limit: int = None, window: int = None):
         self.app = app
         self.limit = limit or settings.rate_limit_requests
         self.window = window or settings.rate_limit_window_seconds
+        self.limiter = SlidingWindowLimiter(limit=self.limit, window=self.window, prefix="global_limit")
+        sync_interval = settings.rate_limit_local_sync_seconds
+        self.pre_check = LocalPreCheck(self.limiter, sync_interval) if sync_interval > 0 else None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # Only rate-limit HTTP requests, pass everything else through
@@ -90,37 +100,29 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope, receive)
-
         # Bypass health checks
-        if request.url.path in ["/", "/ping", "/health", "/favicon.ico"]:
+        if scope["path"] in self.BYPASS_PATHS:
             await self.app(scope, receive, send)
             return
 
-        client_ip = request.client.host if request.client else "unknown" 
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # Get Real IP (Behind Proxy)
         # forwarded = request.headers.get("X-Forwarded-For")
         # client_ip = forwarded.split(",")[0].strip() if forwarded else (request.client.host if request.client else "unknown")
 
-        key = f"global_limit:{client_ip}"
-
         try:
-            async with redis_client.pipeline(transaction=True) as pipe:
-                await pipe.incr(key)
-                await pipe.ttl(key)
-                result = await pipe.execute()
-
-            count, ttl = result
+            if self.pre_check is not None:
+                allowed, retry_after = await self.pre_check.hit(client_ip)
+            else:
+                allowed, _, retry_after = await self.limiter.hit(client_ip)
 
-            if ttl == -1:
-                await redis_client.expire(key, self.window)
-
-            if count > self.limit:
+            if not allowed:
                 response = JSONResponse(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     content={"detail": "System busy. Too many requests."},
-                    headers={"Retry-After": str(ttl)},
+                    headers={"Retry-After": str(retry_after)},
                 )
                 await response(scope, receive, send)
                 return
@@ -130,12 +132,41 @@ class RateLimitMiddleware:
         await self.app(scope, receive, send)
 
 
+# Decoded access token → (user_id, cache expiry); saves a JWT decode per request
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL = 60.0
+_token_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _user_id_from_token(token: str) -> Optional[str]:
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > now:
+        _token_cache.move_to_end(token)
+        return cached[0]
+
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except (JWTError, Exception):
+        _token_cache.pop(token, None)
+        return None
+
+    user_id = payload.get("id")
+    # Never cache past the token's own expiry
+    expires_at = min(now + TOKEN_CACHE_TTL, float(payload.get("exp") or now + TOKEN_CACHE_TTL))
+    _token_cache[token] = (user_id, expires_at)
+    _token_cache.move_to_end(token)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return user_id
+
+
 class UserActivityMiddleware:
     """
     Middleware to track user online status in Redis.
-    No database changes. Updates Redis TTL on every request.
+    No database changes. Activity is recorded in the in-process presence
+    buffer (at most once per user per interval) and flushed in batches.
     """
-    _background_tasks: set = set()
 
     def __init__(self, app: ASGIApp):
         self.app = app
@@ -152,13 +183,10 @@ class UserActivityMiddleware:
             await self.app(scope, receive, send)
             return
         
-        # Track Device Traffic
-        # TODO: closed it becuase of to many calls to the redis server (upstash)
-        # user_agent_string = request.headers.get("User-Agent", "")
-        # if user_agent_string:
-        #     task = asyncio.create_task(self.track_traffic(user_agent_string))
-        #     self._background_tasks.add(task)
-        #     task.add_done_callback(self._background_tasks.discard)
+        # Track Device Traffic (buffered in memory, flushed to Redis periodically)
+        user_agent_string = request.headers.get("User-Agent", "")
+        if user_agent_string:
+            traffic_counter.record(user_agent_string)
 
         # Try to extract user from token without blocking or DB calls
         auth_header = request.headers.get("Authorization")
@@ -170,43 +198,8 @@ class UserActivityMiddleware:
             token = request.cookies.get("access_token")
             
         if token:
-            try:
-                # Fast JWT decode without validation (secret check only)
-                payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-                user_id = payload.get("id")
-                if user_id:
-                    task = asyncio.create_task(self.mark_online(user_id))
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
-            except (JWTError, Exception):
-                pass
+            user_id = _user_id_from_token(token)
+            if user_id:
+                presence_buffer.touch(user_id)
         
         await self.app(scope, receive, send)
-
-    async def mark_online(self, user_id: str):
-        try:
-            # key: user_active:{user_id}, value skipping for simplicity, TTL 5 mins
-            # EX=300 is 5 minutes
-            await redis_client.set(f"user_active:{user_id}", "online", ex=300)
-        except Exception:
-            pass
-
-    # async def track_traffic(self, user_agent_string: str):
-    #     try:
-    #         user_agent = parse(user_agent_string)
-    #         device_type = "mobile"
-    #         if user_agent.is_tablet:
-    #             device_type = "tablet"
-    #         elif user_agent.is_pc or user_agent.is_bot: # classify bots as desktop for simplicity, or we could ignore them
-    #             device_type = "desktop"
-                
-    #         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    #         key = f"analytics:traffic:{today}"
-            
-    #         async with redis_client.pipeline(transaction=True) as pipe:
-    #             await pipe.zincrby(key, 1, device_type)
-    #             await pipe.expire(key, 86400 * 90)  # Keep for 90 days
-    #             await pipe.execute()
-    #     except Exception as e:
-    #         logger.error(f"Error tracking traffic: {e}")
-    #         pass
\ No newline at end of file
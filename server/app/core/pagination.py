@@ -0,0 +1,136 @@
+"""
+Keyset (cursor) pagination.
+
+List endpoints page with a row-value comparison on their sort key instead
+of OFFSET, so page N costs the same as page 1 — Postgres seeks straight
+into the matching composite index rather than walking and discarding the
+skipped rows:
+
+    WHERE (created_at, id) < (:created_at, :id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit + 1                       -- the extra row says "more follow"
+
+The trailing `id` makes the key unique (ids are uuidv7 or serial, so they
+follow creation order anyway). Cursors are opaque url-safe strings carrying
+the direction and the key of the boundary row; routes return them in the
+X-Next-Cursor / X-Prev-Cursor headers:
+
+    page = await paginate(db, stmt, keys=(Order.created_at, Order.id), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
+"""
+
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+NEXT = "n"
+PREV = "p"
+
+CURSOR_DESCRIPTION = "Opaque cursor from a previous page's X-Next-Cursor / X-Prev-Cursor header"
+
+
+@dataclass
+class KeysetPage:
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _from_json(key, value: Any) -> Any:
+    python_type = key.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(direction: str, values: Sequence[Any]) -> str:
+    raw = json.dumps([direction, *(_to_json(v) for v in values)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence) -> tuple:
+    """(direction, key values); 400 for anything this module didn't produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        direction, *values = json.loads(raw)
+        if direction not in (NEXT, PREV) or len(values) != len(keys):
+            raise ValueError(cursor)
+        return direction, tuple(_from_json(key, value) for key, value in zip(keys, values))
+    except (ValueError, TypeError, AttributeError, NotImplementedError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _key_of(item: Any, keys: Sequence) -> List[Any]:
+    return [getattr(item, key.key) for key in keys]
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    keys: Sequence,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+    scalars: bool = True,
+) -> KeysetPage:
+    """
+    Run one page of `stmt` ordered by `keys` (all in the same direction).
+    `stmt` must not be ordered or limited already; filters are fine.
+    """
+    direction, values = decode_cursor(cursor, keys) if cursor else (NEXT, None)
+    # Walking backwards is the same seek with the order flipped
+    forward = direction == NEXT
+    seek_descending = descending == forward
+
+    if values is not None:
+        bound = tuple_(*(literal(value, key.type) for key, value in zip(keys, values)))
+        boundary = tuple_(*keys) < bound if seek_descending else tuple_(*keys) > bound
+        stmt = stmt.where(boundary)
+    stmt = stmt.order_by(*(key.desc() if seek_descending else key.asc() for key in keys)).limit(limit + 1)
+
+    result = await db.execute(stmt)
+    items = list(result.scalars().all() if scalars else result.all())
+    has_more = len(items) > limit
+    items = items[:limit]
+    if not forward:
+        items.reverse()
+
+    page = KeysetPage(items=items)
+    if not items:
+        return page
+    # Forward: more rows ahead if the look-ahead row came back; a cursor means rows behind.
+    # Backward: the same, mirrored.
+    more_ahead, more_behind = (has_more, values is not None) if forward else (True, has_more)
+    if more_ahead:
+        page.next_cursor = encode_cursor(NEXT, _key_of(items[-1], keys))
+    if more_behind:
+        page.prev_cursor = encode_cursor(PREV, _key_of(items[0], keys))
+    return page
+
+
+def with_cursor_headers(response: Response, page: KeysetPage) -> List[Any]:
+    """Expose the page's cursors as response headers and return its items."""
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.prev_cursor:
+        response.headers["X-Prev-Cursor"] = page.prev_cursor
+    return page.items
@@ -6,21 +6,39 @@ Usage:
     provider = get_payment_provider()
 """
 
-from app.core.payment.base import PaymentProvider
+from typing import Optional
+
+from app.core.payment.base import PaymentProvider, PaymentGatewayError
 from app.core.payment.razorpay_provider import RazorpayProvider
 from app.core.config import settings
 
+# One provider per process so its HTTP connection pool is reused across requests
+_provider: Optional[PaymentProvider] = None
+
 
 def get_payment_provider() -> PaymentProvider:
     """
     Factory that returns the active payment provider.
     Switch providers by changing this function — no route/model changes needed.
     """
+    global _provider
+    if _provider is not None:
+        return _provider
+
     if not settings.razorpay_key_id or settings.razorpay_key_id == "mock_key":
         from app.core.payment.mock_provider import MockProvider
-        return MockProvider()
+        _provider = MockProvider(latency=settings.mock_payment_latency_ms / 1000)
+    else:
+        _provider = RazorpayProvider(
+            key_id=settings.razorpay_key_id,
+            key_secret=settings.razorpay_key_secret,
+        )
+    return _provider
+
 
-    return RazorpayProvider(
-        key_id=settings.razorpay_key_id,
-        key_secret=settings.razorpay_key_secret,
-    )
+async def close_payment_provider() -> None:
+    """Close the cached provider's pooled connections (app shutdown)."""
+    global _provider
+    if _provider is not None:
+        await _provider.aclose()
+        _provider = None
@@ -4,6 +4,9 @@ Abstract payment provider interface.
 Any payment gateway (Razorpay, Stripe, PayU, etc.) must implement this
 interface. Routes and services depend ONLY on this abstraction, so
 swapping providers requires zero changes outside this package.
+
+Network calls (`create_order`) are async so they never block the event
+loop; signature checks are local HMAC computations and stay synchronous.
 """
 
 from abc import ABC, abstractmethod
@@ -22,11 +25,19 @@ class PaymentOrderResult:
     extra: Optional[dict] = None   # provider-specific extras
 
 
+class PaymentGatewayError(Exception):
+    """Raised when the gateway rejects a request or cannot be reached."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class PaymentProvider(ABC):
     """Contract that every payment gateway adapter must fulfil."""
 
     @abstractmethod
-    def create_order(
+    async def create_order(
         self,
         amount_paise: int,
         currency: str = "INR",
@@ -36,6 +47,7 @@ class PaymentProvider(ABC):
         """
         Create an order/session on the payment gateway.
         `amount_paise` is in the smallest currency unit (e.g. paise for INR).
+        Raises PaymentGatewayError on failure.
         """
         ...
 
@@ -64,3 +76,7 @@ class PaymentProvider(ABC):
         Returns True if the signature is valid.
         """
         ...
+
+    async def aclose(self) -> None:
+        """Release pooled connections. Called once on application shutdown."""
+        return None
@@ -2,6 +2,7 @@
 Mock implementation of PaymentProvider for local testing without API keys.
 """
 
+import asyncio
 import uuid
 from typing import Optional
 
@@ -9,15 +10,23 @@ from app.core.payment.base import PaymentProvider, PaymentOrderResult
 
 
 class MockProvider(PaymentProvider):
-    """Mock adapter that simulates payment gateway."""
+    """
+    Mock adapter that simulates payment gateway.
+    `latency` (seconds) simulates the gateway round-trip for load testing.
+    """
 
-    def create_order(
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    async def create_order(
         self,
         amount_paise: int,
         currency: str = "INR",
         receipt: str = "",
         notes: Optional[dict] = None,
     ) -> PaymentOrderResult:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
         gw_order_id = f"order_{uuid.uuid4().hex[:14]}"
         return PaymentOrderResult(
             gateway_order_id=gw_order_id,
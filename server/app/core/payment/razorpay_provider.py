@@ -1,11 +1,35 @@
 """
 Razorpay implementation of PaymentProvider.
+
+Orders are created through Razorpay's REST API on a shared keep-alive
+`httpx.AsyncClient`; the official SDK is only used for local signature
+verification.
 """
 
+import asyncio
+import logging
+import httpx
 import razorpay
 from typing import Optional
 
-from app.core.payment.base import PaymentProvider, PaymentOrderResult
+from app.core.payment.base import PaymentProvider, PaymentOrderResult, PaymentGatewayError
+
+logger = logging.getLogger(__name__)
+
+RAZORPAY_API_BASE = "https://api.razorpay.com/v1"
+
+# Gateway round-trips are bounded so a slow Razorpay never pins a request
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+# Bounded retries, only for failures where Razorpay cannot have acted on the
+# request: it never got it (connect / pool errors) or rejected it unprocessed
+# (429). A read timeout or 5xx may already have created the order, so those
+# are surfaced instead of risking a duplicate.
+MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.5
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+RETRYABLE_STATUS = {429}
 
 
 class RazorpayProvider(PaymentProvider):
@@ -13,9 +37,15 @@ class RazorpayProvider(PaymentProvider):
 
     def __init__(self, key_id: str, key_secret: str):
         self._client = razorpay.Client(auth=(key_id, key_secret))
+        self._http = httpx.AsyncClient(
+            base_url=RAZORPAY_API_BASE,
+            auth=(key_id, key_secret),
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
 
     # ── create_order ──────────────────────────────────────────────
-    def create_order(
+    async def create_order(
         self,
         amount_paise: int,
         currency: str = "INR",
@@ -30,7 +60,7 @@ class RazorpayProvider(PaymentProvider):
         if notes:
             payload["notes"] = notes
 
-        rz_order = self._client.order.create(data=payload)
+        rz_order = await self._post("/orders", payload)
 
         return PaymentOrderResult(
             gateway_order_id=rz_order["id"],
@@ -41,6 +71,44 @@ class RazorpayProvider(PaymentProvider):
             extra=rz_order,
         )
 
+    async def _post(self, path: str, payload: dict) -> dict:
+        """POST, retrying only requests Razorpay never processed. Raises PaymentGatewayError."""
+        last_error: Optional[PaymentGatewayError] = None
+
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+            try:
+                response = await self._http.post(path, json=payload)
+            except RETRYABLE_ERRORS as e:
+                last_error = PaymentGatewayError(f"{type(e).__name__}: {e}")
+                logger.warning(f"Razorpay POST {path} attempt {attempt + 1} failed: {last_error}")
+                continue
+            except httpx.TransportError as e:
+                # Sent but unanswered: the order may exist, so don't repeat it
+                raise PaymentGatewayError(f"{type(e).__name__}: {e}")
+
+            if response.status_code in RETRYABLE_STATUS:
+                last_error = PaymentGatewayError(
+                    f"Razorpay returned {response.status_code}", status_code=response.status_code
+                )
+                logger.warning(f"Razorpay POST {path} attempt {attempt + 1} failed: {last_error}")
+                continue
+
+            if response.status_code >= 400:
+                try:
+                    description = response.json().get("error", {}).get("description")
+                except ValueError:
+                    description = None
+                raise PaymentGatewayError(
+                    description or f"Razorpay returned {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+            return response.json()
+
+        raise last_error
+
     # ── verify_payment ────────────────────────────────────────────
     def verify_payment(
         self,
@@ -66,3 +134,7 @@ class RazorpayProvider(PaymentProvider):
             return True
         except razorpay.errors.SignatureVerificationError:
             return False
+
+    # ── aclose ────────────────────────────────────────────────────
+    async def aclose(self) -> None:
+        await self._http.aclose()
@@ -0,0 +1,158 @@
+"""
+Online presence.
+
+Presence lives in two Redis sorted sets (member = user id, score = last
+seen, epoch seconds):
+
+    active_users   — SSE/WS heartbeats (every ~25s while a stream is open)
+    presence:http  — authenticated HTTP requests
+
+A user is online if either set has a score inside its window. Every read
+is one pipelined round-trip, however many users are involved:
+
+    online_user_ids()      → all online ids (trims stale entries first)
+    online_flags(ids)      → {id: bool} for one page of users (ZMSCORE)
+
+This replaces the per-user `user_active:{id}` keys, which needed a GET
+per listed user and a keyspace SCAN to count.
+
+HTTP activity is written through `presence_buffer`: each user is recorded at
+most once per `presence_write_interval_seconds`, and pending marks are
+flushed on a timer as one ZADD, so Redis writes scale with distinct active
+users instead of request count.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+SSE_PRESENCE_KEY = "active_users"
+HTTP_PRESENCE_KEY = "presence:http"
+
+SSE_ONLINE_WINDOW = 35      # seconds since the last stream heartbeat
+HTTP_ONLINE_WINDOW = 300    # seconds since the last authenticated request
+
+
+async def heartbeat(user_id: str) -> None:
+    """Record an SSE/WS heartbeat."""
+    now = time.time()
+    async with redis_client.pipeline(transaction=False) as pipe:
+        await pipe.zadd(SSE_PRESENCE_KEY, {str(user_id): now})
+        await pipe.zremrangebyscore(SSE_PRESENCE_KEY, "-inf", now - SSE_ONLINE_WINDOW)
+        await pipe.execute()
+
+
+async def mark_seen(seen: Dict[str, float]) -> None:
+    """Record HTTP activity ({user_id: last seen}) with one ZADD + trim, pipelined."""
+    if not seen:
+        return
+    async with redis_client.pipeline(transaction=False) as pipe:
+        await pipe.zadd(HTTP_PRESENCE_KEY, seen)
+        await pipe.zremrangebyscore(HTTP_PRESENCE_KEY, "-inf", time.time() - HTTP_ONLINE_WINDOW)
+        await pipe.execute()
+
+
+async def mark_online(user_ids: Iterable[str], seen_at: Optional[float] = None) -> None:
+    """Record HTTP activity for one or more users right away."""
+    seen_at = seen_at or time.time()
+    await mark_seen({str(uid): seen_at for uid in user_ids})
+
+
+class PresenceBuffer:
+    """Throttles and batches HTTP presence writes for this process."""
+
+    def __init__(self, write_interval: float, flush_interval: float):
+        self.write_interval = write_interval
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, float] = {}
+        self._last_written: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def touch(self, user_id: str) -> None:
+        """Note that a user made a request. Never touches the network."""
+        now = time.time()
+        user_id = str(user_id)
+        if now - self._last_written.get(user_id, 0.0) < self.write_interval:
+            return
+        self._last_written[user_id] = now
+        self._pending[user_id] = now
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        now = time.time()
+        # Forget throttle entries that have run out so the map stays small
+        self._last_written = {
+            uid: ts for uid, ts in self._last_written.items() if now - ts < self.write_interval
+        }
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            await mark_seen(pending)
+        except Exception as e:
+            logger.warning(f"Presence flush failed for {len(pending)} users: {e}")
+            for uid, ts in pending.items():
+                self._pending.setdefault(uid, ts)
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out pending marks."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        await self.flush()
+
+
+presence_buffer = PresenceBuffer(
+    write_interval=settings.presence_write_interval_seconds,
+    flush_interval=settings.presence_flush_interval_seconds,
+)
+
+
+async def online_user_ids() -> Set[str]:
+    """Ids of every online user. Stale members are trimmed in the same round-trip."""
+    now = time.time()
+    async with redis_client.pipeline(transaction=False) as pipe:
+        await pipe.zremrangebyscore(SSE_PRESENCE_KEY, "-inf", now - SSE_ONLINE_WINDOW)
+        await pipe.zremrangebyscore(HTTP_PRESENCE_KEY, "-inf", now - HTTP_ONLINE_WINDOW)
+        await pipe.zrange(SSE_PRESENCE_KEY, 0, -1)
+        await pipe.zrange(HTTP_PRESENCE_KEY, 0, -1)
+        _, _, sse_ids, http_ids = await pipe.execute()
+    return set(sse_ids) | set(http_ids)
+
+
+async def online_flags(user_ids: Iterable) -> Dict[str, bool]:
+    """Online status for a page of users: two ZMSCOREs in one round-trip."""
+    ids: List[str] = [str(uid) for uid in user_ids]
+    if not ids:
+        return {}
+
+    now = time.time()
+    async with redis_client.pipeline(transaction=False) as pipe:
+        await pipe.zmscore(SSE_PRESENCE_KEY, ids)
+        await pipe.zmscore(HTTP_PRESENCE_KEY, ids)
+        sse_scores, http_scores = await pipe.execute()
+
+    return {
+        uid: bool(
+            (sse and float(sse) >= now - SSE_ONLINE_WINDOW)
+            or (http and float(http) >= now - HTTP_ONLINE_WINDOW)
+        )
+        for uid, sse, http in zip(ids, sse_scores, http_scores)
+    }
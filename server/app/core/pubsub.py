@@ -0,0 +1,253 @@
+# ===========================================================================
+# Redis Pub/Sub Hub (per-process fan-out)
+# ===========================================================================
+# One dedicated Redis connection per worker process carries every Pub/Sub
+# subscription the process needs. Local listeners register an asyncio.Queue
+# for a channel; the hub subscribes to the channel when the first listener
+# appears, unsubscribes when the last one leaves, and routes each incoming
+# message into the queues of that channel's listeners.
+#
+# Redis connections and wakeups therefore scale with the number of workers,
+# not with the number of open EventSource / WebSocket clients.
+#
+# Pattern listeners (PSUBSCRIBE) work the same way, but their queues receive
+# (channel, payload) tuples so the listener knows which channel matched.
+#
+# Usage:
+#   from app.core.pubsub import pubsub_hub
+#   queue = await pubsub_hub.subscribe("sse:user:123")
+#   await pubsub_hub.subscribe("sse:broadcast", queue)   # same queue, second channel
+#   try:
+#       message = await queue.get()        # raw payload string, or None on shutdown
+#   finally:
+#       await pubsub_hub.unsubscribe("sse:user:123", queue)
+#       await pubsub_hub.unsubscribe("sse:broadcast", queue)
+#
+#   queue = await pubsub_hub.psubscribe("ws:inquiry:*")
+#   channel, message = await queue.get()   # or None on shutdown
+# ===========================================================================
+
+import asyncio
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+from app.core.redis import create_dedicated_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Per-listener buffer. A client that falls this far behind starts losing its
+# oldest messages instead of growing memory without bound.
+LISTENER_QUEUE_SIZE = 256
+
+
+class PubSubHub:
+    """
+    Multiplexes many local listeners over a single Redis Pub/Sub connection.
+
+    - subscribe()    → register a queue for a channel (SUBSCRIBE on first listener)
+    - unsubscribe()  → drop a queue (UNSUBSCRIBE after the last listener leaves)
+    - psubscribe()   → register a queue for a glob pattern (PSUBSCRIBE)
+    - punsubscribe() → drop a pattern queue (PUNSUBSCRIBE after the last one)
+    - shutdown()     → stop the reader and wake every listener with ``None``
+    """
+
+    def __init__(self):
+        self._listeners: dict[str, set[asyncio.Queue]] = {}
+        self._pattern_listeners: dict[str, set[asyncio.Queue]] = {}
+        self._sub_redis: Optional[redis.Redis] = None
+        self._pubsub = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._shutdown_event = asyncio.Event()
+
+    # ── Listener registration ──────────────────────────────────
+
+    async def subscribe(self, channel: str, queue: Optional[asyncio.Queue] = None) -> asyncio.Queue:
+        """
+        Register a local listener on `channel` and return its queue.
+        Pass an existing `queue` to merge several channels into one listener.
+        """
+        if queue is None:
+            queue = asyncio.Queue(maxsize=LISTENER_QUEUE_SIZE)
+        async with self._lock:
+            listeners = self._listeners.get(channel)
+            if listeners is None:
+                listeners = self._listeners[channel] = set()
+                await self._ensure_connected()
+                await self._pubsub.subscribe(channel)
+                logger.info(f"PubSubHub subscribe → {channel}")
+            listeners.add(queue)
+            self._ensure_reader()
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        """Remove a listener; the Redis subscription is dropped with the last one."""
+        async with self._lock:
+            listeners = self._listeners.get(channel)
+            if listeners is None:
+                return
+            listeners.discard(queue)
+            if listeners:
+                return
+            del self._listeners[channel]
+            if self._pubsub is not None:
+                try:
+                    await asyncio.wait_for(self._pubsub.unsubscribe(channel), timeout=0.5)
+                    logger.info(f"PubSubHub unsubscribe → {channel}")
+                except Exception as e:
+                    logger.error(f"PubSubHub unsubscribe failed for {channel}: {e}")
+
+    async def psubscribe(self, pattern: str, maxsize: int = LISTENER_QUEUE_SIZE) -> asyncio.Queue:
+        """Register a local listener on a glob `pattern`; items are (channel, payload)."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        async with self._lock:
+            listeners = self._pattern_listeners.get(pattern)
+            if listeners is None:
+                listeners = self._pattern_listeners[pattern] = set()
+                await self._ensure_connected()
+                await self._pubsub.psubscribe(pattern)
+                logger.info(f"PubSubHub psubscribe → {pattern}")
+            listeners.add(queue)
+            self._ensure_reader()
+        return queue
+
+    async def punsubscribe(self, pattern: str, queue: asyncio.Queue) -> None:
+        """Remove a pattern listener; PUNSUBSCRIBE runs with the last one."""
+        async with self._lock:
+            listeners = self._pattern_listeners.get(pattern)
+            if listeners is None:
+                return
+            listeners.discard(queue)
+            if listeners:
+                return
+            del self._pattern_listeners[pattern]
+            if self._pubsub is not None:
+                try:
+                    await asyncio.wait_for(self._pubsub.punsubscribe(pattern), timeout=0.5)
+                    logger.info(f"PubSubHub punsubscribe → {pattern}")
+                except Exception as e:
+                    logger.error(f"PubSubHub punsubscribe failed for {pattern}: {e}")
+
+    def listener_count(self, channel: Optional[str] = None) -> int:
+        """Number of local listeners, for one channel or across all channels."""
+        if channel is not None:
+            return len(self._listeners.get(channel, ()))
+        return sum(len(listeners) for listeners in self._listeners.values())
+
+    # ── Reader ─────────────────────────────────────────────────
+
+    async def _ensure_connected(self) -> None:
+        if self._pubsub is None:
+            self._sub_redis = create_dedicated_redis_client()
+            self._pubsub = self._sub_redis.pubsub(ignore_subscribe_messages=True)
+
+    def _ensure_reader(self) -> None:
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        retry_delay = 1
+
+        while not self._shutdown_event.is_set():
+            try:
+                async with self._lock:
+                    if not self._listeners and not self._pattern_listeners:
+                        return
+                    await self._ensure_connected()
+                    pubsub = self._pubsub
+
+                # Blocks until Redis pushes something — no polling interval.
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                retry_delay = 1
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                logger.error(f"PubSubHub read error: {e}")
+                await self._reset_connection()
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=retry_delay)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+                retry_delay = min(retry_delay * 2, 30)
+                continue
+
+            if not message:
+                continue
+            if message["type"] == "message":
+                for queue in list(self._listeners.get(message["channel"], ())):
+                    _put_latest(queue, message["data"])
+            elif message["type"] == "pmessage":
+                item = (message["channel"], message["data"])
+                for queue in list(self._pattern_listeners.get(message["pattern"], ())):
+                    _put_latest(queue, item)
+
+    async def _reset_connection(self) -> None:
+        """Drop a broken connection and re-subscribe every channel with listeners."""
+        async with self._lock:
+            await self._close_connection()
+            if self._shutdown_event.is_set():
+                return
+            if not self._listeners and not self._pattern_listeners:
+                return
+            try:
+                await self._ensure_connected()
+                if self._listeners:
+                    await self._pubsub.subscribe(*self._listeners.keys())
+                if self._pattern_listeners:
+                    await self._pubsub.psubscribe(*self._pattern_listeners.keys())
+            except Exception as e:
+                logger.error(f"PubSubHub resubscribe failed: {e}")
+                await self._close_connection()
+
+    async def _close_connection(self) -> None:
+        pubsub, sub_redis = self._pubsub, self._sub_redis
+        self._pubsub = None
+        self._sub_redis = None
+        for coro in [
+            pubsub.aclose() if pubsub is not None else None,
+            sub_redis.aclose() if sub_redis is not None else None,
+        ]:
+            if coro is None:
+                continue
+            try:
+                await asyncio.wait_for(coro, timeout=0.5)
+            except Exception as e:
+                logger.error(f"Error closing PubSubHub connection: {e}")
+
+    # ── Cleanup ────────────────────────────────────────────────
+
+    async def shutdown(self) -> None:
+        """Stop the reader, close the connection and release every listener."""
+        self._shutdown_event.set()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await asyncio.wait([self._reader_task], timeout=1.0)
+            except Exception:
+                pass
+            self._reader_task = None
+
+        for registry in (self._listeners, self._pattern_listeners):
+            for listeners in list(registry.values()):
+                for queue in list(listeners):
+                    _put_latest(queue, None)
+            registry.clear()
+        await self._close_connection()
+
+
+def _put_latest(queue: asyncio.Queue, item) -> None:
+    """Enqueue without blocking, discarding the oldest item when the queue is full."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        queue.put_nowait(item)
+
+
+# Singleton
+pubsub_hub = PubSubHub()
@@ -1,43 +1,132 @@
+"""
+Rate limiting.
+
+All limits are sliding windows (the current fixed window plus a weighted
+share of the previous one) evaluated by a Lua script, so each check is ONE
+atomic Redis call: no MULTI, no follow-up EXPIRE.
+
+  - SlidingWindowLimiter  — the Redis-backed limiter
+  - LocalPreCheck         — optional in-process front for hot paths: while a
+                            client is well under its limit, requests are
+                            allowed locally and their count is synced to
+                            Redis with the next check after `sync_interval`
+  - RateLimiter           — per-route FastAPI dependency (auth/OTP routes)
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Tuple
+
 from fastapi import HTTPException, Request, Depends, status
-from app.core.redis import get_redis
+from app.core.redis import get_redis, redis_client
 import redis.asyncio as redis
 
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = current window, KEYS[2] = previous window
+# ARGV[1] = key TTL (2 windows), ARGV[2] = hits to add
+_SLIDING_WINDOW_LUA = """
+local current = redis.call('INCRBY', KEYS[1], ARGV[2])
+if current == tonumber(ARGV[2]) then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+local previous = redis.call('GET', KEYS[2])
+return {current, previous or 0}
+"""
+
+_sliding_window_script = redis_client.register_script(_SLIDING_WINDOW_LUA)
+
+
+class SlidingWindowLimiter:
+    def __init__(self, limit: int, window: int, prefix: str):
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+
+    async def hit(self, identity: str, cost: int = 1, client: redis.Redis = None) -> Tuple[bool, float, int]:
+        """
+        Count `cost` hits for `identity`.
+        Returns (allowed, estimated hits in the sliding window, retry-after seconds).
+        """
+        now = time.time()
+        index = int(now // self.window)
+        elapsed = now - index * self.window
+        # Hash tag keeps both windows in one cluster slot
+        base = f"{self.prefix}:{{{identity}}}"
+
+        current, previous = await _sliding_window_script(
+            keys=[f"{base}:{index}", f"{base}:{index - 1}"],
+            args=[self.window * 2, cost],
+            client=client or redis_client,
+        )
+        estimate = int(previous) * (self.window - elapsed) / self.window + int(current)
+        retry_after = max(1, math.ceil(self.window - elapsed))
+        return estimate <= self.limit, estimate, retry_after
+
+
+class LocalPreCheck:
+    """
+    In-process budget in front of a SlidingWindowLimiter.
+
+    After a Redis check, a client whose estimate (plus hits since) stays
+    under `headroom` × limit is allowed locally until `sync_interval`
+    passes; the locally counted hits are then sent with the next Redis
+    check. Across W workers a client can overshoot by at most
+    W × headroom × limit within one sync interval.
+    """
+
+    def __init__(self, limiter: SlidingWindowLimiter, sync_interval: float,
+                 headroom: float = 0.5, max_clients: int = 10_000):
+        self.limiter = limiter
+        self.sync_interval = sync_interval
+        self.budget = limiter.limit * headroom
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[str, list]" = OrderedDict()  # identity → [estimate, unsynced hits, synced_at]
+
+    async def hit(self, identity: str) -> Tuple[bool, int]:
+        """Returns (allowed, retry-after seconds)."""
+        now = time.monotonic()
+        state = self._clients.get(identity)
+        if state is not None and now - state[2] < self.sync_interval and state[0] + state[1] + 1 <= self.budget:
+            state[1] += 1
+            self._clients.move_to_end(identity)
+            return True, 0
+
+        cost = (state[1] if state else 0) + 1
+        allowed, estimate, retry_after = await self.limiter.hit(identity, cost)
+        self._clients[identity] = [estimate, 0, now]
+        self._clients.move_to_end(identity)
+        if len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return allowed, retry_after
+
+
 class RateLimiter:
     def __init__(self, times: int, seconds: int):
         self.times = times
         self.seconds = seconds
+        self._limiter = SlidingWindowLimiter(limit=times, window=seconds, prefix="rate_limit")
 
     async def __call__(self, request: Request, client: redis.Redis = Depends(get_redis)):
         # 1. Identify User (IP based)
         client_ip = request.client.host if request.client else "127.0.0.1"
-        
-        # 2. Create Unique Key for this Route
-        # Key looks like: "rate_limit:127.0.0.1:/auth/login"
-        key = f"rate_limit:{client_ip}:{request.url.path}"
+
+        # 2. Key per client and route, e.g. "rate_limit:{127.0.0.1:/auth/login}:<window>"
+        identity = f"{client_ip}:{request.url.path}"
 
         try:
-            # 3. Increment & Check
-            async with client.pipeline(transaction=True) as pipe:
-                await pipe.incr(key)
-                await pipe.ttl(key)
-                result = await pipe.execute()
-                
-            count = result[0]
-            ttl = result[1]
-
-            # 4. Set expiration if it's the first request
-            if count == 1:
-                await client.expire(key, self.seconds)
-            
-            # 5. Block if limit exceeded
-            if count > self.times:
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail=f"Too many requests. Try again in {ttl if ttl > 0 else self.seconds} seconds."
-                )
-                
+            # 3. Increment & check in one atomic call
+            allowed, _, retry_after = await self._limiter.hit(identity, client=client)
         except Exception as e:
-            if isinstance(e, HTTPException):
-                raise e
-            print(f"Redis Error: {e}")
-            # Fail Open: Allow request if Redis breaks, don't crash the server
\ No newline at end of file
+            # Fail Open: Allow request if Redis breaks, don't crash the server
+            logger.error(f"Rate limiter Redis error: {e}")
+            return
+
+        # 4. Block if limit exceeded
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many requests. Try again in {retry_after} seconds."
+            )
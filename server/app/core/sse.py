@@ -1,28 +1,31 @@
 # ===========================================================================
 # Server-Sent Events (SSE) Manager
 # ===========================================================================
-# Uses Redis Pub/Sub to broadcast events to connected SSE clients.
+# Uses Redis Pub/Sub to broadcast events to connected SSE clients. All
+# subscribers in a worker share one Pub/Sub connection via `pubsub_hub`.
 #
 # Channels:
 #   sse:user:{user_id}  — per-user events (order updates, payment confirmations)
 #   sse:admin            — all-admin events (new orders, payments received)
+#   sse:broadcast        — events for every user stream (bulk notifications)
 #
 # Usage:
 #   from app.core.sse import sse_manager
 #   await sse_manager.publish(user_id, "order_status_changed", {"order_id": "...", "status": "PAID"})
 #   await sse_manager.publish_to_admins("payment_received", {...})
+#   await sse_manager.publish_broadcast("broadcast", {...})
 # ===========================================================================
 
 import asyncio
 import json
 import logging
-import time
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Awaitable, Callable, Optional, Sequence
 from uuid import UUID
 from fastapi import Request
 
-import redis.asyncio as redis
-from app.core.redis import create_dedicated_redis_client, redis_client
+from app.core import presence
+from app.core.pubsub import pubsub_hub
+from app.core.redis import redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,10 @@ def _user_channel(user_id: str | UUID) -> str:
 
 
 ADMIN_CHANNEL = "sse:admin"
+BROADCAST_CHANNEL = "sse:broadcast"
+
+# Seconds of silence before a keepalive comment is sent to the client.
+KEEPALIVE_INTERVAL = 25
 
 
 class SSEManager:
@@ -40,6 +47,7 @@ class SSEManager:
 
     - publish()           → push an event to a specific user's channel
     - publish_to_admins() → push an event to the admin channel
+    - publish_broadcast() → push one event to every user stream
     - subscribe()         → async generator that yields SSE-formatted strings
     """
 
@@ -73,6 +81,18 @@ class SSEManager:
         except Exception as e:
             logger.error(f"SSE publish failed for {ADMIN_CHANNEL}: {e}")
 
+    async def publish_broadcast(
+        self,
+        event_type: str,
+        data: dict,
+    ) -> None:
+        """Send one event to every connected user SSE client."""
+        try:
+            payload = json.dumps({"event": event_type, "data": data})
+            await redis_client.publish(BROADCAST_CHANNEL, payload)
+        except Exception as e:
+            logger.error(f"SSE publish failed for {BROADCAST_CHANNEL}: {e}")
+
     # ── Subscribing ────────────────────────────────────────────
 
     async def subscribe(
@@ -82,121 +102,85 @@ class SSEManager:
     ) -> AsyncGenerator[str, None]:
         """
         Async generator that yields SSE-formatted event strings.
-        Each subscriber gets its own dedicated Redis connection to avoid
-        contention under load.
+        Subscribers share the process-wide Pub/Sub hub connection; each one
+        only owns a small in-memory queue, fed by the user's channel and the
+        broadcast channel.
         """
-        channel = _user_channel(user_id) # Each subscriber gets a DEDICATED Redis connection for its pubsub
-        sub_redis = create_dedicated_redis_client()
-        pubsub = sub_redis.pubsub()
-
-        try:
-            await pubsub.subscribe(channel)
-            logger.info(f"SSE subscribe → {channel}")
-
-            yield _format_sse("connected", {"message": "SSE stream connected"})
-            last_keepalive = time.monotonic()
-
-            while not self._shutdown_event.is_set():
-                if await request.is_disconnected():
-                    logger.info(f"SSE HTTP disconnect detected for {channel}")
-                    break
-
-                try:
-                    message = await asyncio.wait_for(
-                        pubsub.get_message(ignore_subscribe_messages=True, timeout=0.05),
-                        timeout=0.2,
-                    )
-                except asyncio.TimeoutError:
-                    message = None
-                except asyncio.CancelledError:
-                    logger.info(f"SSE HTTP disconnect detected for {channel}")
-                    return
-                except Exception as e:
-                    logger.error(f"SSE pubsub read error on {channel}: {e}")
-                    await asyncio.sleep(0.1)
-                    continue 
-
-                if message and message["type"] == "message":
-                    try:
-                        parsed = json.loads(message["data"])
-                        yield _format_sse(parsed["event"], parsed["data"])
-                    except (json.JSONDecodeError, KeyError):
-                        yield _format_sse("raw", {"message": str(message["data"])})
-                else:
-                    now = time.monotonic()
-                    if now - last_keepalive >= 25:
-                        yield ": keepalive\n\n"
-                        last_keepalive = now
-                        # Heartbeat for active user tracking
-                        try:
-                            current_ts = time.time()
-                            await redis_client.zadd("active_users", {str(user_id): current_ts})
-                            # BUG-016 FIX: Prune users inactive for >5 minutes
-                            stale_cutoff = current_ts - 300
-                            await redis_client.zremrangebyscore("active_users", "-inf", stale_cutoff)
-                        except Exception:
-                            pass
-
-        except asyncio.CancelledError:
-            logger.info(f"SSE subcriber cancelled : {channel}")
-        except Exception as e:
-            logger.error(f"SSE subcriber error on {channel}: {e}")
-        finally:
-            await _safe_cleanup(pubsub, channel, sub_redis)
+        channel = _user_channel(user_id)
 
+        async def on_keepalive():
+            # Heartbeat for active user tracking
+            try:
+                await presence.heartbeat(user_id)
+            except Exception:
+                pass
+
+        async for chunk in self._stream(
+            channel,
+            request,
+            connected_message="SSE stream connected",
+            on_keepalive=on_keepalive,
+            extra_channels=(BROADCAST_CHANNEL,),
+        ):
+            yield chunk
 
     async def subscribe_admin(self, request: Request) -> AsyncGenerator[str, None]:
-        """Async generator for admin SSE stream (dedicated Redis connection)."""
-
-        # Each admin subscriber gets a DEDICATED Redis connection
-        sub_redis = create_dedicated_redis_client()
-        pubsub = sub_redis.pubsub()
+        """Async generator for the admin SSE stream (shared hub connection)."""
+        async for chunk in self._stream(
+            ADMIN_CHANNEL,
+            request,
+            connected_message="Admin SSE stream connected",
+        ):
+            yield chunk
+
+    async def _stream(
+        self,
+        channel: str,
+        request: Request,
+        connected_message: str,
+        on_keepalive: Optional[Callable[[], Awaitable[None]]] = None,
+        extra_channels: Sequence[str] = (),
+    ) -> AsyncGenerator[str, None]:
+        """Register a hub listener on `channel` (and `extra_channels`) and turn its queue into SSE chunks."""
+        queue = await pubsub_hub.subscribe(channel)
+        subscribed = [channel]
+        logger.info(f"SSE subscribe → {channel}")
 
         try:
-            await pubsub.subscribe(ADMIN_CHANNEL)
-            logger.info(f"SSE subscribe → {ADMIN_CHANNEL}")
+            for extra in extra_channels:
+                await pubsub_hub.subscribe(extra, queue)
+                subscribed.append(extra)
 
-            yield _format_sse("connected", {"message": "Admin SSE stream connected"})
-            last_keepalive = time.monotonic()
+            yield _format_sse("connected", {"message": connected_message})
 
             while not self._shutdown_event.is_set():
-                if await request.is_disconnected():
-                    logger.info("Admin SSE HTTP disconnect detected")
-                    break
-
                 try:
-                    message = await asyncio.wait_for(
-                        pubsub.get_message(ignore_subscribe_messages=True, timeout=0.05),
-                        timeout=0.2,
-                    )
+                    raw = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_INTERVAL)
                 except asyncio.TimeoutError:
-                    message = None
-                except asyncio.CancelledError:
-                    logger.info("Admin SSE subscriber cancelled")
-                    return
-                except Exception as e:
-                    logger.error(f"SSE pubsub read error on {ADMIN_CHANNEL}: {e}")
-                    await asyncio.sleep(0.1)
+                    if await request.is_disconnected():
+                        logger.info(f"SSE HTTP disconnect detected for {channel}")
+                        break
+                    yield ": keepalive\n\n"
+                    if on_keepalive is not None:
+                        await on_keepalive()
                     continue
 
-                if message and message["type"] == "message":
-                    try:
-                        parsed = json.loads(message["data"])
-                        yield _format_sse(parsed["event"], parsed["data"])
-                    except (json.JSONDecodeError, KeyError):
-                        yield _format_sse("raw", {"message": message["data"]})
-                else:
-                    now = time.monotonic()
-                    if now - last_keepalive >= 25:
-                        yield ": keepalive\n\n"
-                        last_keepalive = now
+                if raw is None:  # hub shutting down
+                    break
+
+                try:
+                    parsed = json.loads(raw)
+                    yield _format_sse(parsed["event"], parsed["data"])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    yield _format_sse("raw", {"message": str(raw)})
 
         except asyncio.CancelledError:
-            logger.info("Admin SSE client disconnected")
+            logger.info(f"SSE subscriber cancelled : {channel}")
         except Exception as e:
-            logger.error(f"Admin SSE subscribe fatal error: {e}")
+            logger.error(f"SSE subscriber error on {channel}: {e}")
         finally:
-            await _safe_cleanup(pubsub, ADMIN_CHANNEL, sub_redis)
+            for subscribed_channel in subscribed:
+                await pubsub_hub.unsubscribe(subscribed_channel, queue)
 
     # ── Cleanup ────────────────────────────────────────────────
 
@@ -216,21 +200,5 @@ def _format_sse(event: str, data: dict) -> str:
     """Format a payload as an SSE text block."""
     return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
-async def _safe_cleanup(pubsub, channel: str, sub_redis: redis.Redis) -> None:
-    
-    for coro in [
-        pubsub.unsubscribe(channel),
-        pubsub.aclose(),
-        sub_redis.aclose(),
-    ]:
-
-        try:
-            await asyncio.wait_for(coro, timeout=0.5)
-        except Exception as e:
-            logger.error(f"Error closing SSE pubsub for {channel}: {e}")
-        pass
-    
-    
-
 # Singleton
 sse_manager = SSEManager()
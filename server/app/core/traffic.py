@@ -0,0 +1,100 @@
+"""
+Device traffic counters.
+
+Requests are classified by User-Agent (mobile / tablet / desktop) and
+counted in process memory; a background flusher writes the accumulated
+counts to Redis every `traffic_flush_interval_seconds` in ONE pipeline:
+
+    analytics:traffic:{YYYY-MM-DD}  (sorted set: device → count, 90-day TTL)
+
+So tracking costs a dict increment per request instead of a Redis call,
+and the Redis write rate is independent of traffic. Counts that fail to
+flush are merged back and retried; whatever is buffered at shutdown is
+flushed by `stop()`.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from user_agents import parse
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+TRAFFIC_KEY_PREFIX = "analytics:traffic:"
+TRAFFIC_RETENTION_SECONDS = 86400 * 90
+DEVICE_TYPES = ("mobile", "desktop", "tablet")
+
+
+def traffic_key(day: str) -> str:
+    return f"{TRAFFIC_KEY_PREFIX}{day}"
+
+
+@lru_cache(maxsize=2048)
+def classify_device(user_agent_string: str) -> str:
+    """Device bucket for a User-Agent; parsing is slow, so results are memoised."""
+    user_agent = parse(user_agent_string)
+    if user_agent.is_tablet:
+        return "tablet"
+    if user_agent.is_pc or user_agent.is_bot:  # bots count as desktop
+        return "desktop"
+    return "mobile"
+
+
+class TrafficCounter:
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._counts: Counter[Tuple[str, str]] = Counter()  # (day, device) → hits
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, user_agent_string: str) -> None:
+        """Count one request. Never touches the network."""
+        try:
+            device = classify_device(user_agent_string)
+        except Exception:
+            return
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        self._counts[(day, device)] += 1
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._counts:
+            return
+        counts, self._counts = self._counts, Counter()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for (day, device), hits in counts.items():
+                    await pipe.zincrby(traffic_key(day), hits, device)
+                for day in {day for day, _ in counts}:
+                    await pipe.expire(traffic_key(day), TRAFFIC_RETENTION_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error flushing traffic counters: {e}")
+            self._counts.update(counts)  # retry on the next flush
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        await self.flush()
+
+
+traffic_counter = TrafficCounter(flush_interval=settings.traffic_flush_interval_seconds)
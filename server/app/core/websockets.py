@@ -1,22 +1,44 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Set
+from collections import deque
+from typing import Deque, Dict, Set
 
 from fastapi import WebSocket
-import redis.asyncio as redis
-from app.core.redis import create_dedicated_redis_client, redis_client
+from app.core.pubsub import pubsub_hub
+from app.core.redis import redis_client
+from app.core.task_registry import fire
 
 logger = logging.getLogger(__name__)
 
+CHANNEL_PREFIX = "ws:inquiry:"
+CHANNEL_PATTERN = f"{CHANNEL_PREFIX}*"
+
+# A socket that cannot accept a frame within this many seconds is dropped,
+# so one slow client never stalls delivery to the rest of its group.
+SEND_TIMEOUT = 5.0
+
+# Chat traffic is bursty; give the worker-wide listener more headroom than
+# a single SSE client before old frames start being discarded.
+LISTENER_QUEUE_SIZE = 2048
+
+# Frames waiting for one group's sockets; a group that falls further behind
+# loses its oldest frames instead of holding up the listener.
+GROUP_BACKLOG_SIZE = 256
+
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, Dict[str, Set[WebSocket]]] = {}
         # Track metadata per user per group: { group_id: { client_id: { "is_admin": bool } } }
         self.user_meta: Dict[str, Dict[str, dict]] = {}
-        self.pubsub_tasks: Dict[str, asyncio.Task] = {}
+        # One pattern subscription per worker fans out to every local group
+        self._listener_task: asyncio.Task | None = None
+        self._listener_lock = asyncio.Lock()
         self._shutdown_event = asyncio.Event()
+        # Per-group backlog drained by one task each, so a slow group never
+        # blocks the listener and each group still receives frames in order
+        self._backlogs: Dict[str, Deque[dict]] = {}
 
     async def connect(self, websocket: WebSocket, group_id: str, client_id: str, is_admin: bool = False):
         await websocket.accept()
@@ -32,9 +54,7 @@ class ConnectionManager:
         self.active_connections[group_id][client_id].add(websocket)
         self.user_meta[group_id][client_id] = {"is_admin": is_admin}
 
-        if group_id not in self.pubsub_tasks:
-            task = asyncio.create_task(self._listen_to_redis(group_id))
-            self.pubsub_tasks[group_id] = task
+        await self._ensure_listener()
 
         # Broadcast presence:online to other users in the group
         if is_new_user:
@@ -66,14 +86,11 @@ class ConnectionManager:
             if not self.active_connections.get(group_id):
                 self.active_connections.pop(group_id, None)
                 self.user_meta.pop(group_id, None)
-                task = self.pubsub_tasks.pop(group_id, None)
-                if task:
-                    task.cancel()
 
     async def broadcast(self, group_id: str, message: dict):
         # Uses shared pool — no module-level global, no loop-binding issue
         payload = json.dumps(message)
-        channel = f"ws:inquiry:{group_id}"
+        channel = f"{CHANNEL_PREFIX}{group_id}"
         try:
             await redis_client.publish(channel, payload)
         except Exception as e:
@@ -91,91 +108,97 @@ class ConnectionManager:
             if not self.active_connections[group_id]:
                 del self.active_connections[group_id]
                 self.user_meta.pop(group_id, None)
-                task = self.pubsub_tasks.pop(group_id, None)
-                if task:
-                    task.cancel()
 
     async def _local_broadcast(self, group_id: str, message: dict):
-        if group_id not in self.active_connections:
+        """Send `message` to every local socket in the group concurrently."""
+        group = self.active_connections.get(group_id)
+        if not group:
             return
-        for client_id, websockets in list(self.active_connections[group_id].items()):
-            for ws in list(websockets):
-                try:
-                    await ws.send_json(message)
-                except Exception:
-                    self._remove_socket(ws, group_id, client_id)
 
-    async def _listen_to_redis(self, group_id: str):
-        channel = f"ws:inquiry:{group_id}"
-        retry_delay = 1
+        targets = [
+            (client_id, ws)
+            for client_id, websockets in list(group.items())
+            for ws in list(websockets)
+        ]
+
+        async def _send(ws: WebSocket):
+            await asyncio.wait_for(ws.send_json(message), timeout=SEND_TIMEOUT)
+
+        results = await asyncio.gather(
+            *(_send(ws) for _, ws in targets), return_exceptions=True
+        )
+        for (client_id, ws), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self._remove_socket(ws, group_id, client_id)
+
+    def _dispatch(self, group_id: str, message: dict):
+        backlog = self._backlogs.get(group_id)
+        if backlog is not None:
+            backlog.append(message)
+            return
+        self._backlogs[group_id] = deque([message], maxlen=GROUP_BACKLOG_SIZE)
+        fire(self._drain(group_id))
+
+    async def _drain(self, group_id: str):
+        backlog = self._backlogs.get(group_id)
+        if backlog is None:  # cleared by shutdown() before this task started
+            return
+        try:
+            while backlog:
+                message = backlog.popleft()
+                try:
+                    await self._local_broadcast(group_id, message)
+                except Exception as e:
+                    logger.error(f"WS dispatch failed for group {group_id}: {e}")
+        finally:
+            self._backlogs.pop(group_id, None)
+
+    async def _ensure_listener(self):
+        # Subscribe before returning so the caller's first broadcast is not missed
+        async with self._listener_lock:
+            if self._listener_task is None or self._listener_task.done():
+                queue = await pubsub_hub.psubscribe(CHANNEL_PATTERN, maxsize=LISTENER_QUEUE_SIZE)
+                self._listener_task = asyncio.create_task(self._listen_to_redis(queue))
+
+    async def _listen_to_redis(self, queue: asyncio.Queue):
+        """
+        Worker-wide listener on `ws:inquiry:*`. Blocks on the hub queue (no
+        polling) and hands each message to the matching local group's backlog
+        without waiting for the sends.
+        """
+        try:
+            while not self._shutdown_event.is_set():
+                item = await queue.get()
+                if item is None:  # hub shutting down
+                    return
 
-        while not self._shutdown_event.is_set():
-            sub_redis = create_dedicated_redis_client()
-            pubsub = sub_redis.pubsub()
+                channel, data = item
+                group_id = channel[len(CHANNEL_PREFIX):]
+                if group_id not in self.active_connections:
+                    continue
 
-            try:
-                await pubsub.subscribe(channel)
-                retry_delay = 1
-
-                while not self._shutdown_event.is_set():
-                    try:
-                        message = await asyncio.wait_for(
-                            pubsub.get_message(ignore_subscribe_messages=True, timeout=0.05),
-                            timeout=0.2,  # was 1.0
-                        )
-                    except asyncio.TimeoutError:
-                        message = None
-                    except asyncio.CancelledError:
-                        raise  # propagate — don't retry
-                    except Exception as e:
-                        logger.error(f"WS pubsub read error on {channel}: {e}")
-                        break
-
-                    if message and message["type"] == "message":
-                        try:
-                            parsed = json.loads(message["data"])
-                            if group_id in self.active_connections:
-                                for client_id, websockets in list(self.active_connections[group_id].items()):
-                                    for ws in list(websockets):
-                                        try:
-                                            await ws.send_json(parsed)
-                                        except Exception:
-                                            self._remove_socket(ws, group_id, client_id)
-                        except json.JSONDecodeError:
-                            pass
-
-            except asyncio.CancelledError:
-                return
-            except Exception as e:
-                logger.error(f"WS pubsub connection error for {channel}: {e}")
-            finally:
-                for coro in [pubsub.unsubscribe(channel), pubsub.aclose(), sub_redis.aclose()]:
-                    try:
-                        await asyncio.wait_for(coro, timeout=0.5)
-                    except Exception:
-                        pass
-
-            if group_id not in self.active_connections:
-                return
+                try:
+                    parsed = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
 
-            try:
-                await asyncio.wait_for(self._shutdown_event.wait(), timeout=retry_delay)
-                return
-            except asyncio.TimeoutError:
-                pass
-            retry_delay = min(retry_delay * 2, 30)
+                self._dispatch(group_id, parsed)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await pubsub_hub.punsubscribe(CHANNEL_PATTERN, queue)
 
     async def shutdown(self):
         self._shutdown_event.set()
-        tasks = list(self.pubsub_tasks.values())
-        if tasks:
-            for task in tasks:
-                task.cancel()
+        task = self._listener_task
+        if task is not None:
+            task.cancel()
             try:
-                await asyncio.wait(tasks, timeout=3.0)
+                await asyncio.wait([task], timeout=3.0)
             except Exception:
                 pass
-        self.pubsub_tasks.clear()
+        self._listener_task = None
+        self._backlogs.clear()
 
         ws_list = []
         for group in list(self.active_connections.values()):
@@ -14,9 +14,15 @@ from app.core.database import engine, check_db_connection
 from app.core.middleware import RateLimitMiddleware, UserActivityMiddleware, CorrelationMiddleware
 from app.core.redis import check_redis_connection, redis_client
 from app.core.email.service import check_smtp_connection
+from app.core.email.transport import close_email_transport
+from app.modules.orders.service.invoice_renderer import invoice_renderer
 from app.core.sse import sse_manager
+from app.core.pubsub import pubsub_hub
 from app.core.websockets import ws_manager
 from app.core.task_registry import cancel_all, pending_count
+from app.core.traffic import traffic_counter
+from app.core.presence import presence_buffer
+from app.core.payment import close_payment_provider
 
 
 from app.modules.users.routes import router as user_router
@@ -100,8 +106,42 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("WS manager shutdown error: %s", e)
 
+    try:
+        print("⏳ Shutting down Pub/Sub hub...")
+        await asyncio.wait_for(pubsub_hub.shutdown(), timeout=2.0)
+        print("✅ Pub/Sub hub shut down")
+    except Exception as e:
+        logger.warning("Pub/Sub hub shutdown error: %s", e)
+
     await cancel_all(timeout=3.0)
 
+    try:
+        await asyncio.wait_for(close_payment_provider(), timeout=2.0)
+    except Exception as e:
+        logger.warning("Payment provider close error: %s", e)
+
+    try:
+        invoice_renderer.shutdown()
+    except Exception as e:
+        logger.warning("Invoice renderer shutdown error: %s", e)
+
+    try:
+        print("⏳ Closing email transport...")
+        await asyncio.wait_for(close_email_transport(), timeout=3.0)
+        print("✅ Email transport closed")
+    except Exception as e:
+        logger.warning("Email transport close error: %s", e)
+
+    try:
+        await asyncio.wait_for(traffic_counter.stop(), timeout=2.0)
+    except Exception as e:
+        logger.warning("Traffic counter flush error: %s", e)
+
+    try:
+        await asyncio.wait_for(presence_buffer.stop(), timeout=2.0)
+    except Exception as e:
+        logger.warning("Presence flush error: %s", e)
+
     try:
         print("⏳ Closing Redis client...")
         await asyncio.wait_for(redis_client.aclose(), timeout=2.0)
@@ -135,6 +175,7 @@ app.add_middleware(
     allow_credentials=True, # Critical for setting the refresh_token cookie!
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Prev-Cursor"],  # keyset pagination cursors
 )
 
 app.include_router(user_router , prefix="/users" , tags=["Users"])
@@ -186,7 +227,7 @@ async def ping():
 
 @app.get("/health")
 async def health():
-    return {"message" : "I am alive"}
+    return {"message" : "I am alive", "invoice_render_queue": invoice_renderer.stats()}
 
 from fastapi import Request
 
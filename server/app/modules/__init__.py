@@ -5,7 +5,8 @@ from app.modules.inquiry.models import InquiryGroup, InquiryItem, InquiryMessage
 from app.modules.orders.models import Order, Transaction, OrderMilestone
 from app.modules.notifications.models import Notification
 from app.modules.tickets.models import Ticket, TicketMessage
-from app.modules.reviews.models import Review
+from app.modules.reviews.models import Review, ReviewStats
 from app.modules.wishlist.models import Wishlist
 from app.modules.seo.models import SEOConfig
+from app.modules.admin_dashboard.models import DashboardDailyRollup, DashboardDirtyDay
 
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, String, Date, Integer, Numeric, Boolean, PrimaryKeyConstraint
+
+from app.core.database import Base
+
+
+class DashboardDailyRollup(Base):
+    """
+    Per-day aggregates of the dashboard fact tables (UTC days).
+
+    source      dimension        is_offline   row_count / amount / amount_paid
+    ─────────── ──────────────── ──────────── ─────────────────────────────────────
+    order       order status     Order flag   orders / total_amount / amount_paid
+    transaction payment_mode     —            transactions / amount
+    inquiry     inquiry status   —            inquiry groups
+    user        —                —            signups
+    """
+    __tablename__ = "dashboard_daily_rollups"
+
+    source = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    dimension = Column(String, nullable=False, default="")
+    is_offline = Column(Boolean, nullable=False, default=False)
+
+    row_count = Column(Integer, nullable=False, default=0)
+    amount = Column(Numeric(14, 2), nullable=False, default=0)
+    amount_paid = Column(Numeric(14, 2), nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("source", "day", "dimension", "is_offline"),
+    )
+
+
+class DashboardDirtyDay(Base):
+    """
+    Days whose rollups are stale. Rows are inserted by database triggers on
+    orders / transactions / inquiry_groups / users (so bulk UPDATE/DELETE
+    statements are tracked too) and drained by the rollup refresher.
+    """
+    __tablename__ = "dashboard_dirty_days"
+
+    source = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("source", "day"),
+    )
@@ -0,0 +1,155 @@
+"""
+Dashboard rollups.
+
+The overview reads per-day aggregates from `dashboard_daily_rollups`
+instead of scanning orders / transactions / inquiry_groups / users on every
+page load. Rollups are maintained incrementally:
+
+  1. Row triggers on the fact tables (see the Alembic migration) record the
+     (source, UTC day) of every insert/update/delete in `dashboard_dirty_days`.
+     Triggers fire for bulk UPDATE/DELETE statements and cleanup jobs too.
+  2. `refresh_rollups()` drains the dirty days and recomputes only those days
+     with one INSERT ... SELECT per source, under an advisory lock so workers
+     never refresh concurrently. On failure the transaction rolls back and
+     the dirty rows stay for the next attempt.
+
+Rebuilding everything is just marking every day dirty — the migration
+does that once to backfill existing data.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import and_, delete, false, func, insert, literal, literal_column, or_, select, text
+
+from app.core.database import AsyncSessionLocal
+from app.modules.admin_dashboard.models import DashboardDailyRollup, DashboardDirtyDay
+from app.modules.inquiry.models import InquiryGroup
+from app.modules.orders.models import Order, Transaction
+from app.modules.users.models import User
+
+logger = logging.getLogger("app.modules.admin_dashboard")
+
+# pg_advisory_xact_lock key serialising rollup refreshes across workers
+ROLLUP_LOCK_ID = 724_180_010
+
+# Above this many contiguous day ranges, filter by day only (backfills)
+MAX_RANGE_FILTERS = 50
+
+ROLLUP_COLUMNS = ["source", "day", "dimension", "is_offline", "row_count", "amount", "amount_paid"]
+
+
+def utc_day(column):
+    """Calendar day (UTC) of a timestamptz column — the rollup grain."""
+    # Inlined constants: GROUP BY must match the SELECT expression exactly
+    return func.date(func.timezone(literal_column("'UTC'"), column))
+
+
+def _day_ranges(days: Iterable[date]) -> List[Tuple[datetime, datetime]]:
+    """Merge days into contiguous [start, end) UTC datetime ranges."""
+    ranges: List[Tuple[date, date]] = []
+    for d in sorted(set(days)):
+        if ranges and ranges[-1][1] == d:
+            ranges[-1] = (ranges[-1][0], d + timedelta(days=1))
+        else:
+            ranges.append((d, d + timedelta(days=1)))
+    return [
+        (datetime.combine(a, time.min, tzinfo=timezone.utc), datetime.combine(b, time.min, tzinfo=timezone.utc))
+        for a, b in ranges
+    ]
+
+
+def _day_filter(column, days: Set[date]):
+    day_expr = utc_day(column)
+    ranges = _day_ranges(days)
+    if len(ranges) > MAX_RANGE_FILTERS:
+        return day_expr.in_(days)
+    # Range predicates can use the created_at index; the day check keeps it exact
+    return and_(or_(*(and_(column >= a, column < b) for a, b in ranges)), day_expr.in_(days))
+
+
+def _aggregate(source: str, days: Set[date]):
+    """SELECT producing rollup rows for `source` on `days`."""
+    if source == "order":
+        day = utc_day(Order.created_at)
+        dimension = func.coalesce(Order.status, literal_column("''"))
+        is_offline = func.coalesce(Order.is_offline, false())
+        return (
+            select(
+                literal(source), day, dimension, is_offline,
+                func.count(Order.id),
+                func.coalesce(func.sum(Order.total_amount), 0),
+                func.coalesce(func.sum(Order.amount_paid), 0),
+            )
+            .where(_day_filter(Order.created_at, days))
+            .group_by(day, dimension, is_offline)
+        )
+    if source == "transaction":
+        day = utc_day(Transaction.created_at)
+        return (
+            select(
+                literal(source), day, Transaction.payment_mode, false(),
+                func.count(Transaction.id),
+                func.coalesce(func.sum(Transaction.amount), 0),
+                literal(0),
+            )
+            .where(_day_filter(Transaction.created_at, days))
+            .group_by(day, Transaction.payment_mode)
+        )
+    if source == "inquiry":
+        day = utc_day(InquiryGroup.created_at)
+        dimension = func.coalesce(InquiryGroup.status, literal_column("''"))
+        return (
+            select(
+                literal(source), day, dimension, false(),
+                func.count(InquiryGroup.id), literal(0), literal(0),
+            )
+            .where(_day_filter(InquiryGroup.created_at, days))
+            .group_by(day, dimension)
+        )
+    if source == "user":
+        day = utc_day(User.created_at)
+        return (
+            select(
+                literal(source), day, literal(""), false(),
+                func.count(User.id), literal(0), literal(0),
+            )
+            .where(_day_filter(User.created_at, days))
+            .group_by(day)
+        )
+    raise ValueError(f"Unknown rollup source: {source}")
+
+
+async def refresh_rollups() -> int:
+    """Recompute rollups for every dirty day. Returns the number of (source, day) pairs refreshed."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": ROLLUP_LOCK_ID})
+
+        dirty = (await db.execute(
+            delete(DashboardDirtyDay).returning(DashboardDirtyDay.source, DashboardDirtyDay.day)
+        )).all()
+        if not dirty:
+            await db.commit()
+            return 0
+
+        days_by_source: Dict[str, Set[date]] = defaultdict(set)
+        for source, day in dirty:
+            days_by_source[source].add(day)
+
+        for source, days in days_by_source.items():
+            await db.execute(
+                delete(DashboardDailyRollup).where(
+                    DashboardDailyRollup.source == source,
+                    DashboardDailyRollup.day.in_(days),
+                )
+            )
+            await db.execute(
+                insert(DashboardDailyRollup).from_select(ROLLUP_COLUMNS, _aggregate(source, days))
+            )
+
+        await db.commit()
+
+    logger.info(f"Dashboard rollups refreshed for {len(dirty)} source-days")
+    return len(dirty)
@@ -3,12 +3,21 @@ Admin Dashboard Service
 
 Encapsulates all DB aggregation queries for the dashboard endpoints.
 Each method returns a plain dict ready to serialize as JSON.
+
+Aggregates over the same table are folded into one statement with
+FILTER (WHERE ...); the remaining independent statements of an endpoint run
+concurrently via `_fetch_all`, each on its own pooled connection, so
+endpoint latency tracks the slowest query instead of the sum of them.
 """
 
+import asyncio
+import json
+import logging
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Literal
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func, desc, and_, true, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.users.models import User
@@ -16,12 +25,35 @@ from app.modules.orders.models import Order, Transaction
 from app.modules.inquiry.models import InquiryGroup, InquiryItem, QuoteVersion
 from app.modules.products.models import SubProduct
 from app.modules.services.models import Service
-from app.modules.reviews.models import Review
+from app.modules.reviews.models import Review, review_response_options
 from app.core.redis import redis_client
+from app.core.traffic import DEVICE_TYPES, traffic_key
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.modules.admin_dashboard.models import DashboardDailyRollup
+from app.modules.admin_dashboard.rollups import refresh_rollups
+
+logger = logging.getLogger("app.modules.admin_dashboard")
 
 
 PeriodType = Literal["today", "week", "month", "quarter", "year", "all"]
 
+# Pooled connections one worker's dashboard queries may hold at once
+QUERY_CONCURRENCY = 4
+_query_slots = asyncio.Semaphore(QUERY_CONCURRENCY)
+
+
+async def _fetch(stmt) -> list:
+    """Run one read-only statement on its own pooled session and return all rows."""
+    async with _query_slots:
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(stmt)).all()
+
+
+async def _fetch_all(*stmts) -> list:
+    """Run independent statements concurrently; results come back in order."""
+    return await asyncio.gather(*(_fetch(stmt) for stmt in stmts))
+
 
 def _period_delta(period: PeriodType) -> Optional[timedelta]:
     """Return the timedelta for a given period filter."""
@@ -69,7 +101,7 @@ class DashboardService:
     #  8.  TRAFFIC STATS (REDIS)
     # ------------------------------------------------------------------ #
     async def get_traffic_stats(self, period: PeriodType = "all") -> dict:
-        """Fetch device traffic from Redis sorted sets."""
+        """Fetch device traffic from Redis sorted sets (one pipelined round-trip)."""
         now = datetime.now(timezone.utc)
         delta = _period_delta(period)
         
@@ -82,31 +114,29 @@ class DashboardService:
         desktop = 0
         tablet = 0
         daily_trend = []
-        
-        for i in range(days_to_check, -1, -1):
-            d = now - timedelta(days=i)
-            key = f"analytics:traffic:{d.strftime('%Y-%m-%d')}"
-            
-            # zscore returns bytes or None
-            m_score = await redis_client.zscore(key, "mobile")
-            d_score = await redis_client.zscore(key, "desktop")
-            t_score = await redis_client.zscore(key, "tablet")
-            
-            m_val = int(m_score) if m_score else 0
-            d_val = int(d_score) if d_score else 0
-            t_val = int(t_score) if t_score else 0
-            
+
+        days = [now - timedelta(days=i) for i in range(days_to_check, -1, -1)]
+
+        # One round-trip: ZMSCORE per day, pipelined
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for d in days:
+                await pipe.zmscore(traffic_key(d.strftime('%Y-%m-%d')), list(DEVICE_TYPES))
+            day_scores = await pipe.execute()
+
+        for d, scores in zip(days, day_scores):
+            m_val, d_val, t_val = (int(score) if score else 0 for score in scores)
+
             mobile += m_val
             desktop += d_val
             tablet += t_val
-            
+
             daily_trend.append({
                 "date": d.strftime("%b %d"),
                 "mobile": m_val,
                 "desktop": d_val,
                 "tablet": t_val
             })
-            
+
         total = mobile + desktop + tablet
         
         return {
@@ -121,174 +151,160 @@ class DashboardService:
     #  1.  OVERVIEW
     # ------------------------------------------------------------------ #
     async def get_overview(self, period: PeriodType = "all") -> dict:
-        now = datetime.now(timezone.utc)
+        """
+        Served from a short-lived Redis cache; on a miss, stale rollup days are
+        refreshed and the payload is built from the daily rollups.
+        """
+        cache_key = f"dashboard:overview:{period}"
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"Dashboard overview cache read failed: {e}")
+
+        await refresh_rollups()
+        payload = await self._build_overview(period)
+
+        try:
+            await redis_client.setex(
+                cache_key, settings.dashboard_cache_ttl_seconds, json.dumps(payload, default=str)
+            )
+        except Exception as e:
+            logger.warning(f"Dashboard overview cache write failed: {e}")
+        return payload
+
+    async def _build_overview(self, period: PeriodType) -> dict:
+        """
+        Periods are whole UTC days ending today ("week" = the last 7 days) so
+        they can be answered from the daily rollups.
+        """
+        R = DashboardDailyRollup
+        today = datetime.now(timezone.utc).date()
         delta = _period_delta(period)
-        
-        start = now - delta if delta else None
-        prev_start = start - delta if (start and delta) else None
-
-        # --- Helper for period counts ---
-        async def get_count_in_range(model, start_dt, end_dt=None):
-            q = select(func.count(model.id))
-            if start_dt:
-                q = q.where(model.created_at >= start_dt)
-            if end_dt:
-                q = q.where(model.created_at < end_dt)
-            return (await self.db.execute(q)).scalar() or 0
+
+        start = today - delta + timedelta(days=1) if delta else None
+        prev_start = start - delta if start else None
+
+        # --- Totals, current period and previous period per (source, dimension) ---
+        if start:
+            in_period = R.day >= start
+            in_prev = and_(R.day >= prev_start, R.day < start)
+        else:
+            # "all": both windows are everything (change reads 0%)
+            in_period = in_prev = true()
+
+        totals_q = select(
+            R.source, R.dimension, R.is_offline,
+            func.sum(R.row_count), func.sum(R.amount), func.sum(R.amount_paid),
+            func.coalesce(func.sum(R.row_count).filter(in_period), 0),
+            func.coalesce(func.sum(R.amount).filter(in_period), 0),
+            func.coalesce(func.sum(R.row_count).filter(in_prev), 0),
+            func.coalesce(func.sum(R.amount).filter(in_prev), 0),
+        ).group_by(R.source, R.dimension, R.is_offline)
+
+        # --- Daily trends (last 30 days) ---
+        trending_days = 30
+        trend_start = today - timedelta(days=trending_days)
+        trend_q = (
+            select(R.source, R.day, func.sum(R.row_count), func.sum(R.amount))
+            .where(R.day >= trend_start, R.source.in_(("order", "user", "inquiry")))
+            .group_by(R.source, R.day)
+        )
+
+        # --- Live counts on small tables ---
+        catalog_q = select(
+            select(func.count(func.distinct(QuoteVersion.inquiry_id))).scalar_subquery(),
+            select(func.count(SubProduct.id)).scalar_subquery(),
+            select(func.count(SubProduct.id)).where(SubProduct.is_active == True).scalar_subquery(),
+            select(func.count(Service.id)).scalar_subquery(),
+            select(func.count(Service.id)).where(Service.is_active == True).scalar_subquery(),
+        )
+
+        (rows, trend_rows, catalog_rows), recent_reviews = await asyncio.gather(
+            _fetch_all(totals_q, trend_q, catalog_q),
+            self.get_recent_reviews(limit=5),
+        )
+        quoted_count, total_products, active_products, total_services, active_services = catalog_rows[0]
+
+        totals = defaultdict(lambda: {"count": 0, "amount": 0.0, "paid": 0.0,
+                                      "period_count": 0, "period_amount": 0.0,
+                                      "prev_count": 0, "prev_amount": 0.0})
+        orders_by_status: dict = defaultdict(int)
+        orders_online_vs_offline = {"offline": 0, "online": 0}
+        inquiries_by_status: dict = defaultdict(int)
+
+        for source, dimension, is_offline, count, amount, paid, p_count, p_amount, pv_count, pv_amount in rows:
+            t = totals[source]
+            t["count"] += count
+            t["amount"] += float(amount)
+            t["paid"] += float(paid)
+            t["period_count"] += p_count
+            t["period_amount"] += float(p_amount)
+            t["prev_count"] += pv_count
+            t["prev_amount"] += float(pv_amount)
+            if source == "order":
+                orders_by_status[dimension] += count
+                orders_online_vs_offline["offline" if is_offline else "online"] += count
+            elif source == "inquiry":
+                inquiries_by_status[dimension] += count
+
+        users, orders, txns, inquiries = (totals[s] for s in ("user", "order", "transaction", "inquiry"))
 
         # --- Users ---
-        total_users = await get_count_in_range(User, None)
-        new_users = await get_count_in_range(User, start)
-        prev_new_users = await get_count_in_range(User, prev_start, start)
-        user_metrics = _calculate_change(new_users, prev_new_users)
+        user_metrics = _calculate_change(users["period_count"], users["prev_count"])
 
         # --- Orders ---
-        total_orders = await get_count_in_range(Order, None)
-        orders_in_period = await get_count_in_range(Order, start)
-        prev_orders_in_period = await get_count_in_range(Order, prev_start, start)
-        order_metrics = _calculate_change(orders_in_period, prev_orders_in_period)
-
-        status_rows = (await self.db.execute(
-            select(Order.status, func.count(Order.id)).group_by(Order.status)
-        )).all()
-        orders_by_status = {row[0]: row[1] for row in status_rows}
-
-        source_rows = (await self.db.execute(
-            select(Order.is_offline, func.count(Order.id)).group_by(Order.is_offline)
-        )).all()
-        orders_online_vs_offline = {"offline": 0, "online": 0}
-        for row in source_rows:
-            if row[0]:
-                orders_online_vs_offline["offline"] = row[1]
-            else:
-                orders_online_vs_offline["online"] = row[1]
-
-        # --- Revenue ---
-        rev_q = select(
-            func.coalesce(func.sum(Order.total_amount), 0),
-            func.coalesce(func.sum(Order.amount_paid), 0),
-        )
-        rev = (await self.db.execute(rev_q)).one()
-        total_billed = float(rev[0])
-        total_collected = float(rev[1])
-        total_pending = total_billed - total_collected
-
-        async def get_rev_in_range(start_dt, end_dt=None):
-            # We use Transactions for actual collected revenue
-            q = select(func.coalesce(func.sum(Transaction.amount), 0))
-            if start_dt:
-                q = q.where(Transaction.created_at >= start_dt)
-            if end_dt:
-                q = q.where(Transaction.created_at < end_dt)
-            return float((await self.db.execute(q)).scalar() or 0)
-
-        collected_in_period = await get_rev_in_range(start)
-        prev_collected_in_period = await get_rev_in_range(prev_start, start)
-        revenue_metrics = _calculate_change(collected_in_period, prev_collected_in_period)
+        order_metrics = _calculate_change(orders["period_count"], orders["prev_count"])
+
+        # --- Revenue (collected = Transactions) ---
+        total_billed = orders["amount"]
+        total_collected = orders["paid"]
+        revenue_metrics = _calculate_change(txns["period_amount"], txns["prev_amount"])
 
         # --- Inquiries ---
-        total_inquiries = await get_count_in_range(InquiryGroup, None)
-        pending_inquiries = (await self.db.execute(
-            select(func.count(InquiryGroup.id)).where(InquiryGroup.status == "SUBMITTED")
-        )).scalar() or 0
-        inquiries_in_period = await get_count_in_range(InquiryGroup, start)
-        prev_inquiries_in_period = await get_count_in_range(InquiryGroup, prev_start, start)
-        inquiry_metrics = _calculate_change(inquiries_in_period, prev_inquiries_in_period)
-
-        inq_status_counts = (await self.db.execute(
-            select(InquiryGroup.status, func.count(InquiryGroup.id)).group_by(InquiryGroup.status)
-        )).all()
-        inquiries_by_status = {r[0]: r[1] for r in inq_status_counts}
-        
+        pending_inquiries = inquiries_by_status.get("SUBMITTED", 0)
+        inquiry_metrics = _calculate_change(inquiries["period_count"], inquiries["prev_count"])
+
         accepted_count = inquiries_by_status.get("ACCEPTED", 0)
         rejected_count = inquiries_by_status.get("REJECTED", 0)
         total_submitted = pending_inquiries + accepted_count + rejected_count
-        
-        quoted_count = (await self.db.execute(
-            select(func.count(func.distinct(QuoteVersion.inquiry_id)))
-        )).scalar() or 0
-        
+
         inquiry_funnel = {
-            "draft": total_inquiries,
+            "draft": inquiries["count"],
             "submitted": total_submitted,
             "quoted": quoted_count,
             "accepted": accepted_count
         }
         conversion_rate = round((accepted_count / total_submitted * 100), 1) if total_submitted > 0 else 0.0
 
-        # --- Products & Services ---
-        total_products = (await self.db.execute(
-            select(func.count(SubProduct.id))
-        )).scalar() or 0
-        active_products = (await self.db.execute(
-            select(func.count(SubProduct.id)).where(SubProduct.is_active == True)
-        )).scalar() or 0
-
-        total_services = (await self.db.execute(
-            select(func.count(Service.id))
-        )).scalar() or 0
-        active_services = (await self.db.execute(
-            select(func.count(Service.id)).where(Service.is_active == True)
-        )).scalar() or 0
+        # --- Daily trends, padded ---
+        trend_map = {(r[0], r[1]): (r[2], float(r[3])) for r in trend_rows}
+        trend_days = [trend_start + timedelta(days=i) for i in range(trending_days + 1)]
 
-        trending_days = 30
-        trend_start = now - timedelta(days=trending_days)
-        
-        def _pad_trend(rows: list, key: str = "count", is_float: bool = False):
+        def _pad_trend(source: str) -> list:
             """Pads trend data with zero values for days with no activity."""
-            data_map = {str(r[0]): r[1] for r in rows}
-            trend = []
-            for i in range(trending_days + 1):
-                d = (trend_start + timedelta(days=i)).date()
-                val = data_map.get(str(d), 0.0 if is_float else 0)
-                trend.append({"date": d.strftime("%b %d"), key: float(val) if is_float else val})
-            return trend
-
-        # --- Daily Trend (Orders & Revenue) ---
-        trend_q = (
-            select(
-                func.date(Order.created_at).label("date"),
-                func.count(Order.id).label("count"),
-                func.coalesce(func.sum(Order.total_amount), 0).label("value"),
-            )
-            .where(Order.created_at >= trend_start)
-            .group_by(func.date(Order.created_at))
-        )
-        trend_rows = (await self.db.execute(trend_q)).all()
-        order_data_map = {str(r[0]): (r[1], r[2]) for r in trend_rows}
-        daily_trend = []
-        for i in range(trending_days + 1):
-            d = (trend_start + timedelta(days=i)).date()
-            c, v = order_data_map.get(str(d), (0, 0))
-            daily_trend.append({"date": d.strftime("%b %d"), "count": c, "value": float(v)})
-
-        # --- Signup Trend ---
-        signup_q = (
-            select(func.date(User.created_at).label("date"), func.count(User.id))
-            .where(User.created_at >= trend_start).group_by(func.date(User.created_at))
-        )
-        signup_rows = (await self.db.execute(signup_q)).all()
-        signup_trend = _pad_trend(signup_rows)
+            return [
+                {"date": d.strftime("%b %d"), "count": trend_map.get((source, d), (0, 0.0))[0]}
+                for d in trend_days
+            ]
 
-        # --- Inquiry Trend ---
-        inquiry_q = (
-            select(func.date(InquiryGroup.created_at).label("date"), func.count(InquiryGroup.id))
-            .where(InquiryGroup.created_at >= trend_start).group_by(func.date(InquiryGroup.created_at))
-        )
-        inquiry_rows = (await self.db.execute(inquiry_q)).all()
-        inquiry_trend = _pad_trend(inquiry_rows)
+        daily_trend = []
+        for d in trend_days:
+            c, v = trend_map.get(("order", d), (0, 0.0))
+            daily_trend.append({"date": d.strftime("%b %d"), "count": c, "value": v})
 
         return {
             "users": {
-                "total": total_users,
-                "new_in_period": new_users,
-                "daily_trend": signup_trend,
+                "total": users["count"],
+                "new_in_period": users["period_count"],
+                "daily_trend": _pad_trend("user"),
                 **user_metrics
             },
             "orders": {
-                "total": total_orders,
-                "in_period": orders_in_period,
-                "by_status": orders_by_status,
+                "total": orders["count"],
+                "in_period": orders["period_count"],
+                "by_status": dict(orders_by_status),
                 "online_vs_offline": orders_online_vs_offline,
                 "daily_trend": daily_trend,
                 **order_metrics
@@ -296,22 +312,22 @@ class DashboardService:
             "revenue": {
                 "total_billed": total_billed,
                 "total_collected": total_collected,
-                "total_pending": total_pending,
-                "collected_in_period": collected_in_period,
+                "total_pending": total_billed - total_collected,
+                "collected_in_period": txns["period_amount"],
                 **revenue_metrics
             },
             "inquiries": {
-                "total": total_inquiries,
+                "total": inquiries["count"],
                 "pending": pending_inquiries,
-                "in_period": inquiries_in_period,
-                "daily_trend": inquiry_trend,
+                "in_period": inquiries["period_count"],
+                "daily_trend": _pad_trend("inquiry"),
                 "funnel": inquiry_funnel,
                 "conversion_rate": conversion_rate,
                 **inquiry_metrics
             },
             "products": {"total": total_products, "active": active_products},
             "services": {"total": total_services, "active": active_services},
-            "recent_reviews": await self.get_recent_reviews(limit=5),
+            "recent_reviews": recent_reviews,
         }
 
     # ------------------------------------------------------------------ #
@@ -320,7 +336,7 @@ class DashboardService:
     async def get_recent_reviews(self, limit: int = 5) -> list:
         """Fetches the latest customer reviews."""
         result = await self.db.execute(
-            select(Review).order_by(desc(Review.created_at)).limit(limit)
+            select(Review).options(*review_response_options()).order_by(desc(Review.created_at)).limit(limit)
         )
         reviews = result.scalars().all()
         return [
@@ -342,30 +358,18 @@ class DashboardService:
         start = _period_start(period)
 
         # Totals
-        rev = (await self.db.execute(
-            select(
-                func.coalesce(func.sum(Order.total_amount), 0),
-                func.coalesce(func.sum(Order.amount_paid), 0),
-            )
-        )).one()
-        total_billed = float(rev[0])
-        total_collected = float(rev[1])
-
-        # Collected in period
-        txn_filter = select(func.coalesce(func.sum(Transaction.amount), 0))
-        if start:
-            txn_filter = txn_filter.where(Transaction.created_at >= start)
-        collected_in_period = float((await self.db.execute(txn_filter)).scalar())
+        totals_q = select(
+            func.coalesce(func.sum(Order.total_amount), 0),
+            func.coalesce(func.sum(Order.amount_paid), 0),
+        )
 
-        # By payment mode
+        # Collected in period + by payment mode (one pass over transactions)
         mode_q = select(
             Transaction.payment_mode,
             func.coalesce(func.sum(Transaction.amount), 0),
         ).group_by(Transaction.payment_mode)
         if start:
             mode_q = mode_q.where(Transaction.created_at >= start)
-        mode_rows = (await self.db.execute(mode_q)).all()
-        by_payment_mode = {row[0]: float(row[1]) for row in mode_rows}
 
         # Daily collection trend
         trend_q = select(
@@ -374,10 +378,6 @@ class DashboardService:
         ).group_by(func.date(Transaction.created_at)).order_by(func.date(Transaction.created_at))
         if start:
             trend_q = trend_q.where(Transaction.created_at >= start)
-        trend_rows = (await self.db.execute(trend_q)).all()
-        collection_trend = [
-            {"date": str(row[0]), "amount": float(row[1])} for row in trend_rows
-        ]
 
         # Top 10 unpaid orders
         unpaid_q = (
@@ -393,7 +393,18 @@ class DashboardService:
             .order_by(desc("pending"))
             .limit(10)
         )
-        unpaid_rows = (await self.db.execute(unpaid_q)).all()
+
+        totals_rows, mode_rows, trend_rows, unpaid_rows = await _fetch_all(
+            totals_q, mode_q, trend_q, unpaid_q
+        )
+
+        total_billed = float(totals_rows[0][0])
+        total_collected = float(totals_rows[0][1])
+        by_payment_mode = {row[0]: float(row[1]) for row in mode_rows}
+        collected_in_period = sum(by_payment_mode.values())
+        collection_trend = [
+            {"date": str(row[0]), "amount": float(row[1])} for row in trend_rows
+        ]
         top_unpaid = [
             {"order_id": r[0], "user_email": r[1], "user_name": r[2], "pending": float(r[3])}
             for r in unpaid_rows
@@ -415,16 +426,11 @@ class DashboardService:
     async def get_users(self, period: PeriodType = "all") -> dict:
         start = _period_start(period)
 
-        total = (await self.db.execute(select(func.count(User.id)))).scalar() or 0
-        admins = (await self.db.execute(
-            select(func.count(User.id)).where(User.admin == True)
-        )).scalar() or 0
-
-        new_in_period = 0
-        if start:
-            new_in_period = (await self.db.execute(
-                select(func.count(User.id)).where(User.created_at >= start)
-            )).scalar() or 0
+        counts_q = select(
+            func.count(User.id),
+            func.count(User.id).filter(User.admin == True),
+            func.count(User.id).filter(User.created_at >= start) if start else literal(0),
+        )
 
         # Signup trend
         trend_q = (
@@ -437,8 +443,6 @@ class DashboardService:
         )
         if start:
             trend_q = trend_q.where(User.created_at >= start)
-        trend_rows = (await self.db.execute(trend_q)).all()
-        signup_trend = [{"date": str(r[0]), "count": r[1]} for r in trend_rows]
 
         # Top 10 users by order count & total spent
         top_q = (
@@ -452,7 +456,11 @@ class DashboardService:
             .order_by(desc("total_spent"))
             .limit(10)
         )
-        top_rows = (await self.db.execute(top_q)).all()
+
+        count_rows, trend_rows, top_rows = await _fetch_all(counts_q, trend_q, top_q)
+
+        total, admins, new_in_period = count_rows[0]
+        signup_trend = [{"date": str(r[0]), "count": r[1]} for r in trend_rows]
         top_users = [
             {
                 "user_id": r[0], "name": r[1], "email": r[2],
@@ -462,9 +470,9 @@ class DashboardService:
         ]
 
         return {
-            "total_users": total,
-            "admins": admins,
-            "new_in_period": new_in_period,
+            "total_users": total or 0,
+            "admins": admins or 0,
+            "new_in_period": new_in_period or 0,
             "signup_trend": signup_trend,
             "top_users_by_orders": top_users,
         }
@@ -475,24 +483,15 @@ class DashboardService:
     async def get_orders(self, period: PeriodType = "all") -> dict:
         start = _period_start(period)
 
-        total = (await self.db.execute(select(func.count(Order.id)))).scalar() or 0
-
-        in_period = 0
-        if start:
-            in_period = (await self.db.execute(
-                select(func.count(Order.id)).where(Order.created_at >= start)
-            )).scalar() or 0
+        # Total, in-period and average order value in one pass
+        counts_q = select(
+            func.count(Order.id),
+            func.count(Order.id).filter(Order.created_at >= start) if start else literal(0),
+            func.coalesce(func.avg(Order.total_amount), 0),
+        )
 
         # By status
-        status_rows = (await self.db.execute(
-            select(Order.status, func.count(Order.id)).group_by(Order.status)
-        )).all()
-        by_status = {r[0]: r[1] for r in status_rows}
-
-        # Average order value
-        avg_val = (await self.db.execute(
-            select(func.coalesce(func.avg(Order.total_amount), 0))
-        )).scalar()
+        status_q = select(Order.status, func.count(Order.id)).group_by(Order.status)
 
         # Daily trend
         trend_q = (
@@ -506,14 +505,18 @@ class DashboardService:
         )
         if start:
             trend_q = trend_q.where(Order.created_at >= start)
-        trend_rows = (await self.db.execute(trend_q)).all()
+
+        count_rows, status_rows, trend_rows = await _fetch_all(counts_q, status_q, trend_q)
+
+        total, in_period, avg_val = count_rows[0]
+        by_status = {r[0]: r[1] for r in status_rows}
         order_trend = [
             {"date": str(r[0]), "count": r[1], "value": float(r[2])} for r in trend_rows
         ]
 
         return {
-            "total": total,
-            "in_period": in_period,
+            "total": total or 0,
+            "in_period": in_period or 0,
             "by_status": by_status,
             "avg_order_value": round(float(avg_val), 2),
             "order_trend": order_trend,
@@ -525,29 +528,18 @@ class DashboardService:
     async def get_inquiries(self, period: PeriodType = "all") -> dict:
         start = _period_start(period)
 
-        total = (await self.db.execute(select(func.count(InquiryGroup.id)))).scalar() or 0
-
-        in_period = 0
-        if start:
-            in_period = (await self.db.execute(
-                select(func.count(InquiryGroup.id)).where(InquiryGroup.created_at >= start)
-            )).scalar() or 0
-
-        # By status
-        status_rows = (await self.db.execute(
-            select(InquiryGroup.status, func.count(InquiryGroup.id)).group_by(InquiryGroup.status)
-        )).all()
-        by_status = {r[0]: r[1] for r in status_rows}
-
-        # Conversion rate
-        accepted = by_status.get("ACCEPTED", 0)
-        conversion_rate = round((accepted / total * 100), 1) if total > 0 else 0.0
+        # By status, with the in-period count folded into the same pass
+        status_q = select(
+            InquiryGroup.status,
+            func.count(InquiryGroup.id),
+            func.count(InquiryGroup.id).filter(InquiryGroup.created_at >= start) if start else literal(0),
+        ).group_by(InquiryGroup.status)
 
         # Average quoted price
-        avg_quoted = (await self.db.execute(
+        avg_quoted_q = (
             select(func.coalesce(func.avg(QuoteVersion.total_price), 0))
             .where(QuoteVersion.status == "PENDING_REVIEW")
-        )).scalar()
+        )
 
         # Popular products (top 10 by inquiry item count)
         popular_q = (
@@ -561,7 +553,18 @@ class DashboardService:
             .order_by(desc("inquiry_count"))
             .limit(10)
         )
-        popular_rows = (await self.db.execute(popular_q)).all()
+
+        status_rows, avg_rows, popular_rows = await _fetch_all(status_q, avg_quoted_q, popular_q)
+
+        by_status = {r[0]: r[1] for r in status_rows}
+        total = sum(by_status.values())
+        in_period = sum(r[2] or 0 for r in status_rows)
+
+        # Conversion rate
+        accepted = by_status.get("ACCEPTED", 0)
+        conversion_rate = round((accepted / total * 100), 1) if total > 0 else 0.0
+
+        avg_quoted = avg_rows[0][0]
         popular_products = [
             {"template_id": r[0], "name": r[1], "inquiry_count": r[2]}
             for r in popular_rows
@@ -589,11 +592,18 @@ class DashboardService:
         """
         activities = []
 
-        # Recent users
-        users = (await self.db.execute(
+        users, orders, txns, inqs = await _fetch_all(
             select(User.name, User.email, User.created_at)
-            .order_by(desc(User.created_at)).limit(limit)
-        )).all()
+            .order_by(desc(User.created_at)).limit(limit),
+            select(Order.id, Order.total_amount, Order.status, Order.created_at)
+            .order_by(desc(Order.created_at)).limit(limit),
+            select(Transaction.order_id, Transaction.amount, Transaction.payment_mode, Transaction.created_at)
+            .order_by(desc(Transaction.created_at)).limit(limit),
+            select(InquiryGroup.id, InquiryGroup.status, InquiryGroup.created_at)
+            .order_by(desc(InquiryGroup.created_at)).limit(limit),
+        )
+
+        # Recent users
         for u in users:
             activities.append({
                 "type": "NEW_USER",
@@ -602,10 +612,6 @@ class DashboardService:
             })
 
         # Recent orders
-        orders = (await self.db.execute(
-            select(Order.id, Order.total_amount, Order.status, Order.created_at)
-            .order_by(desc(Order.created_at)).limit(limit)
-        )).all()
         for o in orders:
             activities.append({
                 "type": "NEW_ORDER",
@@ -614,10 +620,6 @@ class DashboardService:
             })
 
         # Recent transactions
-        txns = (await self.db.execute(
-            select(Transaction.order_id, Transaction.amount, Transaction.payment_mode, Transaction.created_at)
-            .order_by(desc(Transaction.created_at)).limit(limit)
-        )).all()
         for t in txns:
             activities.append({
                 "type": "PAYMENT",
@@ -626,10 +628,6 @@ class DashboardService:
             })
 
         # Recent inquiries
-        inqs = (await self.db.execute(
-            select(InquiryGroup.id, InquiryGroup.status, InquiryGroup.created_at)
-            .order_by(desc(InquiryGroup.created_at)).limit(limit)
-        )).all()
         for i in inqs:
             activities.append({
                 "type": "NEW_INQUIRY",
@@ -20,6 +20,12 @@ from app.core.email.templates.reminder import render_reminder_email
 from app.core.email.templates.invoice import render_invoice_email
 from app.core.email.templates.admin_notice import render_admin_notice_email
 from app.modules.notifications.models import EmailLog
+from app.modules.admin_email.service import (
+    NAME_PLACEHOLDER,
+    count_recipients,
+    get_bulk_email_job,
+    start_bulk_email_job,
+)
 
 logger = logging.getLogger("app.modules.admin_email")
 
@@ -205,7 +211,7 @@ async def preview_custom_email(
     return {"html": html}
 
 
-@router.post("/send-bulk-email", status_code=status.HTTP_200_OK)
+@router.post("/send-bulk-email", status_code=status.HTTP_202_ACCEPTED)
 async def send_bulk_email(
     request: Request,
     subject: str = Form(..., description="Email subject line"),
@@ -225,6 +231,9 @@ async def send_bulk_email(
     """
     Send a custom email to ALL users in the database.
     Supports optional banner image, CTA button, and file attachments.
+
+    Returns immediately with a job id; delivery runs in the background.
+    Poll GET /admin/email/bulk-jobs/{job_id} for progress.
     """
     # Swagger sends "" for optional fields instead of None — coerce empty strings
     image_url = image_url.strip() if image_url else None
@@ -238,74 +247,71 @@ async def send_bulk_email(
     # Read attachments once (before iterating over users)
     attachments = await _validate_files(files) if files else []
 
-    stmt = select(User).where(User.admin == False)
+    emails_list = None
     if user_emails:
-        emails_list = [e.strip() for e in user_emails.split(",") if e.strip()]
-        if emails_list:
-            stmt = stmt.where(User.email.in_(emails_list))
-            
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+        emails_list = [e.strip() for e in user_emails.split(",") if e.strip()] or None
 
-    if not users:
+    total = await count_recipients(db, emails_list)
+    if not total:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No users found.")
 
-    sent = 0
-    failed = 0
-
-    for user in users:
-        if template_id == "reminder":
-            html = render_reminder_email(
-                order_id=int(order_id) if order_id and order_id.isdigit() else 0,
-                due_amount=float(due_amount) if due_amount else 0.0,
-                due_date=due_date,
-                message=message,
-                user_name=user.name
-            )
-        elif template_id == "invoice":
-            html = render_invoice_email(
-                order_id=0, items=[], total_amount=0.0, amount_paid=0.0, user_name=user.name
-            )
-        elif template_id == "admin_notice":
-            html = render_admin_notice_email(
-                subject=subject,
-                message=message,
-                action_url=action_url,
-                action_label=action_label,
-                user_name=user.name
-            )
-        else:
-            html = render_custom_email(
-                heading=heading,
-                message=message,
-                image_url=image_url,
-                action_url=action_url,
-                action_label=action_label,
-                user_name=user.name,
-            )
-
-        if attachments:
-            msg_id = await email_service.send_email_with_attachments(
-                to=user.email, subject=subject, body_html=html, attachments=attachments,
-            )
-        else:
-            msg_id = await email_service.send_email(to=user.email, subject=subject, body_html=html)
+    # Render ONCE — the recipient's name is filled per message by the provider
+    if template_id == "reminder":
+        html = render_reminder_email(
+            order_id=int(order_id) if order_id and order_id.isdigit() else 0,
+            due_amount=float(due_amount) if due_amount else 0.0,
+            due_date=due_date,
+            message=message,
+            user_name=NAME_PLACEHOLDER,
+        )
+    elif template_id == "invoice":
+        html = render_invoice_email(
+            order_id=0, items=[], total_amount=0.0, amount_paid=0.0, user_name=NAME_PLACEHOLDER
+        )
+    elif template_id == "admin_notice":
+        html = render_admin_notice_email(
+            subject=subject,
+            message=message,
+            action_url=action_url,
+            action_label=action_label,
+            user_name=NAME_PLACEHOLDER,
+        )
+    else:
+        html = render_custom_email(
+            heading=heading,
+            message=message,
+            image_url=image_url,
+            action_url=action_url,
+            action_label=action_label,
+            user_name=NAME_PLACEHOLDER,
+        )
 
-        if msg_id:
-            sent += 1
-            db.add(EmailLog(
-                recipient=user.email,
-                subject=subject,
-                message_id=msg_id if isinstance(msg_id, str) else None,
-                status="delivered",
-                metadata_={"template_id": template_id, "bulk": True}
-            ))
-        else:
-            failed += 1
+    job_id = await start_bulk_email_job(
+        subject=subject,
+        body_html=html,
+        template_id=template_id,
+        total=total,
+        user_emails=emails_list,
+        attachments=attachments,
+    )
 
     return {
-        "message": f"Bulk email completed. Sent: {sent}, Failed: {failed}",
-        "total_users": len(users),
-        "sent": sent,
-        "failed": failed,
+        "message": f"Bulk email queued for {total} users. Job ID: {job_id}",
+        "job_id": job_id,
+        "total_users": total,
     }
+
+
+@router.get("/bulk-jobs/{job_id}")
+async def get_bulk_email_job_status(
+    job_id: str,
+    admin: User = Depends(get_current_admin_user),
+):
+    """
+    Progress of a bulk email job: sent / failed counts, percentage,
+    throughput (emails per second) and final status.
+    """
+    job = await get_bulk_email_job(job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bulk email job not found.")
+    return job
@@ -0,0 +1,228 @@
+"""
+Bulk email delivery engine.
+
+A bulk send runs as a background job instead of inside the HTTP request:
+
+  1. The template is rendered ONCE with `{{ params.name }}` in place of the
+     recipient's name; each recipient only contributes a params dict.
+  2. Recipients are streamed from the DB in keyset-paginated chunks
+     (id, email, name only), so memory stays flat for any audience size.
+  3. Batches are sent by a bounded pool of workers through
+     `email_service.send_batch` (Brevo `messageVersions` — one request per
+     batch on a shared keep-alive client).
+  4. Progress lives in a Redis hash so any worker can answer the status
+     endpoint: GET /admin/email/bulk-jobs/{job_id}.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, func
+
+from app.core.database import AsyncSessionLocal
+from app.core.email.service import get_email_service
+from app.core.redis import redis_client
+from app.core.task_registry import fire
+from app.modules.notifications.models import EmailLog
+from app.modules.users.models import User
+
+logger = logging.getLogger("app.modules.admin_email")
+
+# Rendered into templates in place of the recipient's name
+NAME_PLACEHOLDER = "{{ params.name }}"
+
+RECIPIENT_CHUNK_SIZE = 500     # rows fetched per DB round-trip
+BATCH_SIZE = 50                # recipients per provider request
+CONCURRENCY = 4                # provider requests in flight
+JOB_TTL_SECONDS = 7 * 86400    # progress is kept for a week
+
+
+def _job_key(job_id: str) -> str:
+    return f"bulk_email:job:{job_id}"
+
+
+def _recipient_filter(user_emails: Optional[List[str]]):
+    conditions = [User.admin == False]
+    if user_emails:
+        conditions.append(User.email.in_(user_emails))
+    return conditions
+
+
+async def count_recipients(db, user_emails: Optional[List[str]] = None) -> int:
+    return (await db.execute(
+        select(func.count(User.id)).where(*_recipient_filter(user_emails))
+    )).scalar() or 0
+
+
+async def start_bulk_email_job(
+    *,
+    subject: str,
+    body_html: str,
+    template_id: str,
+    total: int,
+    user_emails: Optional[List[str]] = None,
+    attachments: Optional[List[Tuple[str, bytes, str]]] = None,
+) -> str:
+    """Register a job in Redis, start it in the background and return its id."""
+    job_id = uuid.uuid4().hex
+    key = _job_key(job_id)
+    await redis_client.hset(key, mapping={
+        "status": "queued",
+        "subject": subject,
+        "template_id": template_id,
+        "total": total,
+        "sent": 0,
+        "failed": 0,
+        "created_at": time.time(),
+    })
+    await redis_client.expire(key, JOB_TTL_SECONDS)
+
+    fire(_run_job(
+        job_id,
+        subject=subject,
+        body_html=body_html,
+        template_id=template_id,
+        user_emails=user_emails,
+        attachments=attachments,
+    ))
+    return job_id
+
+
+async def get_bulk_email_job(job_id: str) -> Optional[dict]:
+    """Return job progress (counts, throughput, status) or None if unknown."""
+    data = await redis_client.hgetall(_job_key(job_id))
+    if not data:
+        return None
+
+    total = int(data.get("total", 0))
+    sent = int(data.get("sent", 0))
+    failed = int(data.get("failed", 0))
+    started_at = float(data["started_at"]) if data.get("started_at") else None
+    finished_at = float(data["finished_at"]) if data.get("finished_at") else None
+
+    elapsed = 0.0
+    if started_at:
+        elapsed = (finished_at or time.time()) - started_at
+    processed = sent + failed
+
+    return {
+        "job_id": job_id,
+        "status": data.get("status"),
+        "subject": data.get("subject"),
+        "template_id": data.get("template_id"),
+        "total": total,
+        "sent": sent,
+        "failed": failed,
+        "progress": round(processed / total * 100, 1) if total else 100.0,
+        "elapsed_seconds": round(elapsed, 2),
+        "emails_per_second": round(processed / elapsed, 2) if elapsed > 0 else 0.0,
+        "error": data.get("error"),
+    }
+
+
+async def _iter_recipient_batches(user_emails: Optional[List[str]]):
+    """Yield lists of (email, params) streamed from the DB in keyset chunks."""
+    last_id = None
+    batch: List[Tuple[str, dict]] = []
+
+    while True:
+        stmt = (
+            select(User.id, User.email, User.name)
+            .where(*_recipient_filter(user_emails))
+            .order_by(User.id)
+            .limit(RECIPIENT_CHUNK_SIZE)
+        )
+        if last_id is not None:
+            stmt = stmt.where(User.id > last_id)
+
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(stmt)).all()
+        if not rows:
+            break
+
+        for row in rows:
+            batch.append((row.email, {"name": row.name or "Customer"}))
+            if len(batch) >= BATCH_SIZE:
+                yield batch
+                batch = []
+        last_id = rows[-1].id
+
+    if batch:
+        yield batch
+
+
+async def _run_job(
+    job_id: str,
+    *,
+    subject: str,
+    body_html: str,
+    template_id: str,
+    user_emails: Optional[List[str]],
+    attachments: Optional[List[Tuple[str, bytes, str]]],
+) -> None:
+    key = _job_key(job_id)
+    email_service = get_email_service()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CONCURRENCY * 2)
+
+    async def worker():
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            try:
+                message_ids = await email_service.send_batch(subject, body_html, batch, attachments)
+            except Exception as e:
+                logger.error(f"Bulk email job {job_id}: batch failed: {e}")
+                message_ids = [None] * len(batch)
+
+            sent = sum(1 for m in message_ids if m)
+            try:
+                async with AsyncSessionLocal() as db:
+                    db.add_all([
+                        EmailLog(
+                            recipient=to,
+                            subject=subject,
+                            message_id=msg_id if isinstance(msg_id, str) else None,
+                            status="delivered" if msg_id else "failed",
+                            metadata_={"template_id": template_id, "bulk": True, "job_id": job_id},
+                        )
+                        for (to, _), msg_id in zip(batch, message_ids)
+                    ])
+                    await db.commit()
+            except Exception as e:
+                logger.error(f"Bulk email job {job_id}: failed to write email logs: {e}")
+
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    await pipe.hincrby(key, "sent", sent)
+                    await pipe.hincrby(key, "failed", len(batch) - sent)
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(f"Bulk email job {job_id}: failed to update progress: {e}")
+
+    await redis_client.hset(key, mapping={"status": "running", "started_at": time.time()})
+    workers = [asyncio.create_task(worker()) for _ in range(CONCURRENCY)]
+
+    try:
+        async for batch in _iter_recipient_batches(user_emails):
+            await queue.put(batch)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+        await redis_client.hset(key, mapping={"status": "completed", "finished_at": time.time()})
+        logger.info(f"Bulk email job {job_id} completed")
+    except asyncio.CancelledError:
+        for w in workers:
+            w.cancel()
+        await redis_client.hset(key, mapping={"status": "cancelled", "finished_at": time.time()})
+        raise
+    except Exception as e:
+        for w in workers:
+            w.cancel()
+        logger.exception(f"Bulk email job {job_id} failed: {e}")
+        await redis_client.hset(key, mapping={
+            "status": "failed", "error": str(e), "finished_at": time.time(),
+        })
@@ -34,6 +34,8 @@ async def user_sse_stream(
       - payment_verified
       - milestones_changed
       - new_notification
+      - notification_counts  ({unread_delta, total_delta} after the user's notifications change)
+      - broadcast            (bulk notification; {title, message, audience})
 
     Usage (JavaScript):
         const es = new EventSource('/events/stream', { withCredentials: true });
@@ -1,12 +1,14 @@
 import logging
+from typing import Optional
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.core.task_registry import fire
 from app.modules.auth.auth import get_current_admin_user
 from app.modules.users.models import User
@@ -25,6 +27,8 @@ from app.modules.inquiry.schemas import (
     InquiryMessageCreate,
     InquiryMessageResponse
 )
+from app.modules.inquiry.pricing import compile_config
+from app.modules.inquiry.service import inquiry_list_query
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -40,68 +44,23 @@ async def admin_calculate_custom_price(
     [ADMIN] Calculate estimated price for a product/service hypothetically (bypassing DB values).
     Takes base_price, quantity, config_schema, and selected_options.
     """
-    estimated_price = 0.0
-    
     if request.is_service:
         # Service logic: (Price Per Unit)
         estimated_price = request.base_price
     else:
-        # Product logic: Base Price + Options
-        base_item_price = request.base_price
-        
+        # Product logic: Base Price + Options (same rules as storefront pricing)
+        estimated_price = request.base_price
         if request.selected_options and request.config_schema:
-            sections_list = request.config_schema.get("sections", []) if isinstance(request.config_schema, dict) else []
-            sections_map = {
-                section["key"]: section 
-                for section in sections_list
-                if isinstance(section, dict) and "key" in section
-            }
-            
-            for key, selected_val in request.selected_options.items():
-                if key not in sections_map:
-                    raise HTTPException(status_code=400, detail=f"Invalid option category: {key}")
-                
-                section = sections_map[key]
-                s_type = section.get("type")
-                
-                if s_type in ["dropdown", "radio"]:
-                    options = section.get("options", []) or []
-                    options_map = {
-                        str(opt.get("value")): float(opt.get("price_mod", 0.0))
-                        for opt in options if isinstance(opt, dict) and "value" in opt
-                    }
-                    
-                    if s_type == "dropdown":
-                        val_list = selected_val if isinstance(selected_val, list) else [selected_val]
-                        for v in val_list:
-                            v_str = str(v)
-                            if v_str not in options_map:
-                                raise HTTPException(status_code=400, detail=f"Invalid value '{v}' for option '{key}'")
-                            base_item_price += options_map[v_str]
-                    else:
-                        val_str = str(selected_val)
-                        if val_str not in options_map:
-                            raise HTTPException(status_code=400, detail=f"Invalid value '{selected_val}' for option '{key}'")
-                        base_item_price += options_map[val_str]
-                
-                elif s_type == "number_input":
-                    try:
-                        user_val = float(selected_val)
-                        default_val = float(section.get("default_val", 0.0))
-                        ppu = float(section.get("price_per_unit", 0.0))
-                        base_item_price += (user_val - default_val) * ppu
-                    except (ValueError, TypeError):
-                        pass
-
-        estimated_price = base_item_price
+            estimated_price += compile_config(request.config_schema).option_total(request.selected_options)
 
     return {"estimated_price": estimated_price}
 
 
 @router.get("/", response_model=list[InquiryGroupListResponse], status_code=status.HTTP_200_OK)
 async def get_all_inquiries(
-    skip: int = 0,
-    limit: int = 50,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(50, ge=1, le=200),
     status_filter: str = None,
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
@@ -109,21 +68,13 @@ async def get_all_inquiries(
     """
     [ADMIN] Get all inquiry groups with optional status filter.
     """
-    stmt = select(InquiryGroup).options(
-        selectinload(InquiryGroup.items)
-    ).order_by(InquiryGroup.created_at.desc())
+    stmt = inquiry_list_query()
     
     if status_filter:
         stmt = stmt.where(InquiryGroup.status == status_filter.upper())
     
-    stmt = stmt.offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    groups = result.scalars().all()
-
-    for group in groups:
-        group.item_count = len(group.items)
-    
-    return groups
+    page = await paginate(db, stmt, keys=(InquiryGroup.created_at, InquiryGroup.id), limit=limit, cursor=cursor, scalars=False)
+    return with_cursor_headers(response, page)
 
 
 @router.get("/{group_id}", response_model=InquiryGroupResponse, status_code=status.HTTP_200_OK)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, func, Uuid, text, Integer, Text, ARRAY, Boolean, Numeric
+from sqlalchemy import Column, String, DateTime, ForeignKey, func, Uuid, text, Integer, Text, ARRAY, Boolean, Numeric, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from app.core.database import Base
@@ -11,8 +11,8 @@ class InquiryGroup(Base):
     id              = Column(Uuid, primary_key=True, server_default=text("uuidv7()"))
     display_id      = Column(String, unique=True, nullable=False, index=True,
                              default=lambda: generate_nanoid("INQ", 4))
-    user_id         = Column(Uuid, ForeignKey("users.id"), nullable=False, index=True)
-    status          = Column(String, default="DRAFT", nullable=False, index=True)
+    user_id         = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    status          = Column(String, default="DRAFT", nullable=False)
     active_quote_id = Column(Uuid, ForeignKey("quote_versions.id"), nullable=True)
     quote_email_status = Column(String, nullable=True)
     admin_notes     = Column(Text, nullable=True)
@@ -20,6 +20,13 @@ class InquiryGroup(Base):
     created_at      = Column(DateTime(timezone=True), server_default=func.now())
     updated_at      = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # (…, created_at, id) composites serve keyset-paginated listings
+    __table_args__ = (
+        Index("ix_inquiry_groups_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_inquiry_groups_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_inquiry_groups_created_at_id", "created_at", "id"),
+    )
+
     user            = relationship("User", back_populates="inquiry_groups")
     items           = relationship("InquiryItem", back_populates="group", cascade="all, delete-orphan")
     messages        = relationship("InquiryMessage", back_populates="group", cascade="all, delete-orphan")
@@ -0,0 +1,186 @@
+"""
+Option pricing engine.
+
+A SubProduct's `config_schema` (JSONB) is compiled ONCE into an immutable
+lookup structure — section key → kind + {option value → price_mod} — and
+cached by (sub_product id, updated_at), so editing a sub-product recompiles
+it while pricing never re-parses the raw JSON:
+
+    compile_config(config_schema)         → CompiledConfig (no cache; admin calculator)
+    pricing_engine.compiled(sub_product)  → cached CompiledConfig
+    price_item(item, sub_product, sub_service)
+    price_items(items, sub_products, sub_services)  → prices for a whole inquiry
+
+Pricing rules (shared by the storefront and the admin calculator):
+  - dropdown: one value or a list; every value's price_mod is added
+  - radio:    exactly one value
+  - number_input: (value - default_val) * price_per_unit; unparsable values are ignored
+  - unknown section key / option value → 400
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from app.modules.inquiry.schemas import InquiryItemCreate
+from app.modules.products.models import SubProduct
+from app.modules.services.models import SubService
+
+OPTION_KINDS = ("dropdown", "radio")
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSection:
+    kind: Optional[str]
+    options: Mapping[str, float]       # option value (as str) → price_mod
+    default_val: Optional[float] = 0.0     # None: unparsable in the schema, section not priced
+    price_per_unit: Optional[float] = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledConfig:
+    sections: Mapping[str, CompiledSection]
+
+    def option_total(self, selected_options: Optional[Dict[str, Any]]) -> float:
+        """Sum of option price modifiers for one selection."""
+        total = 0.0
+        if not selected_options:
+            return total
+
+        sections = self.sections
+        for key, val in selected_options.items():
+            section = sections.get(key)
+            if section is None:
+                raise HTTPException(400, f"Invalid option category: {key}")
+
+            if section.kind == "dropdown":
+                for v in (val if isinstance(val, list) else (val,)):
+                    mod = section.options.get(str(v))
+                    if mod is None:
+                        raise HTTPException(400, f"Invalid value '{v}' for '{key}'")
+                    total += mod
+            elif section.kind == "radio":
+                mod = section.options.get(str(val))
+                if mod is None:
+                    raise HTTPException(400, f"Invalid value '{val}' for '{key}'")
+                total += mod
+            elif section.kind == "number_input" and section.default_val is not None and section.price_per_unit is not None:
+                try:
+                    total += (float(val or 0) - section.default_val) * section.price_per_unit
+                except (ValueError, TypeError):
+                    pass
+        return total
+
+
+EMPTY_CONFIG = CompiledConfig(sections=MappingProxyType({}))
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def compile_config(config_schema: Any) -> CompiledConfig:
+    """Parse a config_schema into its immutable pricing lookup."""
+    raw_sections = config_schema.get("sections", []) if isinstance(config_schema, dict) else []
+    sections: Dict[str, CompiledSection] = {}
+
+    for section in raw_sections:
+        if not isinstance(section, dict) or "key" not in section:
+            continue
+        kind = section.get("type")
+        if kind in OPTION_KINDS:
+            options = {
+                str(opt["value"]): _number(opt.get("price_mod", 0)) or 0.0
+                for opt in (section.get("options") or [])
+                if isinstance(opt, dict) and "value" in opt
+            }
+            sections[section["key"]] = CompiledSection(kind, MappingProxyType(options))
+        elif kind == "number_input":
+            sections[section["key"]] = CompiledSection(
+                kind,
+                MappingProxyType({}),
+                default_val=_number(section.get("default_val", 0)),
+                price_per_unit=_number(section.get("price_per_unit", 0)),
+            )
+        else:
+            # Display-only sections still count as valid keys (priced at 0)
+            sections[section["key"]] = CompiledSection(kind, MappingProxyType({}))
+
+    return CompiledConfig(sections=MappingProxyType(sections)) if sections else EMPTY_CONFIG
+
+
+class PricingEngine:
+    """LRU of compiled configs keyed by (sub_product id, updated_at)."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._compiled: "OrderedDict[int, Tuple[Any, CompiledConfig]]" = OrderedDict()
+
+    def compiled(self, sub_product: SubProduct) -> CompiledConfig:
+        version = sub_product.updated_at
+        entry = self._compiled.get(sub_product.id)
+        if entry is not None and entry[0] == version and version is not None:
+            self._compiled.move_to_end(sub_product.id)
+            return entry[1]
+
+        config = compile_config(sub_product.config_schema)
+        self._compiled[sub_product.id] = (version, config)
+        self._compiled.move_to_end(sub_product.id)
+        while len(self._compiled) > self.max_entries:
+            self._compiled.popitem(last=False)
+        return config
+
+
+pricing_engine = PricingEngine()
+
+
+def price_item(
+    item: InquiryItemCreate,
+    sub_product: Optional[SubProduct] = None,
+    sub_service: Optional[SubService] = None,
+) -> float:
+    """Validate an item against its catalog row and return its estimated unit price."""
+    if item.subservice_id:
+        if not sub_service:
+            raise HTTPException(404, f"SubService {item.subservice_id} not found")
+        if not sub_service.is_active:
+            raise HTTPException(400, "This service is currently unavailable")
+        if item.quantity < sub_service.minimum_quantity:
+            raise HTTPException(400, f"Minimum quantity for '{sub_service.name}' is {sub_service.minimum_quantity}")
+        return sub_service.price_per_unit
+
+    if item.subproduct_id:
+        if not sub_product:
+            raise HTTPException(404, f"SubProduct {item.subproduct_id} not found")
+        if not sub_product.is_active:
+            raise HTTPException(400, "This product is currently unavailable")
+        if item.quantity < sub_product.minimum_quantity:
+            raise HTTPException(400, f"Minimum quantity for '{sub_product.name}' is {sub_product.minimum_quantity}")
+        price = sub_product.base_price
+        if item.selected_options and sub_product.config_schema:
+            price += pricing_engine.compiled(sub_product).option_total(item.selected_options)
+        return price
+
+    return 0.0
+
+
+def price_items(
+    items: Sequence[InquiryItemCreate],
+    sub_products: Mapping[int, SubProduct],
+    sub_services: Mapping[int, SubService],
+) -> List[float]:
+    """Price a whole inquiry in one in-memory pass over pre-loaded catalog rows."""
+    return [
+        price_item(
+            item,
+            sub_product=sub_products.get(item.subproduct_id) if item.subproduct_id else None,
+            sub_service=sub_services.get(item.subservice_id) if item.subservice_id else None,
+        )
+        for item in items
+    ]
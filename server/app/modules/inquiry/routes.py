@@ -1,3 +1,4 @@
+from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,6 +6,7 @@ from sqlalchemy import select, delete
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.core.task_registry import fire
 from app.modules.auth.auth import get_current_user, get_current_user_ws
 from app.modules.auth.schemas import TokenData
@@ -13,7 +15,7 @@ from app.modules.orders.schemas import OrderResponse
 from app.modules.orders.schemas import PaymentSplitType
 from app.modules.inquiry.models import InquiryGroup, InquiryItem, InquiryMessage
 from app.modules.users.models import User
-from app.modules.inquiry.service import calculate_item_estimated_price
+from app.modules.inquiry.service import calculate_item_estimated_price, inquiry_list_query, load_list_items, price_inquiry_items
 from app.modules.inquiry.schemas import (
     InquiryGroupCreate,
     InquiryItemUpdate,
@@ -28,7 +30,7 @@ from app.modules.inquiry.schemas import (
 )
 from app.modules.notifications.service import NotificationService
 
-from fastapi import WebSocket, WebSocketDisconnect, Query
+from fastapi import WebSocket, WebSocketDisconnect, Query, Response
 from jose import jwt
 from app.core.config import settings
 from app.core.websockets import ws_manager
@@ -87,7 +89,10 @@ async def create_inquiry_group(
     Create a new Inquiry Group (RFQ Cart).
     User submits one or multiple products/services for quotation.
     """
-    # 1. Create the parent container
+    # 1. Validate and price every item up front (one catalog query per table)
+    prices = await price_inquiry_items(inquiry_data.items, db)
+
+    # 2. Create the parent container
     new_group = InquiryGroup(
         user_id=current_user.id,
         status='DRAFT'
@@ -95,10 +100,9 @@ async def create_inquiry_group(
     db.add(new_group)
     await db.flush()  # Flush to generate the new_group.id for the item
 
-    # 2. Add the child items to the container
-    for item in inquiry_data.items:
-        estimated_price = await calculate_item_estimated_price(item, db)
-        new_item = InquiryItem(
+    # 3. Add the child items to the container (inserted together on commit)
+    db.add_all([
+        InquiryItem(
             group_id=new_group.id,
             product_id=item.product_id,
             subproduct_id=item.subproduct_id,
@@ -110,16 +114,15 @@ async def create_inquiry_group(
             images=item.images,
             estimated_price=estimated_price
         )
-        db.add(new_item)
-    
-    await db.flush()  # Flush to generate the new_group.id for the item
+        for item, estimated_price in zip(inquiry_data.items, prices)
+    ])
 
     await db.commit()
 
     # Fire SSE to admin (only if submitted - skipped here because we start as DRAFT)
 
     
-    # 3. Fetch the fully loaded group to return
+    # 4. Fetch the fully loaded group to return
     stmt = select(InquiryGroup).options(
         selectinload(InquiryGroup.items),
         selectinload(InquiryGroup.messages),
@@ -133,32 +136,22 @@ async def create_inquiry_group(
 
 @router.get("/my", response_model=list[InquiryGroupListResponse], status_code=status.HTTP_200_OK)
 async def get_my_inquiries(
-    skip: int = 0,
-    limit: int = 20,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(20, ge=1, le=100),
     current_user: TokenData = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get all inquiries for the current user (Lightweight List).
     """
-    stmt = (
-        select(InquiryGroup)
-        .options(
-            selectinload(InquiryGroup.items)
-        )
-        .where(InquiryGroup.user_id == current_user.id)
-        .order_by(InquiryGroup.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    groups = result.scalars().all()
-    
-    # Calculate item counts for the lightweight response
-    for group in groups:
-        group.item_count = len(group.items)
+    stmt = inquiry_list_query().where(InquiryGroup.user_id == current_user.id)
+    page = await paginate(db, stmt, keys=(InquiryGroup.created_at, InquiryGroup.id), limit=limit, cursor=cursor, scalars=False)
+    groups = with_cursor_headers(response, page)
 
-    return groups
+    # The dashboard cards render each group's items
+    items = await load_list_items(db, [group.id for group in groups])
+    return [{**group._mapping, "items": items[group.id]} for group in groups]
 
 
 @router.get("/my/{group_id}", response_model=InquiryGroupResponse, status_code=status.HTTP_200_OK)
@@ -212,7 +205,7 @@ async def add_item_to_inquiry(
     if group.status != "DRAFT":
         raise HTTPException(400, "Cannot modify inquiry not in DRAFT status")
 
-    price = await calculate_item_estimated_price(item, db)
+    price, = await price_inquiry_items([item], db)
 
     db.add(
         InquiryItem(
@@ -375,17 +368,8 @@ async def reorder_inquiry(
             detail="Inquiry not found"
         )
 
-    new_group = InquiryGroup(
-        user_id=current_user.id,
-        status="DRAFT"
-    )
-
-    db.add(new_group)
-    await db.flush()
-
-    for item in group.items:
-
-        item_schema = InquiryItemCreate(
+    item_schemas = [
+        InquiryItemCreate(
             product_id=item.product_id,
             subproduct_id=item.subproduct_id,
             service_id=item.service_id,
@@ -395,13 +379,20 @@ async def reorder_inquiry(
             notes=item.notes,
             images=item.images
         )
+        for item in group.items
+    ]
+    prices = await price_inquiry_items(item_schemas, db)
 
-        estimated_price = await calculate_item_estimated_price(
-            item_schema,
-            db
-        )
+    new_group = InquiryGroup(
+        user_id=current_user.id,
+        status="DRAFT"
+    )
 
-        new_item = InquiryItem(
+    db.add(new_group)
+    await db.flush()
+
+    db.add_all([
+        InquiryItem(
             group_id=new_group.id,
             product_id=item.product_id,
             subproduct_id=item.subproduct_id,
@@ -413,8 +404,8 @@ async def reorder_inquiry(
             images=item.images,
             estimated_price=estimated_price
         )
-
-        db.add(new_item)
+        for item, estimated_price in zip(item_schemas, prices)
+    ])
 
     await db.commit()
 
@@ -1,78 +1,59 @@
+from typing import Dict, List, Sequence
+from uuid import UUID
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import String, case, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.sql import Select
 from app.modules.services.models import SubService
 from app.modules.products.models import SubProduct
 from app.modules.inquiry.schemas import InquiryItemCreate
+from app.modules.inquiry.pricing import price_item, price_items
 
 
 async def calculate_item_estimated_price(item: InquiryItemCreate, db: AsyncSession) -> float:
-    estimated_price = 0.0
-
+    """Validate and price a single item (see inquiry/pricing.py for the rules)."""
     if item.subservice_id:
         sub_service = (await db.execute(
             select(SubService).where(SubService.id == item.subservice_id)
         )).scalar_one_or_none()
-        if not sub_service:
-            raise HTTPException(404, f"SubService {item.subservice_id} not found")
-        if not sub_service.is_active:
-            raise HTTPException(400, "This service is currently unavailable")
-        if item.quantity < sub_service.minimum_quantity:
-            raise HTTPException(400, f"Minimum quantity for '{sub_service.name}' is {sub_service.minimum_quantity}")
-        estimated_price = sub_service.price_per_unit
-
-    elif item.subproduct_id:
+        return price_item(item, sub_service=sub_service)
+
+    if item.subproduct_id:
         sub_product = (await db.execute(
             select(SubProduct).where(SubProduct.id == item.subproduct_id)
         )).scalar_one_or_none()
-        if not sub_product:
-            raise HTTPException(404, f"SubProduct {item.subproduct_id} not found")
-        if not sub_product.is_active:
-            raise HTTPException(400, "This product is currently unavailable")
-        if item.quantity < sub_product.minimum_quantity:
-            raise HTTPException(400, f"Minimum quantity for '{sub_product.name}' is {sub_product.minimum_quantity}")
-
-        base_price = sub_product.base_price
-        if item.selected_options and sub_product.config_schema:
-            config = sub_product.config_schema
-            sections_map = {
-                s["key"]: s
-                for s in (config.get("sections", []) if isinstance(config, dict) else [])
-                if isinstance(s, dict) and "key" in s
-            }
-            for key, val in item.selected_options.items():
-                if key not in sections_map:
-                    raise HTTPException(400, f"Invalid option category: {key}")
-                section = sections_map[key]
-                if section.get("type") in ["dropdown", "radio"]:
-                    opts = {str(o["value"]): float(o.get("price_mod", 0)) for o in section.get("options", []) if isinstance(o, dict)}
-                    
-                    if section.get("type") == "dropdown":
-                        val_list = val if isinstance(val, list) else [val]
-                        for v in val_list:
-                            if str(v) not in opts:
-                                raise HTTPException(400, f"Invalid value '{v}' for '{key}'")
-                            base_price += opts[str(v)]
-                    else:
-                        if str(val) not in opts:
-                            raise HTTPException(400, f"Invalid value '{val}' for '{key}'")
-                        base_price += opts[str(val)]
-                elif section.get("type") == "number_input":
-                    try:
-                        user_val = float(val or 0)
-                        default_val = float(section.get("default_val", 0))
-                        ppu = float(section.get("price_per_unit", 0))
-                        base_price += (user_val - default_val) * ppu
-                    except (ValueError, TypeError):
-                        pass
-        estimated_price = base_price
-
-    return estimated_price
+        return price_item(item, sub_product=sub_product)
+
+    return 0.0
 
 
+
+async def price_inquiry_items(items: Sequence[InquiryItemCreate], db: AsyncSession) -> List[float]:
+    """
+    Validate and price every item of an inquiry with at most two queries
+    (one IN (...) per catalog table), however many lines it has.
+    Raises the same errors as calculate_item_estimated_price, for the first bad item.
+    """
+    service_ids = {item.subservice_id for item in items if item.subservice_id}
+    product_ids = {item.subproduct_id for item in items if item.subproduct_id and not item.subservice_id}
+
+    sub_services = {}
+    if service_ids:
+        rows = await db.execute(select(SubService).where(SubService.id.in_(service_ids)))
+        sub_services = {row.id: row for row in rows.scalars()}
+
+    sub_products = {}
+    if product_ids:
+        rows = await db.execute(select(SubProduct).where(SubProduct.id.in_(product_ids)))
+        sub_products = {row.id: row for row in rows.scalars()}
+
+    return price_items(items, sub_products, sub_services)
+
 import logging
 from app.modules.orders.models import Order, OrderMilestone
-from app.modules.inquiry.models import InquiryGroup
+from app.modules.inquiry.models import InquiryGroup, InquiryItem, QuoteVersion
 
 logger = logging.getLogger(__name__)
 
@@ -194,4 +175,83 @@ async def convert_inquiry_to_order(db: AsyncSession, group: InquiryGroup, billin
             
     await db.flush()
     logger.info(f"Successfully converted Inquiry {group.id} to Order {new_order.id}")
-    return new_order
\ No newline at end of file
+    return new_order
+
+
+def inquiry_list_query() -> Select:
+    """
+    Column-only projection for inquiry listings (InquiryGroupListResponse):
+    group columns, the active quote's total and a correlated item count, in
+    one query with no ORM objects or eager-loaded graph behind it.
+    """
+    item_count = (
+        select(func.count())
+        .where(InquiryItem.group_id == InquiryGroup.id)
+        .correlate(InquiryGroup)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            InquiryGroup.id, InquiryGroup.display_id, InquiryGroup.user_id, InquiryGroup.status,
+            InquiryGroup.active_quote_id, QuoteVersion.total_price,
+            InquiryGroup.quote_email_status, InquiryGroup.admin_notes, InquiryGroup.created_at,
+            item_count.label("item_count"),
+        )
+        .outerjoin(QuoteVersion, QuoteVersion.id == InquiryGroup.active_quote_id)
+    )
+
+
+def _list_items_query(group_ids: Sequence[UUID]) -> Select:
+    """
+    InquiryItemResponse fields for many groups in one statement: the catalog
+    names, display images and tax fields are resolved with outer joins and
+    mirror InquiryItem's properties, so no catalog rows are loaded.
+    """
+    from app.modules.products.models import Product
+    from app.modules.services.models import Service
+
+    display_images = case(
+        (func.cardinality(InquiryItem.images) > 0, InquiryItem.images),
+        (func.cardinality(SubProduct.images) > 0, SubProduct.images),
+        (func.coalesce(Product.cover_image, "") != "", array([Product.cover_image])),
+        (func.cardinality(SubService.images) > 0, SubService.images),
+        (func.coalesce(Service.cover_image, "") != "", array([Service.cover_image])),
+        else_=literal([], ARRAY(String)),
+    )
+    gst_rate = case(
+        (SubProduct.id.is_not(None), func.coalesce(SubProduct.gst_rate, 0.0)),
+        (SubService.id.is_not(None), func.coalesce(SubService.gst_rate, 0.0)),
+        else_=0.0,
+    )
+    hsn_code = case(
+        (SubProduct.id.is_not(None), SubProduct.hsn_code),
+        (SubService.id.is_not(None), SubService.hsn_code),
+    )
+    return (
+        select(
+            InquiryItem.id, InquiryItem.group_id.label("inquiry_group_id"),
+            InquiryItem.product_id, InquiryItem.subproduct_id,
+            InquiryItem.service_id, InquiryItem.subservice_id,
+            InquiryItem.quantity, InquiryItem.selected_options, InquiryItem.notes, InquiryItem.images,
+            InquiryItem.line_item_price, InquiryItem.estimated_price,
+            Product.name.label("product_name"), SubProduct.name.label("subproduct_name"),
+            Service.name.label("service_name"), SubService.name.label("subservice_name"),
+            display_images.label("display_images"),
+            gst_rate.label("gst_rate"), hsn_code.label("hsn_code"),
+        )
+        .outerjoin(Product, Product.id == InquiryItem.product_id)
+        .outerjoin(SubProduct, SubProduct.id == InquiryItem.subproduct_id)
+        .outerjoin(Service, Service.id == InquiryItem.service_id)
+        .outerjoin(SubService, SubService.id == InquiryItem.subservice_id)
+        .where(InquiryItem.group_id.in_(group_ids))
+        .order_by(InquiryItem.id)
+    )
+
+
+async def load_list_items(db: AsyncSession, group_ids: Sequence[UUID]) -> Dict[UUID, list]:
+    """Item rows of a page of listed groups (one query), in creation order."""
+    items: Dict[UUID, list] = {group_id: [] for group_id in group_ids}
+    if group_ids:
+        for row in await db.execute(_list_items_query(group_ids)):
+            items[row.inquiry_group_id].append(row)
+    return items
@@ -0,0 +1,100 @@
+"""
+Admin roster.
+
+The ids of all admin users, cached in Redis as one JSON list under
+`admins:roster` so admin notification fan-out needs no `users` query:
+
+    await admin_roster.ids(db)       → cached ids (loaded with a column-only SELECT on a miss)
+    await admin_roster.invalidate()  → drop the cache (every worker sees it at once)
+
+The cache is invalidated automatically when a committed ORM flush creates,
+deletes, or changes the `admin` flag of a User. Bulk statements
+(`update(User)` / `delete(User)`) bypass the ORM, so code issuing them against
+admins must call `invalidate()` itself; `admin_roster_ttl_seconds` bounds how
+long anything missed can linger. Redis errors fall back to the database.
+"""
+
+import json
+import logging
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.core.task_registry import fire
+from app.modules.users.models import User
+
+logger = logging.getLogger(__name__)
+
+ADMIN_ROSTER_KEY = "admins:roster"
+_DIRTY_FLAG = "admin_roster_dirty"
+
+
+class AdminRoster:
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    async def ids(self, db: AsyncSession) -> List[UUID]:
+        try:
+            cached = await redis_client.get(ADMIN_ROSTER_KEY)
+            if cached is not None:
+                return [UUID(uid) for uid in json.loads(cached)]
+        except Exception as e:
+            logger.warning(f"Admin roster read failed: {e}")
+
+        result = await db.execute(select(User.id).where(User.admin == True))
+        ids = list(result.scalars().all())
+        try:
+            await redis_client.set(ADMIN_ROSTER_KEY, json.dumps([str(uid) for uid in ids]), ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Admin roster write failed: {e}")
+        return ids
+
+    async def invalidate(self) -> None:
+        try:
+            await redis_client.delete(ADMIN_ROSTER_KEY)
+        except Exception as e:
+            logger.error(f"Admin roster invalidation failed: {e}")
+
+
+admin_roster = AdminRoster(ttl=settings.admin_roster_ttl_seconds)
+
+
+# ── ORM hooks: invalidate once the change is committed ─────────
+
+def _admin_changed(obj) -> bool:
+    return isinstance(obj, User) and inspect(obj).attrs.admin.history.has_changes()
+
+
+def _created_admin(obj) -> bool:
+    return isinstance(obj, User) and inspect(obj).dict.get("admin") is True
+
+
+def _deleted_admin(obj) -> bool:
+    # Unloaded flag: assume the row may have been an admin
+    return isinstance(obj, User) and inspect(obj).dict.get("admin", True) is not False
+
+
+@event.listens_for(Session, "after_flush")
+def _note_admin_changes(session: Session, flush_context) -> None:
+    if (
+        any(_created_admin(obj) for obj in session.new)
+        or any(_admin_changed(obj) for obj in session.dirty)
+        or any(_deleted_admin(obj) for obj in session.deleted)
+    ):
+        session.info[_DIRTY_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_FLAG, False):
+        fire(admin_roster.invalidate())
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_admin_changes(session: Session) -> None:
+    session.info.pop(_DIRTY_FLAG, None)
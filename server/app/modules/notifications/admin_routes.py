@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.modules.auth import get_current_admin_user
 from app.modules.users.models import User
 
 from app.modules.notifications.models import Notification, EmailLog
+from app.modules.notifications.counters import notification_counters
 from app.modules.notifications.schemas import (
     NotificationCreate,
     NotificationResponse,
@@ -16,21 +20,16 @@ router = APIRouter()
 
 @router.get("/", response_model=list[NotificationResponse], status_code=status.HTTP_200_OK)
 async def get_my_admin_notifications(
+    response: Response,
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(50, ge=1, le=200),
 ):
     """[ADMIN] Get personal inbox notifications aimed at this admin."""
-    stmt = (
-        select(Notification)
-        .where(Notification.user_id == admin.id)
-        .order_by(Notification.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    stmt = select(Notification).where(Notification.user_id == admin.id)
+    page = await paginate(db, stmt, keys=(Notification.created_at, Notification.id), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
 
 @router.patch("/mark-all-read", status_code=status.HTTP_200_OK)
 async def mark_all_admin_read(
@@ -39,11 +38,12 @@ async def mark_all_admin_read(
 ):
     """[ADMIN] Mark all my personal notifications as read."""
     from sqlalchemy import update
-    await db.execute(
+    result = await db.execute(
         update(Notification)
         .where(Notification.user_id == admin.id, Notification.is_read == False)
         .values(is_read=True)
     )
+    notification_counters.stage(db, admin.id, unread=-result.rowcount)
     await db.commit()
     return {"message": "All notifications marked as read"}
 
@@ -71,9 +71,16 @@ async def delete_single_admin_notification(
 ):
     """[ADMIN] Delete a single notification."""
     from sqlalchemy import delete
-    result = await db.execute(delete(Notification).where(Notification.id == id, Notification.user_id == admin.id))
+    result = await db.execute(
+        delete(Notification)
+        .where(Notification.id == id, Notification.user_id == admin.id)
+        .returning(Notification.is_read)
+    )
+    is_read = result.scalar_one_or_none()
+    if is_read is not None:
+        notification_counters.stage(db, admin.id, unread=0 if is_read else -1, total=-1)
     await db.commit()
-    if result.rowcount == 0:
+    if is_read is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Notification not found")
     return {"message": "Notification deleted"}
 
@@ -102,17 +109,12 @@ async def send_notification(
 
 @router.get("/email-logs", status_code=status.HTTP_200_OK)
 async def get_email_logs(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(100, ge=1, le=200),
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """[ADMIN] Get the last 100 email events."""
-    stmt = (
-        select(EmailLog)
-        .order_by(EmailLog.sent_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    """[ADMIN] Get the latest email events, newest first."""
+    page = await paginate(db, select(EmailLog), keys=(EmailLog.sent_at, EmailLog.id), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
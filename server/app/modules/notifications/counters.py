@@ -0,0 +1,246 @@
+"""
+Notification counters.
+
+Each user's unread / total notification counts live in one Redis hash,
+`notif:counts:{user_id}` → {unread, total}, so the bell icon is a single HGET:
+
+    await notification_counters.unread(db, user_id)   → HGET (one COUNT query on a miss)
+    await notification_counters.get(db, user_id)      → (unread, total)
+
+Writes never touch Redis directly. They stage deltas on the session and
+the deltas are applied once the transaction commits (dropped on rollback):
+
+  - ORM-tracked Notification inserts / deletes / is_read changes are staged
+    automatically by the session hooks at the bottom of this module
+  - Core statements stage their own effect with `stage()` (read-all via its
+    rowcount, deletes via RETURNING is_read), or `stage_broadcast()` for the
+    cached users a broadcast INSERT reported back (see `cached_user_ids()`)
+
+Deltas are applied by a Lua script that only touches hashes that already
+exist, so a missing hash is always rebuilt from Postgres rather than from a
+partial increment. Each affected user also gets a `notification_counts`
+SSE event carrying the delta, so clients can stop polling.
+
+Every cached user is remembered in `notif:counts:users`; `reconcile()`
+(a periodic task) recomputes those hashes from Postgres in batches, which
+bounds any drift from races between a rebuild and a concurrent write.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.redis import redis_client
+from app.core.sse import sse_manager
+from app.core.task_registry import fire
+from app.modules.notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+TRACKED_USERS_KEY = "notif:counts:users"
+_DELTAS = "notification_count_deltas"
+_BROADCAST_DELTAS = "notification_count_broadcast_deltas"
+
+# KEYS[1] = counts hash; ARGV[1] = unread delta, ARGV[2] = total delta
+_APPLY_DELTA_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], 'unread', ARGV[1])
+redis.call('HINCRBY', KEYS[1], 'total', ARGV[2])
+return 1
+"""
+
+_apply_delta_script = redis_client.register_script(_APPLY_DELTA_LUA)
+
+
+def _counts_key(user_id) -> str:
+    return f"notif:counts:{user_id}"
+
+
+def _counts_query(user_ids: Iterable) -> Select:
+    return (
+        select(
+            Notification.user_id,
+            func.count().filter(Notification.is_read == False),
+            func.count(),
+        )
+        .where(Notification.user_id.in_(list(user_ids)))
+        .group_by(Notification.user_id)
+    )
+
+
+class NotificationCounters:
+    def __init__(self, ttl: int, batch_size: int = 1000):
+        self.ttl = ttl
+        self.batch_size = batch_size
+
+    # ── Reads ──────────────────────────────────────────────────
+
+    async def unread(self, db: AsyncSession, user_id) -> int:
+        try:
+            cached = await redis_client.hget(_counts_key(user_id), "unread")
+            if cached is not None:
+                return max(int(cached), 0)
+        except Exception as e:
+            logger.warning(f"Notification counter read failed for {user_id}: {e}")
+        unread, _ = await self._rebuild(db, user_id)
+        return unread
+
+    async def get(self, db: AsyncSession, user_id) -> Tuple[int, int]:
+        """(unread, total) for one user."""
+        try:
+            unread, total = await redis_client.hmget(_counts_key(user_id), "unread", "total")
+            if unread is not None and total is not None:
+                return max(int(unread), 0), max(int(total), 0)
+        except Exception as e:
+            logger.warning(f"Notification counter read failed for {user_id}: {e}")
+        return await self._rebuild(db, user_id)
+
+    async def _rebuild(self, db: AsyncSession, user_id) -> Tuple[int, int]:
+        row = (await db.execute(_counts_query([user_id]))).first()
+        unread, total = (row[1], row[2]) if row else (0, 0)
+        await self._store({str(user_id): (unread, total)})
+        return unread, total
+
+    async def cached_user_ids(self) -> Set[str]:
+        """Users that may have a counts hash; only these need a broadcast's deltas."""
+        try:
+            return await redis_client.smembers(TRACKED_USERS_KEY)
+        except Exception as e:
+            logger.warning(f"Notification counter tracked-user read failed: {e}")
+            return set()
+
+    async def _store(self, counts: Dict[str, Tuple[int, int]]) -> None:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for user_id, (unread, total) in counts.items():
+                    key = _counts_key(user_id)
+                    await pipe.hset(key, mapping={"unread": unread, "total": total})
+                    await pipe.expire(key, self.ttl)
+                await pipe.sadd(TRACKED_USERS_KEY, *counts.keys())
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Notification counter write failed for {len(counts)} users: {e}")
+
+    # ── Writes (applied after commit) ──────────────────────────
+
+    def stage(self, db, user_id, unread: int = 0, total: int = 0) -> None:
+        """Record a change to apply once `db`'s transaction commits."""
+        if not unread and not total:
+            return
+        deltas = db.info.setdefault(_DELTAS, defaultdict(lambda: [0, 0]))
+        delta = deltas[str(user_id)]
+        delta[0] += unread
+        delta[1] += total
+
+    def stage_broadcast(self, db, user_ids: Iterable) -> None:
+        """One new unread notification each, without a per-user SSE event."""
+        deltas = db.info.setdefault(_BROADCAST_DELTAS, defaultdict(lambda: [0, 0]))
+        for user_id in user_ids:
+            delta = deltas[str(user_id)]
+            delta[0] += 1
+            delta[1] += 1
+
+    async def apply(self, deltas: Dict[str, List[int]], publish: bool = True) -> None:
+        deltas = {uid: d for uid, d in deltas.items() if d[0] or d[1]}
+        if not deltas:
+            return
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for user_id, (unread, total) in deltas.items():
+                    await _apply_delta_script(keys=[_counts_key(user_id)], args=[unread, total], client=pipe)
+                await pipe.execute()
+        except Exception as e:
+            # Drop the hashes instead; the next read rebuilds them
+            logger.warning(f"Notification counter update failed, invalidating {len(deltas)} users: {e}")
+            try:
+                await redis_client.delete(*(_counts_key(uid) for uid in deltas))
+            except Exception:
+                pass
+
+        if publish:
+            for user_id, (unread, total) in deltas.items():
+                await sse_manager.publish(user_id, "notification_counts", {"unread_delta": unread, "total_delta": total})
+
+    # ── Reconciliation ─────────────────────────────────────────
+
+    async def reconcile(self) -> int:
+        """Recompute every cached user's counts from Postgres. Returns users reconciled."""
+        reconciled = 0
+        async with AsyncSessionLocal() as db:
+            async for batch in self._tracked_batches():
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for user_id in batch:
+                        await pipe.exists(_counts_key(user_id))
+                    cached = await pipe.execute()
+                live = [uid for uid, exists in zip(batch, cached) if exists]
+                expired = [uid for uid, exists in zip(batch, cached) if not exists]
+                if expired:
+                    await redis_client.srem(TRACKED_USERS_KEY, *expired)
+                if not live:
+                    continue
+
+                counts = {uid: (0, 0) for uid in live}
+                for user_id, unread, total in await db.execute(_counts_query(UUID(uid) for uid in live)):
+                    counts[str(user_id)] = (unread, total)
+                await self._store(counts)
+                reconciled += len(live)
+        return reconciled
+
+    async def _tracked_batches(self):
+        batch: List[str] = []
+        async for user_id in redis_client.sscan_iter(TRACKED_USERS_KEY, count=self.batch_size):
+            batch.append(user_id)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+notification_counters = NotificationCounters(ttl=settings.notification_counter_ttl_seconds)
+
+
+# ── ORM hooks: stage tracked Notification changes, apply after commit ──
+
+@event.listens_for(Session, "after_flush")
+def _stage_notification_changes(session: Session, flush_context) -> None:
+    for obj in session.new:
+        if isinstance(obj, Notification):
+            unread = not inspect(obj).dict.get("is_read")
+            notification_counters.stage(session, obj.user_id, unread=int(unread), total=1)
+    for obj in session.deleted:
+        if isinstance(obj, Notification):
+            unread = inspect(obj).dict.get("is_read") is False
+            notification_counters.stage(session, obj.user_id, unread=-int(unread), total=-1)
+    for obj in session.dirty:
+        if isinstance(obj, Notification):
+            added, _, deleted = inspect(obj).attrs.is_read.history
+            if added and deleted and bool(added[0]) != bool(deleted[0]):
+                notification_counters.stage(session, obj.user_id, unread=-1 if added[0] else 1)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    deltas = session.info.pop(_DELTAS, None)
+    if deltas:
+        fire(notification_counters.apply(dict(deltas)))
+    broadcast_deltas = session.info.pop(_BROADCAST_DELTAS, None)
+    if broadcast_deltas:
+        # Clients learn about broadcasts from the single broadcast SSE event
+        fire(notification_counters.apply(dict(broadcast_deltas), publish=False))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged(session: Session) -> None:
+    session.info.pop(_DELTAS, None)
+    session.info.pop(_BROADCAST_DELTAS, None)
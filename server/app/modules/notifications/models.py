@@ -2,7 +2,7 @@
 Notification model — admin-to-user messages with read tracking.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Uuid, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Uuid, JSON, Index
 from app.core.database import Base
 
 
@@ -10,13 +10,17 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     metadata_ = Column("metadata", JSON, nullable=True)
 
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_notifications_created_at_id", "created_at", "id"),
+    )
 
     def __repr__(self):
         return f"Notification(id={self.id}, user_id={self.user_id}, is_read={self.is_read})"
@@ -38,5 +42,9 @@ class EmailLog(Base):
     sent_at = Column(DateTime(timezone=True), server_default=func.now())
     metadata_ = Column("metadata", JSON, nullable=True) # e.g. template_id, etc.
 
+    __table_args__ = (
+        Index("ix_email_logs_sent_at_id", "sent_at", "id"),
+    )
+
     def __repr__(self):
         return f"EmailLog(id={self.id}, to={self.recipient}, status={self.status})"
@@ -1,13 +1,14 @@
 import logging
 from typing import Optional
 import asyncio  
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update
+from sqlalchemy import select, update
 from jose import jwt, JWTError
 
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.modules.auth import get_current_user, get_current_admin_user
 from app.modules.users.models import User
 from app.core.config import settings
@@ -23,6 +24,7 @@ from app.modules.notifications.schemas import (
     UnreadCountResponse,
 )
 from app.modules.notifications.service import NotificationService
+from app.modules.notifications.counters import notification_counters
 
 logger = logging.getLogger(__name__)
 
@@ -95,31 +97,32 @@ async def send_bulk_notification(
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """[ADMIN] Send a notification to ALL users."""
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-
-    if not users:
+    """[ADMIN] Send a notification to ALL users, or to those matching `audience`."""
+    total_sent = await NotificationService.broadcast(db, payload.title, payload.message, payload.audience)
+    if not total_sent:
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No users found")
 
-    notifications = []
-    for user in users:
-        notif = Notification(user_id=user.id, title=payload.title, message=payload.message)
-        db.add(notif)
-        notifications.append(notif)
-
     await db.commit()
 
+    # One event on the broadcast channel reaches every connected user stream
+    await sse_manager.publish_broadcast("broadcast", {
+        "title": payload.title,
+        "message": payload.message,
+        "audience": payload.audience.model_dump(exclude_none=True),
+    })
+
     return {
-        "message": f"Notification sent to {len(notifications)} users",
-        "total_sent": len(notifications),
+        "message": f"Notification sent to {total_sent} users",
+        "total_sent": total_sent,
     }
 
 
 @router.get("/admin/all", response_model=list[NotificationResponse])
 async def admin_list_all_notifications(
-    skip: int = 0,
-    limit: int = 50,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(50, ge=1, le=200),
     user_id: Optional[int] = Query(None, description="Filter by user"),
     is_read: Optional[bool] = Query(None, description="Filter by read status"),
     admin: User = Depends(get_current_admin_user),
@@ -132,17 +135,17 @@ async def admin_list_all_notifications(
     if is_read is not None:
         query = query.where(Notification.is_read == is_read)
 
-    query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
+    page = await paginate(db, query, keys=(Notification.created_at, Notification.id), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
 
 
 # ==================== USER ENDPOINTS ====================
 
 @router.get("/", response_model=NotificationListResponse)
 async def list_my_notifications(
-    skip: int = 0,
-    limit: int = 20,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -151,23 +154,18 @@ async def list_my_notifications(
     await NotificationService.lazy_cleanup(db, current_user.id)
     await db.commit() # Commit the deletions
         
-    base = select(Notification).where(Notification.user_id == current_user.id)
-
-    # Total count
-    total_q = select(func.count()).select_from(base.subquery())
-    total = (await db.execute(total_q)).scalar() or 0
-
-    # Unread count
-    unread_q = select(func.count()).select_from(
-        base.where(Notification.is_read == False).subquery()
-    )
-    unread = (await db.execute(unread_q)).scalar() or 0
-
-    # Paginated notifications
-    result = await db.execute(
-        base.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+    # Counts come from the Redis counters (one HMGET)
+    unread, total = await notification_counters.get(db, current_user.id)
+
+    # Keyset-paginated notifications
+    page = await paginate(
+        db,
+        select(Notification).where(Notification.user_id == current_user.id),
+        keys=(Notification.created_at, Notification.id),
+        limit=limit,
+        cursor=cursor,
     )
-    notifications = result.scalars().all()
+    notifications = with_cursor_headers(response, page)
 
     return NotificationListResponse(
         total=total,
@@ -181,13 +179,8 @@ async def unread_count(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get the number of unread notifications for the current user."""
-    result = await db.execute(
-        select(func.count())
-        .select_from(Notification)
-        .where(Notification.user_id == current_user.id, Notification.is_read == False)
-    )
-    return UnreadCountResponse(unread=result.scalar() or 0)
+    """Get the number of unread notifications for the current user (one Redis HGET)."""
+    return UnreadCountResponse(unread=await notification_counters.unread(db, current_user.id))
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
@@ -220,11 +213,12 @@ async def mark_all_as_read(
     db: AsyncSession = Depends(get_db),
 ):
     """Mark all notifications as read for the current user."""
-    await db.execute(
+    result = await db.execute(
         update(Notification)
         .where(Notification.user_id == current_user.id, Notification.is_read == False)
         .values(is_read=True)
     )
+    notification_counters.stage(db, current_user.id, unread=-result.rowcount)
     await db.commit()
     return {"message": "All notifications marked as read"}
 
@@ -235,9 +229,13 @@ async def clear_all_notifications(
 ):
     """Delete all notifications for the current user."""
     from sqlalchemy import delete
-    await db.execute(
-        delete(Notification).where(Notification.user_id == current_user.id)
+    result = await db.execute(
+        delete(Notification)
+        .where(Notification.user_id == current_user.id)
+        .returning(Notification.is_read)
     )
+    deleted = result.scalars().all()
+    notification_counters.stage(db, current_user.id, unread=-deleted.count(False), total=-len(deleted))
     await db.commit()
     return {"message": "All notifications cleared"}
 
@@ -253,10 +251,13 @@ async def delete_notification(
         delete(Notification).where(
             Notification.id == notification_id,
             Notification.user_id == current_user.id,
-        )
+        ).returning(Notification.is_read)
     )
+    is_read = result.scalar_one_or_none()
+    if is_read is not None:
+        notification_counters.stage(db, current_user.id, unread=0 if is_read else -1, total=-1)
     await db.commit()
-    if result.rowcount == 0:
+    if is_read is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
     return {"message": "Notification deleted"}
 
@@ -305,17 +306,12 @@ async def brevo_webhook(request: Request, db: AsyncSession = Depends(get_db)):
                 update(User).where(User.email == email).values(email_bounced=True)
             )
             # 2.2 Notify Admins about the bounce
-            # Find all admins
-            admin_stmt = select(User).where(User.admin == True)
-            admins_res = await db.execute(admin_stmt)
-            admins = admins_res.scalars().all()
-            for admin in admins:
-                db.add(Notification(
-                    user_id=admin.id,
-                    title="Critical: Email Bounced",
-                    message=f"Email to {email} ({event}) failed. User marked as bounced.",
-                    metadata_={"type": "email_bounce", "email": email, "event": event}
-                ))
+            await NotificationService.notify_admins(
+                db,
+                title="Critical: Email Bounced",
+                message=f"Email to {email} ({event}) failed. User marked as bounced.",
+                metadata={"type": "email_bounce", "email": email, "event": event},
+            )
 
         # 3. Specific Logic for Opened/Clicked (can use for stats later)
         if event == "opened":
@@ -29,10 +29,18 @@ class NotificationCreate(BaseModel):
     metadata: Optional[dict] = None
 
 
+class NotificationAudience(BaseModel):
+    """Optional filters for a bulk notification; unset fields don't filter."""
+    active: Optional[bool] = None
+    phone_verified: Optional[bool] = None
+    has_orders: Optional[bool] = None
+
+
 class NotificationBulkCreate(BaseModel):
-    """Admin sends a notification to ALL users."""
+    """Admin sends a notification to ALL users (or the audience they match)."""
     title: str = Field(..., max_length=200)
     message: str
+    audience: NotificationAudience = Field(default_factory=NotificationAudience)
 
 
 # ── Responses ────────────────────────────────────────────────
@@ -1,8 +1,14 @@
-from sqlalchemy import select
+from sqlalchemy import any_, exists, func, insert, literal, select, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.modules.users.models import User
+from app.modules.orders.models import Order
 from app.modules.notifications.models import Notification
+from app.modules.notifications.schemas import NotificationAudience
+from app.modules.notifications.admin_roster import admin_roster
+from app.modules.notifications.counters import notification_counters
 import logging
+from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
@@ -24,27 +30,68 @@ class NotificationService:
                 if sender_name not in message:
                     final_message = f"{sender_name}: {message}"
 
-            # Find all admins
-            result = await db.execute(select(User).where(User.admin == True))
-            admins = result.scalars().all()
-            
-            if not admins:
+            # Cached admin ids; every admin's row goes out in one executemany INSERT
+            admin_ids = await admin_roster.ids(db)
+            if not admin_ids:
                 logger.warning("No admins found to notify")
                 return
-                
-            for admin in admins:
-                notif = Notification(
-                    user_id=admin.id,
-                    title=title,
-                    message=final_message,
-                    metadata_=metadata
-                )
-                db.add(notif)
-            
+
+            await db.execute(
+                insert(Notification),
+                [
+                    {"user_id": admin_id, "title": title, "message": final_message, "metadata_": metadata}
+                    for admin_id in admin_ids
+                ],
+            )
+            for admin_id in admin_ids:
+                notification_counters.stage(db, admin_id, unread=1, total=1)
+
             # We don't commit here; let the caller handle the transaction
         except Exception as e:
             logger.error(f"Failed to notify admins: {e}")
 
+    @staticmethod
+    async def broadcast(
+        db: AsyncSession,
+        title: str,
+        message: str,
+        audience: NotificationAudience,
+    ) -> int:
+        """
+        Create a notification for every user matching `audience` with one
+        server-side INSERT ... SELECT. Only the recipients that have cached
+        notification counts come back (RETURNING, filtered in the same
+        statement), so counters follow exactly the rows inserted.
+        Returns the number of notifications created. The caller commits.
+        """
+        conditions = []
+        if audience.active is not None:
+            conditions.append(User.is_active == audience.active)
+        if audience.phone_verified is not None:
+            conditions.append(User.is_phone_verified == audience.phone_verified)
+        if audience.has_orders is not None:
+            has_orders = exists().where(Order.user_id == User.id)
+            conditions.append(has_orders if audience.has_orders else ~has_orders)
+
+        recipients = select(User.id, literal(title), literal(message)).where(*conditions)
+        inserted = (
+            insert(Notification)
+            .from_select(["user_id", "title", "message"], recipients)
+            .returning(Notification.user_id)
+            .cte("inserted")
+        )
+        cached = [UUID(uid) for uid in await notification_counters.cached_user_ids()]
+        total_sent, cached_recipients = (await db.execute(
+            select(
+                func.count(),
+                func.array_agg(inserted.c.user_id).filter(
+                    inserted.c.user_id == any_(literal(cached, ARRAY(Uuid)))
+                ),
+            ).select_from(inserted)
+        )).one()
+        notification_counters.stage_broadcast(db, cached_recipients or ())
+        return total_sent
+
     @staticmethod
     async def notify_user(
         db: AsyncSession,
@@ -112,6 +159,7 @@ class NotificationService:
                 )
             )
             result = await db.execute(stmt)
+            notification_counters.stage(db, user_id, total=-result.rowcount)
             logger.info(f"Lazy cleanup for user {user_id}: deleted {result.rowcount} old read notifications")
         except Exception as e:
             logger.error(f"Cleanup failed: {e}")
@@ -8,18 +8,22 @@ Admins can:
   - Review payment declarations (approve / reject)
   - View all pending declarations
   - Update order status (PROCESSING, READY, SHIPPED, DELIVERED, CANCELLED)
+  - Export invoices for a period as a ZIP
 """
 
 import asyncio
 import logging
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.modules.auth.auth import get_current_admin_user
 from app.modules.users.models import User
 from app.core.messaging import get_dispatcher
@@ -60,38 +64,24 @@ def _fire_admin_sse(event: str, data: dict) -> None:
     fire(sse_manager.publish_to_admins(event, data))
 
 
-def _build_user_address(user) -> str:
-    """Build a formatted address string from user's billing address."""
-    if not hasattr(user, 'addresses') or not user.addresses:
-        return ""
-    addr = next((a for a in user.addresses if a.address_type == "BILLING"), None)
-    if not addr:
-        addr = user.addresses[0] if user.addresses else None
-    if not addr:
-        return ""
-    parts = [addr.address_line_1]
-    if addr.address_line_2:
-        parts.append(addr.address_line_2)
-    parts.append(f"{addr.city}, {addr.state} - {addr.pincode}")
-    return ", ".join(parts)
-
-
 # ── Order listing ─────────────────────────────────────────────────────────────
 
 @router.get("/all", response_model=list[OrderListResponse])
 async def list_all_orders(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     limit: int = Query(50, ge=1, le=200),
     status_filter: Optional[OrderStatus] = Query(None),
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     svc = OrderService(db)
-    return await svc.get_all_orders(
+    page = await svc.get_all_orders(
         status_filter=status_filter,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
     )
+    return with_cursor_headers(response, page)
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -213,8 +203,9 @@ async def record_payment(
 
 @router.get("/declarations/all", response_model=list[PaymentDeclarationResponse])
 async def list_all_declarations(
+    response: Response,
     status_filter: Optional[DeclarationStatus] = Query(None),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     limit: int = Query(50, ge=1, le=200),
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
@@ -230,15 +221,16 @@ async def list_all_declarations(
     if status_filter:
         stmt = stmt.where(PaymentDeclaration.status == status_filter)
     
-    stmt = stmt.order_by(PaymentDeclaration.created_at.desc()).offset(skip).limit(limit)
-    
-    declarations = list((await db.execute(stmt)).scalars().all())
-    return declarations
+    page = await paginate(
+        db, stmt, keys=(PaymentDeclaration.created_at, PaymentDeclaration.id), limit=limit, cursor=cursor,
+    )
+    return with_cursor_headers(response, page)
 
 
 @router.get("/declarations/pending", response_model=list[PaymentDeclarationResponse])
 async def get_pending_declarations(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     limit: int = Query(50, ge=1, le=200),
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
@@ -248,18 +240,19 @@ async def get_pending_declarations(
     Oldest first (FIFO) — admin works through the queue in order.
     """
     from sqlalchemy.orm import selectinload
-    declarations = list((await db.execute(
+    stmt = (
         select(PaymentDeclaration)
         .options(
             selectinload(PaymentDeclaration.order),
             selectinload(PaymentDeclaration.milestone)
         )
         .where(PaymentDeclaration.status == DeclarationStatus.PENDING)
-        .order_by(PaymentDeclaration.created_at.asc())
-        .offset(skip)
-        .limit(limit)
-    )).scalars().all())
-    return declarations
+    )
+    page = await paginate(
+        db, stmt, keys=(PaymentDeclaration.created_at, PaymentDeclaration.id), limit=limit, cursor=cursor,
+        descending=False,
+    )
+    return with_cursor_headers(response, page)
 
 
 @router.get("/declarations/{declaration_id}", response_model=PaymentDeclarationResponse)
@@ -590,19 +583,17 @@ async def save_invoice_data(
 @router.get("/{order_id}/invoice-preview")
 async def preview_invoice(
     order_id: UUID,
+    request: Request,
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Generate a preview PDF using the saved invoice_data.
     Falls back to default behavior if invoice_data is not set.
+    Served from the rendered-invoice cache with an ETag.
     """
-    import os
-    import tempfile
-    from fastapi.responses import FileResponse
-    from fastapi.concurrency import run_in_threadpool
-    from sqlalchemy.orm import selectinload
-    from app.modules.orders.service.invoice_generator import generate_simple_invoice
+    from app.modules.orders.service.invoice_cache import invoice_pdf_response
+    from app.modules.orders.service.invoice_export import build_admin_invoice_data
     from app.modules.settings.models import SiteSettings
 
     svc = OrderService(db)
@@ -610,90 +601,60 @@ async def preview_invoice(
     if not order:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Order not found")
 
-    # Build items from invoice_data or warn
-    if order.invoice_data:
-        items = order.invoice_data.get("items", [])
-        inv_meta = order.invoice_data
-    else:
+    if not order.invoice_data:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
             "Invoice data not configured. Please save invoice data first."
         )
 
-    order_num_str = order.order_number or str(order_id)[:8].upper()
-    if order.status in ("PAID", "PARTIALLY_PAID", "COMPLETED"):
-        invoice_number = order.invoice_number or order_num_str.replace("ORD", "INV", 1)
-    else:
-        invoice_number = f"PROFORMA-{order_num_str}"
-
     settings = (await db.execute(select(SiteSettings))).scalar_one_or_none()
-    logo_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-        "static", "logo.png"
-    )
+    invoice_data = build_admin_invoice_data(order, settings)
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        filepath = tmp.name
-
-    await run_in_threadpool(
-        generate_simple_invoice,
-        filepath,
-        {
-            "invoice_number": invoice_number,
-            "invoice_date": order.created_at,
-            "order_data": {
-                "order_id": order_num_str,
-                "status": order.status,
-                "order_date": order.created_at.strftime("%d %b %Y"),
-                "total_amount": float(order.total_amount) if order.total_amount is not None else 0.0,
-                "tax_amount": float(order.tax_amount) if order.tax_amount is not None else 0.0,
-                "shipping_amount": float(inv_meta.get("shipping_amount", 0)),
-                "shipping_gst_rate": float(inv_meta.get("shipping_gst_rate", 0)),
-                "order_discount": float(order.discount_amount) if order.discount_amount is not None else 0.0,
-                "amount_paid": float(order.amount_paid) if order.amount_paid is not None else 0.0,
-                "place_of_supply": inv_meta.get("place_of_supply", ""),
-                "reverse_charge": inv_meta.get("reverse_charge", False),
-                "remarks": inv_meta.get("remarks", "BEING GOODS SALES"),
-                "milestones": [
-                    {
-                        "label": m.label,
-                        "percentage": float(m.percentage),
-                        "amount": float(m.amount),
-                        "status": m.status,
-                    }
-                    for m in sorted(
-                        [ms for ms in order.milestones if ms.split_type == order.split_type],
-                        key=lambda x: x.order_index
-                    )
-                ] if getattr(order, 'milestones', None) else [],
-            },
-            "company_info": {
-                "name": settings.company_name if settings else "My Company",
-                "address": settings.company_address if settings else "",
-                "phone": getattr(settings, 'company_phone', '') if settings else "",
-                "email": getattr(settings, 'company_email', '') if settings else "",
-                "gstin": settings.company_gstin if settings else None,
-                "pan": settings.company_pan if settings else None,
-                "bank_details": settings.bank_details if settings else None,
-                "website": getattr(settings, 'company_website', None) if settings else None,
-            },
-            "customer_info": {
-                "name": order.user.name or "Customer",
-                "email": order.user.email,
-                "phone": order.user.phone or "",
-                "address": _build_user_address(order.user),
-                "place_of_supply": inv_meta.get("place_of_supply") or order.place_of_supply or "Undetermined",
-                "gstin": order.user.gstin or "",
-            },
-            "items": items,
-            "logo_path": logo_path,
-        }
+    return await invoice_pdf_response(
+        request,
+        invoice_data,
+        filename=f"Preview_{invoice_data['invoice_number']}.pdf",
     )
 
-    return FileResponse(
-        filepath,
-        media_type="application/pdf",
-        filename=f"Preview_{invoice_number}.pdf",
+
+@router.get("/invoices/export")
+async def export_invoices(
+    date_from: Optional[date] = Query(None, description="Orders created on or after this date"),
+    date_to: Optional[date] = Query(None, description="Orders created on or before this date"),
+    status_filter: Optional[OrderStatus] = Query(None),
+    admin: User = Depends(get_current_admin_user),
+):
+    """
+    Download a ZIP of invoice PDFs for every order in a date range and/or status.
+    The archive is streamed as invoices are rendered; orders without saved
+    invoice data are listed in SKIPPED.txt.
+    """
+    from app.modules.orders.service.invoice_export import stream_invoice_zip
+
+    if date_from is None and date_to is None and status_filter is None:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            "Provide date_from, date_to or status_filter."
+        )
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "date_from must be on or before date_to.")
+
+    start = datetime.combine(date_from, time.min, tzinfo=timezone.utc) if date_from else None
+    end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=timezone.utc) if date_to else None
+
+    parts = ["invoices", date_from.isoformat() if date_from else None,
+             date_to.isoformat() if date_to else None,
+             status_filter.value if status_filter else None]
+    filename = "_".join(p for p in parts if p) + ".zip"
+
+    return StreamingResponse(
+        stream_invoice_zip(
+            date_from=start,
+            date_to=end,
+            status_filter=status_filter.value if status_filter else None,
+        ),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -39,10 +39,12 @@ class Order(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # (…, created_at, id) composites serve keyset-paginated listings
     __table_args__ = (
         Index('ix_orders_inquiry_id', 'inquiry_id'),
-        Index('ix_orders_user_id', 'user_id'),
-        Index('ix_orders_status', 'status'),
+        Index('ix_orders_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_orders_status_created_at_id', 'status', 'created_at', 'id'),
+        Index('ix_orders_created_at_id', 'created_at', 'id'),
     )
 
     # Relationships
@@ -97,7 +99,7 @@ class Transaction(Base):
     notes = Column(String, nullable=True)
     
     recorded_by_admin = Column(Uuid, ForeignKey('users.id'), nullable=True) # Who approved the manual payment
-    created_at = Column(DateTime(timezone=True), server_default=func.now()) # Never updated
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True) # Never updated
     
     order = relationship("Order", back_populates="transactions")
     milestone = relationship("OrderMilestone", back_populates="transactions")
@@ -124,6 +126,11 @@ class PaymentDeclaration(Base):
     order = relationship("Order", back_populates="declarations")
     milestone = relationship("OrderMilestone", back_populates="declarations")
 
+    __table_args__ = (
+        Index('ix_payment_declarations_status_created_at_id', 'status', 'created_at', 'id'),
+        Index('ix_payment_declarations_created_at_id', 'created_at', 'id'),
+    )
+
     @property
     def order_number(self):
         return self.order.order_number if self.order else None
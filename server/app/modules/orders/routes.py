@@ -12,21 +12,20 @@ No business logic. No if/else on order state. All of that is in services.
 """
 
 import asyncio
+import base64
 import logging
 import os
-import tempfile
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, status
-from fastapi.responses import FileResponse
-from fastapi.concurrency import run_in_threadpool
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.pagination import CURSOR_DESCRIPTION, with_cursor_headers
 from app.modules.auth.auth import get_current_user
 from app.modules.auth.schemas import TokenData
 from app.modules.orders.models import Order
@@ -40,8 +39,8 @@ from app.modules.orders.schemas import (
 )
 from app.modules.orders.service.order import OrderService
 from app.modules.orders.service.payment import PaymentService
-from app.modules.orders.service.invoice_generator import generate_simple_invoice
-from app.modules.orders.service.qr_generator import generate_upi_qr
+from app.modules.orders.service.invoice_cache import invoice_pdf_response
+from app.modules.orders.service.qr_generator import get_upi_qr_png
 from app.modules.notifications.service import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -69,19 +68,21 @@ def _build_user_address(user) -> str:
 
 @router.get("/my", response_model=list[OrderListResponse])
 async def get_my_orders(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     limit: int = Query(20, ge=1, le=100),
     status_filter: Optional[OrderStatus] = Query(None),
     current_user: TokenData = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     svc = OrderService(db)
-    return await svc.get_user_orders(
+    page = await svc.get_user_orders(
         current_user.id,
         status_filter=status_filter,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
     )
+    return with_cursor_headers(response, page)
 
 
 @router.get("/my/{order_id}", response_model=OrderResponse)
@@ -203,6 +204,11 @@ async def request_custom_milestone(
 async def get_payment_qr(
     order_id: UUID,
     milestone_id: UUID,
+    request: Request,
+    response_format: Literal["json", "png"] = Query(
+        "json", alias="format",
+        description="json: base64 data URI with milestone details; png: the raw image",
+    ),
     current_user: TokenData = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -210,6 +216,7 @@ async def get_payment_qr(
     Generate a UPI QR code for a specific milestone.
     UPI ID always comes from settings — never from client.
     Zero cost — bypasses Razorpay entirely.
+    QR images are cached per (UPI ID, name, amount, note) and rendered off the event loop.
     """
     if not settings.company_upi_id:
         raise HTTPException(
@@ -217,34 +224,37 @@ async def get_payment_qr(
             "UPI payments are not configured",
         )
 
-    svc = OrderService(db)
-    order = await svc.get_order(order_id)
+    row = await OrderService(db).get_milestone_for_payment(order_id, milestone_id)
 
-    if not order:
+    if not row:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Order not found")
-    if order.user_id != current_user.id:
+    if row.user_id != current_user.id:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Not your order")
-
-    milestone = next((m for m in order.milestones if m.id == milestone_id), None)
-    if not milestone:
+    if row.milestone_id is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Milestone not found")
-    if milestone.status == "PAID":
+    if row.status == "PAID":
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Milestone already paid")
 
-    qr_base64 = generate_upi_qr(
+    png, etag = await get_upi_qr_png(
         upi_id=settings.company_upi_id,
         name=settings.company_name,
-        amount=milestone.amount,
-        transaction_note=f"Order {str(order_id)[:8].upper()} {milestone.label}",
+        amount=row.amount,
+        transaction_note=f"Order {str(order_id)[:8].upper()} {row.label}",
     )
 
+    if response_format == "png":
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag in (request.headers.get("if-none-match") or ""):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=png, media_type="image/png", headers=headers)
+
     return {
         "order_id": str(order_id),
         "milestone_id": str(milestone_id),
-        "milestone_label": milestone.label,
-        "amount": milestone.amount,
+        "milestone_label": row.label,
+        "amount": row.amount,
         "upi_id": settings.company_upi_id,
-        "qr_code": f"data:image/png;base64,{qr_base64}",
+        "qr_code": f"data:image/png;base64,{base64.b64encode(png).decode('utf-8')}",
     }
 
 
@@ -323,13 +333,14 @@ async def get_my_declarations(
 @router.get("/my/{order_id}/invoice")
 async def get_invoice(
     order_id: UUID,
-    background_tasks: BackgroundTasks,
+    request: Request,
     current_user: TokenData = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Generate PDF invoice.
-    Temp file deleted after response via BackgroundTasks.
+    Served from the rendered-invoice cache with an ETag; a repeat download
+    of an unchanged invoice is a cache hit or a 304.
     """
     from app.modules.inquiry.models import InquiryGroup, InquiryItem
     from app.modules.settings.models import SiteSettings
@@ -457,12 +468,8 @@ async def get_invoice(
     # Logo path: configurable via env or placed in server/static/logo.png
     logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "static", "logo.png")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        filepath = tmp.name
-
-    await run_in_threadpool(
-        generate_simple_invoice,
-        filepath,
+    return await invoice_pdf_response(
+        request,
         {
             "invoice_number": final_invoice_number,
             "invoice_date": order.created_at,
@@ -512,15 +519,7 @@ async def get_invoice(
             },
             "items": items,
             "logo_path": logo_path,
-        }
-    )
-
-    # Delete temp file after response is fully sent
-    background_tasks.add_task(os.unlink, filepath)
-
-    return FileResponse(
-        filepath,
-        media_type="application/pdf",
+        },
         filename=f"invoice_{str(order_id)[:8]}.pdf",
     )
 
@@ -0,0 +1,169 @@
+"""
+Rendered invoice PDF cache.
+
+Invoices are content-addressed: the cache key is a SHA-256 of the exact
+payload handed to the invoice generator (admin invoice_data items,
+order totals, milestones, SiteSettings company info, customer info), plus
+the logo file's mtime and a template version. Any change to those inputs
+produces a new key, so stale PDFs are never served and simply age out of
+the LRU.
+
+PDFs are stored on local disk under a size cap; least-recently-used files
+are evicted first. The key doubles as the HTTP ETag, so repeat downloads
+with If-None-Match are answered with 304 before anything is read.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.modules.orders.service.invoice_renderer import InvoiceRendererBusy, render_invoice
+
+logger = logging.getLogger(__name__)
+
+# Bump when the PDF layout changes so previously cached renders are ignored
+INVOICE_TEMPLATE_VERSION = "1"
+
+
+def invoice_cache_key(invoice_data: Dict[str, Any]) -> str:
+    """Stable hash of everything that affects the rendered PDF."""
+    logo_path = invoice_data.get("logo_path")
+    logo_mtime = os.path.getmtime(logo_path) if logo_path and os.path.isfile(logo_path) else None
+    blob = json.dumps(
+        {"v": INVOICE_TEMPLATE_VERSION, "logo_mtime": logo_mtime, "data": invoice_data},
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class InvoicePDFCache:
+    """Size-capped, LRU-evicted directory of rendered PDFs keyed by content hash."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: Optional["OrderedDict[str, int]"] = None  # key → size, oldest first
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        if self._index is None:
+            os.makedirs(self.directory, exist_ok=True)
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith(".pdf"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self._size = sum(self._index.values())
+        return self._index
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            index = self._load_index()
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                # Evicted by another worker sharing the directory
+                self._size -= index.pop(key, 0)
+                return None
+            if key not in index:
+                index[key] = len(data)
+                self._size += len(data)
+            index.move_to_end(key)
+            try:
+                os.utime(self._path(key))  # keep LRU order across restarts
+            except OSError:
+                pass
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            index = self._load_index()
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))  # atomic for concurrent readers
+            except OSError as e:
+                logger.warning(f"Invoice cache write failed for {key}: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                return
+
+            self._size -= index.pop(key, 0)
+            index[key] = len(data)
+            self._size += len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        index = self._index
+        while self._size > self.max_bytes and len(index) > 1:
+            key, size = index.popitem(last=False)
+            self._size -= size
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Invoice cache eviction failed for {key}: {e}")
+
+
+invoice_cache = InvoicePDFCache(
+    directory=settings.invoice_cache_dir or os.path.join(tempfile.gettempdir(), "invoice-cache"),
+    max_bytes=settings.invoice_cache_max_mb * 1024 * 1024,
+)
+
+
+async def invoice_pdf_response(
+    request: Request,
+    invoice_data: Dict[str, Any],
+    filename: str,
+) -> Response:
+    """
+    Serve an invoice PDF from the cache (rendering on a miss) with an ETag.
+    Returns 304 when the client's If-None-Match already matches.
+    """
+    key = invoice_cache_key(invoice_data)
+    etag = f'"{key}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+    }
+
+    if etag in (request.headers.get("if-none-match") or ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    pdf = await run_in_threadpool(invoice_cache.get, key)
+    if pdf is None:
+        try:
+            # Rendered in memory on the render process pool
+            pdf = await render_invoice(invoice_data)
+        except InvoiceRendererBusy:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Invoice generation is busy. Please retry shortly.",
+                headers={"Retry-After": "5"},
+            )
+        await run_in_threadpool(invoice_cache.put, key, pdf)
+
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
@@ -0,0 +1,278 @@
+"""
+Batch invoice export.
+
+Builds a ZIP of invoice PDFs for every order matching a date range and/or
+status, for accounts' monthly and GST-period filings:
+
+  - Orders are read in keyset-paginated chunks (Order + milestones + user in
+    a handful of IN queries per chunk); SiteSettings is read once.
+  - Each order becomes the same invoice payload the admin preview uses, so
+    previously previewed invoices come straight from the rendered-PDF cache.
+  - Misses are rendered on the invoice process pool, at most one per pool
+    worker at a time.
+  - The ZIP is written to an in-memory sink that is drained after every
+    entry, so the response streams while later invoices are still rendering
+    and memory is bounded by the render window, not the batch size.
+
+Orders without saved invoice_data (or whose render fails) are listed in
+SKIPPED.txt inside the archive instead of aborting the export.
+"""
+
+import asyncio
+import logging
+import os
+import zipfile
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.database import AsyncSessionLocal
+from app.modules.orders.models import Order
+from app.modules.orders.service.invoice_cache import invoice_cache, invoice_cache_key
+from app.modules.orders.service.invoice_renderer import invoice_renderer
+from app.modules.settings.models import SiteSettings
+
+logger = logging.getLogger(__name__)
+
+ORDER_CHUNK_SIZE = 100  # orders loaded per DB round-trip
+
+LOGO_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))),
+    "static", "logo.png"
+)
+
+
+def build_user_address(user) -> str:
+    """Build a formatted address string from user's billing address."""
+    if not hasattr(user, 'addresses') or not user.addresses:
+        return ""
+    addr = next((a for a in user.addresses if a.address_type == "BILLING"), None)
+    if not addr:
+        addr = user.addresses[0] if user.addresses else None
+    if not addr:
+        return ""
+    parts = [addr.address_line_1]
+    if addr.address_line_2:
+        parts.append(addr.address_line_2)
+    parts.append(f"{addr.city}, {addr.state} - {addr.pincode}")
+    return ", ".join(parts)
+
+
+def invoice_number_for(order: Order) -> str:
+    order_num_str = order.order_number or str(order.id)[:8].upper()
+    if order.status in ("PAID", "PARTIALLY_PAID", "COMPLETED"):
+        return order.invoice_number or order_num_str.replace("ORD", "INV", 1)
+    return f"PROFORMA-{order_num_str}"
+
+
+def build_admin_invoice_data(order: Order, site_settings: Optional[SiteSettings]) -> Dict[str, Any]:
+    """
+    Invoice generator payload from the admin-curated order.invoice_data.
+    Requires milestones and user (with addresses) to be loaded.
+    """
+    inv_meta = order.invoice_data
+    order_num_str = order.order_number or str(order.id)[:8].upper()
+
+    return {
+        "invoice_number": invoice_number_for(order),
+        "invoice_date": order.created_at,
+        "order_data": {
+            "order_id": order_num_str,
+            "status": order.status,
+            "order_date": order.created_at.strftime("%d %b %Y"),
+            "total_amount": float(order.total_amount) if order.total_amount is not None else 0.0,
+            "tax_amount": float(order.tax_amount) if order.tax_amount is not None else 0.0,
+            "shipping_amount": float(inv_meta.get("shipping_amount", 0)),
+            "shipping_gst_rate": float(inv_meta.get("shipping_gst_rate", 0)),
+            "order_discount": float(order.discount_amount) if order.discount_amount is not None else 0.0,
+            "amount_paid": float(order.amount_paid) if order.amount_paid is not None else 0.0,
+            "place_of_supply": inv_meta.get("place_of_supply", ""),
+            "reverse_charge": inv_meta.get("reverse_charge", False),
+            "remarks": inv_meta.get("remarks", "BEING GOODS SALES"),
+            "milestones": [
+                {
+                    "label": m.label,
+                    "percentage": float(m.percentage),
+                    "amount": float(m.amount),
+                    "status": m.status,
+                }
+                for m in sorted(
+                    [ms for ms in order.milestones if ms.split_type == order.split_type],
+                    key=lambda x: x.order_index
+                )
+            ] if getattr(order, 'milestones', None) else [],
+        },
+        "company_info": {
+            "name": site_settings.company_name if site_settings else "My Company",
+            "address": site_settings.company_address if site_settings else "",
+            "phone": getattr(site_settings, 'company_phone', '') if site_settings else "",
+            "email": getattr(site_settings, 'company_email', '') if site_settings else "",
+            "gstin": site_settings.company_gstin if site_settings else None,
+            "pan": site_settings.company_pan if site_settings else None,
+            "bank_details": site_settings.bank_details if site_settings else None,
+            "website": getattr(site_settings, 'company_website', None) if site_settings else None,
+        },
+        "customer_info": {
+            "name": order.user.name or "Customer",
+            "email": order.user.email,
+            "phone": order.user.phone or "",
+            "address": build_user_address(order.user),
+            "place_of_supply": inv_meta.get("place_of_supply") or order.place_of_supply or "Undetermined",
+            "gstin": order.user.gstin or "",
+        },
+        "items": inv_meta.get("items", []),
+        "logo_path": LOGO_PATH,
+    }
+
+
+class _ZipSink:
+    """Write-only, non-seekable file object; zipfile falls back to data descriptors."""
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0
+
+    def write(self, data) -> int:
+        self._buf += data
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+async def _iter_invoice_payloads(
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    status_filter: Optional[str],
+    site_settings: Optional[SiteSettings],
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Yield (order_number, payload or None) for matching orders, in id order."""
+    conditions = []
+    if date_from is not None:
+        conditions.append(Order.created_at >= date_from)
+    if date_to is not None:
+        conditions.append(Order.created_at < date_to)
+    if status_filter:
+        conditions.append(Order.status == status_filter)
+
+    last_id = None
+    while True:
+        stmt = (
+            select(Order)
+            .options(selectinload(Order.milestones), selectinload(Order.user))
+            .where(*conditions)
+            .order_by(Order.id)
+            .limit(ORDER_CHUNK_SIZE)
+        )
+        if last_id is not None:
+            stmt = stmt.where(Order.id > last_id)
+
+        async with AsyncSessionLocal() as db:
+            orders = (await db.execute(stmt)).scalars().all()
+            if not orders:
+                return
+            # Build payloads while the session is open; ORM rows are dropped per chunk
+            chunk = [
+                (
+                    order.order_number or str(order.id),
+                    build_admin_invoice_data(order, site_settings) if order.invoice_data else None,
+                )
+                for order in orders
+            ]
+            last_id = orders[-1].id
+
+        for entry in chunk:
+            yield entry
+
+
+async def _render_entry(invoice_data: Dict[str, Any]) -> Tuple[str, bytes, datetime]:
+    key = invoice_cache_key(invoice_data)
+    pdf = await run_in_threadpool(invoice_cache.get, key)
+    if pdf is None:
+        pdf = await invoice_renderer.render(invoice_data, wait=True)
+        await run_in_threadpool(invoice_cache.put, key, pdf)
+    return f"{invoice_data['invoice_number']}.pdf", pdf, invoice_data["invoice_date"]
+
+
+def _write_entry(zf: zipfile.ZipFile, name: str, data: bytes, when: Optional[datetime]) -> None:
+    date_time = (when or datetime.now()).timetuple()[:6]
+    if date_time[0] < 1980:  # ZIP timestamps start at 1980
+        date_time = (1980, 1, 1, 0, 0, 0)
+    zf.writestr(zipfile.ZipInfo(name, date_time=date_time), data)
+
+
+async def stream_invoice_zip(
+    *,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    status_filter: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Yield a ZIP archive of invoice PDFs for the matching orders, entry by entry."""
+    async with AsyncSessionLocal() as db:
+        site_settings = (await db.execute(select(SiteSettings))).scalar_one_or_none()
+        if site_settings is not None:
+            db.expunge(site_settings)
+
+    sink = _ZipSink()
+    zf = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED)
+    window = max(1, invoice_renderer.max_workers)
+    pending: Dict[asyncio.Task, str] = {}
+    skipped: List[str] = []
+    exported = 0
+
+    async def collect(done) -> None:
+        nonlocal exported
+        for task in done:
+            order_number = pending.pop(task)
+            try:
+                name, pdf, when = task.result()
+            except Exception as e:
+                logger.error(f"Invoice export: render failed for {order_number}: {e}")
+                skipped.append(f"{order_number}: render failed")
+                continue
+            _write_entry(zf, name, pdf, when)
+            exported += 1
+
+    try:
+        async for order_number, invoice_data in _iter_invoice_payloads(
+            date_from, date_to, status_filter, site_settings
+        ):
+            if invoice_data is None:
+                skipped.append(f"{order_number}: invoice data not configured")
+                continue
+
+            if len(pending) >= window:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                await collect(done)
+                if chunk := sink.drain():
+                    yield chunk
+
+            pending[asyncio.create_task(_render_entry(invoice_data))] = order_number
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            await collect(done)
+            if chunk := sink.drain():
+                yield chunk
+
+        if skipped:
+            _write_entry(zf, "SKIPPED.txt", ("\n".join(skipped) + "\n").encode("utf-8"), None)
+        zf.close()
+        yield sink.drain()
+        logger.info(f"Invoice export finished: {exported} invoices, {len(skipped)} skipped")
+    finally:
+        # Client disconnected or export failed: stop outstanding renders
+        for task in pending:
+            task.cancel()
@@ -3,6 +3,7 @@ invoice_generator.py  –  Professional Printing & Packing Tax Invoice
 Sections: Header | Info Box | Items | Taxes | Financial Summary | Declaration | Footer
 """
 
+import io
 import os
 import logging
 from datetime import datetime, timezone
@@ -172,17 +173,18 @@ def _amount_in_words(amount: float) -> str:
 # ══════════════════════════════════════════════════════════════════════════════
 class TaxInvoiceGenerator:
 
-    def __init__(self, filename: str, pagesize=A4):
+    def __init__(self, filename, pagesize=A4):
+        # `filename` may be a path or a binary file-like object (e.g. BytesIO)
         self.filename = filename
         self.W, self.H = pagesize
-        self.styles = getSampleStyleSheet()
-        self._build_styles()
+        self.styles = _shared_styles()
 
     # ── Paragraph styles ───────────────────────────────────────────────────────
-    def _build_styles(self):
+    @staticmethod
+    def _build_styles(styles):
         def A(name, **kw):
-            self.styles.add(ParagraphStyle(name,
-                parent=kw.pop("p", self.styles["Normal"]), **kw))
+            styles.add(ParagraphStyle(name,
+                parent=kw.pop("p", styles["Normal"]), **kw))
 
         # Header
         A("CoName",    fontName=BLD, fontSize=13, textColor=NAVY,  leading=17)
@@ -797,10 +799,34 @@ class TaxInvoiceGenerator:
         ]
 
 
-# ── Public helper ──────────────────────────────────────────────────────────────
+# Styles are read-only once built, so each process builds them exactly once
+_STYLES = None
+
+def _shared_styles():
+    global _STYLES
+    if _STYLES is None:
+        styles = getSampleStyleSheet()
+        TaxInvoiceGenerator._build_styles(styles)
+        _STYLES = styles
+    return _STYLES
+
+
+# ── Public helpers ─────────────────────────────────────────────────────────────
 def generate_simple_invoice(filepath: str, invoice_data: Dict[str, Any]) -> str:
     """Generate a professional GST Tax Invoice PDF. Returns filepath."""
-    gen = TaxInvoiceGenerator(filepath)
+    _build_invoice(filepath, invoice_data)
+    return filepath
+
+
+def render_invoice_pdf(invoice_data: Dict[str, Any]) -> bytes:
+    """Render the invoice entirely in memory and return the PDF bytes."""
+    buf = io.BytesIO()
+    _build_invoice(buf, invoice_data)
+    return buf.getvalue()
+
+
+def _build_invoice(target, invoice_data: Dict[str, Any]) -> None:
+    gen = TaxInvoiceGenerator(target)
     gen.generate_invoice(
         invoice_number = invoice_data["invoice_number"],
         invoice_date   = invoice_data.get("invoice_date", datetime.now(timezone.utc)),
@@ -811,4 +837,3 @@ def generate_simple_invoice(filepath: str, invoice_data: Dict[str, Any]) -> str:
         logo_path      = invoice_data.get("logo_path"),
         due_date       = invoice_data.get("due_date"),
     )
-    return filepath
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Invoice render pool.
+
+ReportLab layout is CPU-bound and holds the GIL, so rendering on the
+default thread pool slows every other request on the worker. Invoices are
+rendered in a bounded ProcessPoolExecutor instead:
+
+  - Each pool process imports the generator once, which registers the
+    InvR/InvB fonts, and warms the shared paragraph stylesheet.
+  - Rendering happens in memory (BytesIO); nothing touches disk.
+  - At most `max_workers + max_queue` renders may be in flight. Beyond that
+    `render_invoice` raises InvoiceRendererBusy so the route can answer 503
+    instead of piling up work. Batch exports opt out of the limit and bound
+    their own concurrency instead.
+
+`stats()` exposes the current queue depth for monitoring.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class InvoiceRendererBusy(Exception):
+    """Raised when the render pool is saturated."""
+
+
+def _init_worker() -> None:
+    # Importing the generator registers fonts; building styles warms the cache
+    from app.modules.orders.service.invoice_generator import _shared_styles
+    _shared_styles()
+
+
+def _render(invoice_data: Dict[str, Any]) -> bytes:
+    from app.modules.orders.service.invoice_generator import render_invoice_pdf
+    return render_invoice_pdf(invoice_data)
+
+
+class InvoiceRenderer:
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                # spawn: forking a threaded event-loop process is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    async def render(self, invoice_data: Dict[str, Any], wait: bool = False) -> bytes:
+        """
+        Render an invoice to PDF bytes in the process pool.
+        Batch callers pass wait=True to queue behind the pool instead of
+        failing fast; they must bound their own concurrency.
+        """
+        if not wait and self._in_flight >= self.max_workers + self.max_queue:
+            logger.warning(f"Invoice render pool saturated ({self._in_flight} in flight)")
+            raise InvoiceRendererBusy("Invoice renderer is busy")
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), _render, invoice_data)
+        finally:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.max_workers),
+            "workers": self.max_workers,
+            "capacity": self.max_workers + self.max_queue,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+invoice_renderer = InvoiceRenderer(
+    max_workers=settings.invoice_render_workers,
+    max_queue=settings.invoice_render_queue,
+)
+
+
+async def render_invoice(invoice_data: Dict[str, Any]) -> bytes:
+    return await invoice_renderer.render(invoice_data)
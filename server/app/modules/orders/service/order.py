@@ -3,6 +3,7 @@ from typing import Optional
 from fastapi import HTTPException, status
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.pagination import KeysetPage, paginate
 from app.modules.orders.models import Order, OrderMilestone, PaymentDeclaration
 from app.modules.orders.schemas import MilestoneStatus
 from app.modules.orders.schemas import AdminMilestoneCreateRequest, OrderStatus
@@ -32,36 +33,89 @@ class OrderService:
             await self._populate_order_details([order])
         return order
 
-    async def get_all_orders(self, status_filter=None, skip=0, limit=50):
-        from sqlalchemy.orm import selectinload
-        stmt = (
-            select(Order)
-            .options(selectinload(Order.milestones), selectinload(Order.user))
-            .order_by(Order.created_at.desc())
-            .offset(skip).limit(limit)
+    async def get_milestone_for_payment(self, order_id: UUID, milestone_id: UUID):
+        """
+        One-row lookup for the payment QR: the order's owner plus the
+        milestone's label/amount/status (milestone columns are None when the
+        milestone doesn't belong to the order). Returns None if no order.
+        """
+        return (await self.db.execute(
+            select(
+                Order.user_id,
+                OrderMilestone.id.label("milestone_id"),
+                OrderMilestone.label,
+                OrderMilestone.amount,
+                OrderMilestone.status,
+            )
+            .outerjoin(
+                OrderMilestone,
+                (OrderMilestone.order_id == Order.id) & (OrderMilestone.id == milestone_id),
+            )
+            .where(Order.id == order_id)
+        )).one_or_none()
+
+    @staticmethod
+    def _list_query():
+        """
+        Column-only projection for order listings (OrderListResponse): the
+        order, its customer, and the first inquiry item's display name/image
+        from one LATERAL subquery, so a page is a single round trip instead
+        of orders + milestones + users + inquiries + items + catalog rows.
+        Name/image fallbacks mirror _populate_order_details.
+        """
+        from sqlalchemy import func, true
+        from app.modules.inquiry.models import InquiryItem
+        from app.modules.products.models import Product, SubProduct
+        from app.modules.services.models import Service, SubService
+        from app.modules.users.models import User
+
+        first_item = (
+            select(
+                func.coalesce(Service.name, SubProduct.name, Product.name, "Custom Order").label("product_name"),
+                func.coalesce(
+                    InquiryItem.images[1],
+                    SubProduct.images[1],
+                    func.nullif(Product.cover_image, ""),
+                    SubService.images[1],
+                    func.nullif(Service.cover_image, ""),
+                ).label("image_url"),
+            )
+            .select_from(InquiryItem)
+            .outerjoin(Service, Service.id == InquiryItem.service_id)
+            .outerjoin(SubService, SubService.id == InquiryItem.subservice_id)
+            .outerjoin(Product, Product.id == InquiryItem.product_id)
+            .outerjoin(SubProduct, SubProduct.id == InquiryItem.subproduct_id)
+            .where(InquiryItem.group_id == Order.inquiry_id)
+            .order_by(InquiryItem.id)
+            .limit(1)
+            .lateral("first_item")
+        )
+        return (
+            select(
+                Order.id, Order.order_number, Order.inquiry_id, Order.user_id,
+                User.name.label("user_name"), User.email.label("user_email"),
+                first_item.c.product_name, first_item.c.image_url,
+                Order.total_amount, Order.tax_amount, Order.shipping_amount,
+                Order.discount_amount, Order.amount_paid, Order.status,
+                Order.split_type, Order.is_custom_milestone_requested, Order.created_at,
+            )
+            .outerjoin(User, User.id == Order.user_id)
+            .outerjoin(first_item, true())
         )
+
+    async def get_all_orders(self, status_filter=None, cursor=None, limit=50) -> KeysetPage:
+        stmt = self._list_query()
         if status_filter:
             stmt = stmt.where(Order.status == status_filter.value)
         
-        orders = list((await self.db.execute(stmt)).scalars().all())
-        await self._populate_order_details(orders)
-        return orders
+        return await paginate(self.db, stmt, keys=(Order.created_at, Order.id), limit=limit, cursor=cursor, scalars=False)
 
-    async def get_user_orders(self, user_id: UUID, status_filter=None, skip=0, limit=50):
-        from sqlalchemy.orm import selectinload
-        stmt = (
-            select(Order)
-            .options(selectinload(Order.milestones), selectinload(Order.user))
-            .where(Order.user_id == user_id)
-            .order_by(Order.created_at.desc())
-            .offset(skip).limit(limit)
-        )
+    async def get_user_orders(self, user_id: UUID, status_filter=None, cursor=None, limit=50) -> KeysetPage:
+        stmt = self._list_query().where(Order.user_id == user_id)
         if status_filter:
             stmt = stmt.where(Order.status == status_filter.value)
         
-        orders = list((await self.db.execute(stmt)).scalars().all())
-        await self._populate_order_details(orders)
-        return orders
+        return await paginate(self.db, stmt, keys=(Order.created_at, Order.id), limit=limit, cursor=cursor, scalars=False)
 
     async def _populate_order_details(self, orders: list[Order]):
         from sqlalchemy.orm import selectinload
@@ -1,36 +1,52 @@
+import asyncio
+import hashlib
 import qrcode
+import time
+from collections import OrderedDict
 from io import BytesIO
 import base64
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
 
-def generate_upi_qr(upi_id : str , name : str , amount : float , transaction_note: Optional[str] = None):
-    """
-    Generate a UPI QR code for a specific order.
-    """
-    upi_string = f"upi://pay?pa={upi_id}&pn={name}&am={amount}"
+
+def build_upi_uri(upi_id: str, name: str, amount, transaction_note: Optional[str] = None) -> str:
+    """UPI deep link; the amount is fixed to 2 decimals so equal amounts share a QR."""
+    upi_string = f"upi://pay?pa={upi_id}&pn={name}&am={float(amount):.2f}"
 
     if transaction_note:
         upi_string += f"&tn={transaction_note}"
+    return upi_string
+
 
+def render_qr_png(data: str, size: int = 10, border: int = 4) -> bytes:
+    """Encode data as a QR code PNG. CPU-bound — keep it off the event loop."""
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
+        box_size=size,
+        border=border,
     )
-    qr.add_data(upi_string)
+    qr.add_data(data)
     qr.make(fit=True)
 
     img = qr.make_image(fill_color="black", back_color="white")
 
     buffer = BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def generate_upi_qr(upi_id : str , name : str , amount : float , transaction_note: Optional[str] = None):
+    """
+    Generate a UPI QR code for a specific order.
+    """
+    png = render_qr_png(build_upi_uri(upi_id, name, amount, transaction_note))
+    return base64.b64encode(png).decode("utf-8")
 
-    img_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
 
-    return img_base64
-    
 def generate_payment_qr(
     payment_data: str,
     size: int = 10,
@@ -47,22 +63,74 @@ def generate_payment_qr(
     Returns:
         Base64 encoded QR code image
     """
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=size,
-        border=border,
-    )
-    qr.add_data(payment_data)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
-    
-    buffered = BytesIO()
-    img.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
-    
-    return img_str
+    return base64.b64encode(render_qr_png(payment_data, size=size, border=border)).decode()
+
+
+class UPIQRCache:
+    """
+    In-process LRU + TTL cache of rendered UPI QR PNGs keyed by the UPI link
+    (upi_id, name, amount, note). Concurrent misses for the same link share
+    one render.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()  # uri → (expires_at, png)
+        self._pending: Dict[str, asyncio.Future] = {}  # uri → in-flight render
+
+    def _get(self, uri: str) -> Optional[bytes]:
+        entry = self._entries.get(uri)
+        if entry is None:
+            return None
+        expires_at, png = entry
+        if expires_at < time.monotonic():
+            del self._entries[uri]
+            return None
+        self._entries.move_to_end(uri)
+        return png
+
+    def _put(self, uri: str, png: bytes) -> None:
+        self._entries[uri] = (time.monotonic() + self.ttl_seconds, png)
+        self._entries.move_to_end(uri)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _render(self, uri: str) -> bytes:
+        try:
+            png = await run_in_threadpool(render_qr_png, uri)
+            self._put(uri, png)
+            return png
+        finally:
+            self._pending.pop(uri, None)
+
+    async def get_png(self, uri: str) -> bytes:
+        png = self._get(uri)
+        if png is not None:
+            return png
+
+        task = self._pending.get(uri)
+        if task is None:
+            task = asyncio.ensure_future(self._render(uri))
+            self._pending[uri] = task
+        # Shielded so one caller disconnecting doesn't fail the others
+        return await asyncio.shield(task)
+
+
+upi_qr_cache = UPIQRCache(
+    max_entries=settings.upi_qr_cache_size,
+    ttl_seconds=settings.upi_qr_cache_ttl_seconds,
+)
+
+
+async def get_upi_qr_png(
+    upi_id: str, name: str, amount, transaction_note: Optional[str] = None
+) -> Tuple[bytes, str]:
+    """Cached UPI QR PNG rendered off the event loop, plus a strong ETag for it."""
+    uri = build_upi_uri(upi_id, name, amount, transaction_note)
+    png = await upi_qr_cache.get_png(uri)
+    etag = '"' + hashlib.sha256(uri.encode("utf-8")).hexdigest()[:32] + '"'
+    return png, etag
 
 
 def save_qr_to_file(qr_base64: str, filepath: str):
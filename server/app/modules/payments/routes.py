@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.core.payment import get_payment_provider
+from app.core.payment import get_payment_provider, PaymentGatewayError
 from app.modules.auth import get_current_user
 from app.modules.users.models import User
 from app.modules.orders.models import Order, Transaction
@@ -97,10 +97,10 @@ async def create_payment_order(
             detail="Milestone amount is zero — no payment required",
         )
 
-    # 4. Create order on payment gateway
+    # 4. Create order on payment gateway (async — never blocks the event loop)
     provider = get_payment_provider()
     try:
-        gw_order = provider.create_order(
+        gw_order = await provider.create_order(
             amount_paise=amount_paise,
             currency="INR",
             receipt=f"o_{str(order.id)[:8]}_m_{str(milestone.id)[:8]}",
@@ -110,6 +110,12 @@ async def create_payment_order(
                 "user_id": str(current_user.id),
             },
         )
+    except PaymentGatewayError as e:
+        logger.error(f"Razorpay create_order failed: {e} (status={e.status_code})")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Payment gateway error: {str(e)}",
+        )
     except Exception as e:
         logger.error(f"Razorpay create_order failed: {type(e).__name__}: {e}")
         raise HTTPException(
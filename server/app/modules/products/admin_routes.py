@@ -4,10 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import delete
+from sqlalchemy.orm import selectinload
 
 from typing import List, Optional
 
 # Adjust these imports based on your actual project structure
+from app.core.catalog_cache import catalog_cache
 from app.core.database import get_db
 from app.modules.auth.auth import get_current_admin_user
 from app.modules.users.models import User
@@ -21,6 +23,18 @@ logger = logging.getLogger("app.modules.products.admin")
 
 router = APIRouter()
 
+
+async def _get_product_with_sub_products(db: AsyncSession, product_id: int) -> Product:
+    """Reload a product with the sub_products its response includes."""
+    stmt = (
+        select(Product)
+        .where(Product.id == product_id)
+        .options(selectinload(Product.sub_products))
+        .execution_options(populate_existing=True)
+    )
+    return (await db.execute(stmt)).scalar_one()
+
+
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
     product_data: ProductCreate, 
@@ -36,8 +50,8 @@ async def create_product(
     new_product = Product(**product_data.model_dump())
     db.add(new_product)
     await db.commit()
-    await db.refresh(new_product)
-    return new_product
+    await catalog_cache.invalidate()
+    return await _get_product_with_sub_products(db, new_product.id)
 
 @router.patch("/{product_id}", response_model=ProductResponse)
 async def update_product(
@@ -59,8 +73,8 @@ async def update_product(
     
     db.add(db_product)
     await db.commit()
-    await db.refresh(db_product)
-    return db_product
+    await catalog_cache.invalidate()
+    return await _get_product_with_sub_products(db, db_product.id)
 
 @router.delete("/{product_id}")
 async def delete_product(
@@ -76,6 +90,7 @@ async def delete_product(
     # This will cascade and delete all related SubProducts as well
     await db.execute(delete(Product).where(Product.id == product_id))
     await db.commit()
+    await catalog_cache.invalidate()
     return {"message": "Product and all related sub-products deleted successfully"}
 
 # ====================sub-product endpoints========================
@@ -105,6 +120,7 @@ async def create_sub_product(
     new_sub_product = SubProduct(**sub_product_data.model_dump(), product_id=parent.id)
     db.add(new_sub_product)
     await db.commit()
+    await catalog_cache.invalidate()
     await db.refresh(new_sub_product)
     return new_sub_product
 
@@ -129,6 +145,7 @@ async def update_sub_product(
     
     db.add(db_sub_product)
     await db.commit()
+    await catalog_cache.invalidate()
     await db.refresh(db_sub_product)
     return db_sub_product
 
@@ -145,6 +162,7 @@ async def delete_sub_product(
     
     await db.execute(delete(SubProduct).where(SubProduct.id == sub_product_id))
     await db.commit()
+    await catalog_cache.invalidate()
     return {"message": "SubProduct deleted successfully"}
 
 
@@ -169,7 +187,7 @@ async def get_products(
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
-    stmt = select(Product)
+    stmt = select(Product).options(selectinload(Product.sub_products))
     if is_active is not None:
         stmt = stmt.where(Product.is_active == is_active)
     result = await db.execute(stmt.offset(skip).limit(limit))
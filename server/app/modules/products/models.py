@@ -17,8 +17,8 @@ class Product(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Relationships
-    sub_products = relationship("SubProduct", back_populates="product", cascade="all, delete-orphan", lazy="selectin")
+    # Relationships — not eager: load with selectinload(Product.sub_products) where a response needs them
+    sub_products = relationship("SubProduct", back_populates="product", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     def __repr__(self):
         return f"Product(id={self.id}, name={self.name})"
@@ -59,12 +59,17 @@ class SubProduct(Base):
     unit      = Column(String, default="Nos")
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped on every edit; versions the compiled pricing config (inquiry/pricing.py)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     product = relationship("Product", back_populates="sub_products")
     # Make sure to update 'template' to 'sub_product' in your inquiry models later!
     inquiry_items = relationship("InquiryItem", back_populates="sub_product")
-    reviews = relationship("Review", back_populates="product", cascade="all, delete-orphan", lazy="selectin")
+    # Never loaded with the catalog; reviews are queried / aggregated separately
+    reviews = relationship("Review", back_populates="product", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    # Rating totals; joinedload(SubProduct.review_stats) in catalog queries
+    review_stats = relationship("ReviewStats", uselist=False, viewonly=True, lazy="raise")
 
     def __repr__(self):
         return f"SubProduct(id={self.id}, name={self.name}, product_id={self.product_id})"
\ No newline at end of file
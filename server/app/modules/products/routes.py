@@ -1,13 +1,15 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 # Adjust these imports based on your actual project structure
-from app.core.database import get_db
+from app.core.catalog_cache import catalog_cache, json_response, to_json
 from app.modules.products.models import Product, SubProduct
+from app.modules.reviews.service import attach_ratings
 from app.modules.products.schemas import (
     ProductResponse,
     SubProductResponse
@@ -17,24 +19,40 @@ logger = logging.getLogger("app.modules.products")
 
 router = APIRouter()
 
+# Responses are served from the catalog cache (see app/core/catalog_cache.py);
+# loaders run on a session the cache opens, only on a cache miss.
+_product = TypeAdapter(ProductResponse)
+_products = TypeAdapter(list[ProductResponse])
+_sub_product = TypeAdapter(SubProductResponse)
+_sub_products = TypeAdapter(list[SubProductResponse])
+
 @router.get("/", response_model=list[ProductResponse])
-async def get_products(skip: int = 0, limit: int = 25, db: AsyncSession = Depends(get_db)):
+async def get_products(skip: int = 0, limit: int = 25):
     """Returns a list of main categories, including their nested sub-products."""
-    # selectinload automatically fetches the related sub_products to prevent N+1 query issues
-    stmt = select(Product).where(Product.is_active == True).options(selectinload(Product.sub_products)).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    async def load(db: AsyncSession) -> bytes:
+        # selectinload automatically fetches the related sub_products to prevent N+1 query issues
+        stmt = select(Product).where(Product.is_active == True).options(selectinload(Product.sub_products).joinedload(SubProduct.review_stats)).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        products = result.scalars().all()
+        attach_ratings([sp for p in products for sp in p.sub_products])
+        return to_json(_products, products)
+
+    return json_response(await catalog_cache.get_or_load(f"products:list:{skip}:{limit}", load))
 
 @router.get("/{slug}", response_model=ProductResponse)
-async def get_product(slug: str, db: AsyncSession = Depends(get_db)):
+async def get_product(slug: str):
     """Fetches a specific category and all its available sub-products."""
-    stmt = select(Product).where(Product.slug == slug, Product.is_active == True).options(selectinload(Product.sub_products))
-    result = await db.execute(stmt)
-    product = result.scalar_one_or_none()
+    async def load(db: AsyncSession) -> bytes:
+        stmt = select(Product).where(Product.slug == slug, Product.is_active == True).options(selectinload(Product.sub_products).joinedload(SubProduct.review_stats))
+        result = await db.execute(stmt)
+        product = result.scalar_one_or_none()
+
+        if not product:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product category not found")
+        attach_ratings(product.sub_products)
+        return to_json(_product, product)
 
-    if not product:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product category not found")
-    return product
+    return json_response(await catalog_cache.get_or_load(f"products:detail:{slug}", load))
 
 
 # ==========================================
@@ -42,31 +60,44 @@ async def get_product(slug: str, db: AsyncSession = Depends(get_db)):
 # ==========================================
 
 @router.get("/sub-products/{sub_product_slug}", response_model=SubProductResponse)
-async def get_sub_product(sub_product_slug: str, db: AsyncSession = Depends(get_db)):
+async def get_sub_product(sub_product_slug: str):
     """Fetches the specific configuration for a sub-product. The frontend uses this to build the dynamic form."""
-    stmt = select(SubProduct).where(SubProduct.slug == sub_product_slug, SubProduct.is_active == True)
-    result = await db.execute(stmt)
-    sub_product = result.scalar_one_or_none()
+    async def load(db: AsyncSession) -> bytes:
+        stmt = (
+            select(SubProduct)
+            .where(SubProduct.slug == sub_product_slug, SubProduct.is_active == True)
+            .options(joinedload(SubProduct.review_stats))
+        )
+        result = await db.execute(stmt)
+        sub_product = result.scalar_one_or_none()
+
+        if not sub_product:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SubProduct not found")
+        attach_ratings([sub_product])
+        return to_json(_sub_product, sub_product)
 
-    if not sub_product:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SubProduct not found")
-    return sub_product
+    return json_response(await catalog_cache.get_or_load(f"sub_products:detail:{sub_product_slug}", load))
 
 
 @router.get("/{product_slug}/sub-products", response_model=list[SubProductResponse])
-async def get_sub_products_by_product(product_slug: str, db: AsyncSession = Depends(get_db)):
+async def get_sub_products_by_product(product_slug: str):
     """Fetches all sub-products of a specific product."""
-    stmt = (
-        select(SubProduct)
-        .join(Product, SubProduct.product_id == Product.id) 
-        .where(
-            Product.slug == product_slug,  # Look up by the PARENT'S slug
-            SubProduct.is_active == True   # Only get active sub-products
+    async def load(db: AsyncSession) -> bytes:
+        stmt = (
+            select(SubProduct)
+            .join(Product, SubProduct.product_id == Product.id) 
+            .where(
+                Product.slug == product_slug,  # Look up by the PARENT'S slug
+                SubProduct.is_active == True   # Only get active sub-products
+            )
+            .options(joinedload(SubProduct.review_stats))
         )
-    )
-    result = await db.execute(stmt)
-    sub_products = result.scalars().all()
+        result = await db.execute(stmt)
+        sub_products = result.scalars().all()
+
+        if not sub_products:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SubProduct not found")
+        attach_ratings(sub_products)
+        return to_json(_sub_products, sub_products)
 
-    if not sub_products:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SubProduct not found")
-    return sub_products
\ No newline at end of file
+    return json_response(await catalog_cache.get_or_load(f"products:sub_products:{product_slug}", load))
\ No newline at end of file
@@ -4,6 +4,8 @@ from slugify import slugify
 from enum import Enum as PyEnum
 from datetime import datetime
 
+from app.modules.reviews.schemas import RatingSummary
+
 
 # =========================================================
 # 1️⃣ OPTIONS & CONFIG SCHEMAS
@@ -193,6 +195,7 @@ class SubProductResponse(SubProductCreate):
     id: int
     product_id: int
     created_at: datetime
+    rating: Optional[RatingSummary] = None  # public catalog responses only
 
     model_config = {"from_attributes": True}
 
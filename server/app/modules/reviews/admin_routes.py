@@ -1,16 +1,18 @@
 import logging
 from typing import Optional
 from app.modules.reviews.schemas import ReviewResponse, ReviewListResponse
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, func
-from sqlalchemy.orm import joinedload
 from app.modules.auth.auth import get_current_admin_user, TokenData
 from uuid import UUID
-from app.modules.reviews.models import Review 
+from app.core.catalog_cache import catalog_cache
+from app.modules.reviews.models import Review, ReviewStats, review_response_options
+from app.modules.reviews.service import record_rating_change
 from app.modules.services.models import SubService
 from app.modules.products.models import SubProduct
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 
 logger = logging.getLogger("app.modules.reviews.admin")
 
@@ -19,6 +21,7 @@ router = APIRouter()
 
 @router.get("/all", response_model=ReviewListResponse)
 async def get_all_reviews(
+    response: Response,
     db: AsyncSession = Depends(get_db), 
     current_user: TokenData = Depends(get_current_admin_user),
     product_id: Optional[int] = None,
@@ -26,8 +29,8 @@ async def get_all_reviews(
     parent_product_id: Optional[int] = None,
     parent_service_id: Optional[int] = None,
     user_id: Optional[UUID] = None,
-    skip: int = 0,
-    limit: int = 100
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(100, ge=1, le=200),
 ):
     """
     Get all reviews with advanced filtering and pagination.
@@ -37,11 +40,7 @@ async def get_all_reviews(
     - parent_service_id: Filter by parent Service category
     - user_id: Filter by specific user
     """
-    stmt = select(Review).options(
-        joinedload(Review.user),
-        joinedload(Review.product),
-        joinedload(Review.service)
-    )
+    stmt = select(Review).options(*review_response_options())
     
     # Filtering
     if user_id:
@@ -59,20 +58,30 @@ async def get_all_reviews(
         # Filter by sub-services belonging to this parent service
         stmt = stmt.join(SubService, Review.service_id == SubService.id).where(SubService.service_id == parent_service_id)
         
-    # Count total for pagination
-    count_stmt = select(func.count()).select_from(stmt.subquery())
+    # Count total for pagination — from review_stats unless filtering by user
+    if user_id:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+    else:
+        count_stmt = select(func.coalesce(func.sum(ReviewStats.review_count), 0))
+        if product_id:
+            count_stmt = count_stmt.where(ReviewStats.product_id == product_id)
+        elif parent_product_id:
+            count_stmt = count_stmt.join(SubProduct, ReviewStats.product_id == SubProduct.id).where(SubProduct.product_id == parent_product_id)
+        if service_id:
+            count_stmt = count_stmt.where(ReviewStats.service_id == service_id)
+        elif parent_service_id:
+            count_stmt = count_stmt.join(SubService, ReviewStats.service_id == SubService.id).where(SubService.service_id == parent_service_id)
     total = (await db.execute(count_stmt)).scalar() or 0
     
     # Fetch data
-    stmt = stmt.order_by(Review.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    reviews = result.scalars().all()
+    page = await paginate(db, stmt, keys=(Review.created_at, Review.id), limit=limit, cursor=cursor)
     
     return {
         "total": total,
-        "skip": skip,
         "limit": limit,
-        "reviews": reviews
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor,
+        "reviews": with_cursor_headers(response, page),
     }
 
 
@@ -84,7 +93,7 @@ async def get_user_reviews(
     product_id: Optional[int] = None,
     service_id: Optional[int] = None
 ):
-    stmt = select(Review).options(joinedload(Review.user)).where(Review.user_id == user_id)
+    stmt = select(Review).options(*review_response_options()).where(Review.user_id == user_id)
     if product_id is not None:
         stmt = stmt.where(Review.product_id == product_id)
     if service_id is not None:
@@ -100,13 +109,18 @@ async def delete_review(
     db: AsyncSession = Depends(get_db), 
     current_user: TokenData = Depends(get_current_admin_user)
 ):
-    stmt = select(Review).where(Review.id == review_id)
+    # Locked so a concurrent edit or delete can't apply a stale rating to review_stats
+    stmt = select(Review).where(Review.id == review_id).with_for_update()
     review = (await db.execute(stmt)).scalar_one_or_none()
     
     if not review:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")   
 
+    await record_rating_change(
+        db, product_id=review.product_id, service_id=review.service_id, removed=review.rating
+    )
     stmt = delete(Review).where(Review.id == review_id)
     await db.execute(stmt)
     await db.commit()
+    await catalog_cache.invalidate()  # catalog responses carry rating summaries
     return
@@ -1,5 +1,5 @@
-from sqlalchemy import Column , Integer , String , DateTime , Boolean , func , ForeignKey, CheckConstraint, Uuid
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column , Integer , String , DateTime , Boolean , func , ForeignKey, CheckConstraint, Uuid, Index
+from sqlalchemy.orm import joinedload, relationship
 from app.core.database import Base
 
 
@@ -7,8 +7,8 @@ class Review(Base):
     __tablename__ = "reviews"
     id = Column(Integer , primary_key = True , nullable = False , autoincrement = True)
     user_id = Column(Uuid , ForeignKey("users.id"), nullable=False)
-    product_id = Column(Integer , ForeignKey("sub_products.id"), nullable=True)
-    service_id = Column(Integer , ForeignKey("sub_services.id"), nullable=True)
+    product_id = Column(Integer , ForeignKey("sub_products.id", ondelete="CASCADE"), nullable=True)
+    service_id = Column(Integer , ForeignKey("sub_services.id", ondelete="CASCADE"), nullable=True)
 
     rating = Column(Integer , nullable = False)
     comment = Column(String , nullable = False)
@@ -16,17 +16,66 @@ class Review(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     is_verified = Column(Boolean , default = False)
 
-    # Relationships — lazy="selectin" prevents MissingGreenlet in async context
-    user = relationship("User", lazy="selectin")
-    product = relationship("SubProduct", back_populates="reviews", lazy="selectin")
-    service = relationship("SubService", back_populates="reviews", lazy="selectin")
+    # Relationships — lazy="raise": queries pick what they need from the loader
+    # options below (implicit loads would raise MissingGreenlet in async anyway)
+    user = relationship("User", lazy="raise")
+    product = relationship("SubProduct", back_populates="reviews", lazy="raise")
+    service = relationship("SubService", back_populates="reviews", lazy="raise")
 
     __table_args__ = (
         CheckConstraint(
             'rating >= 1 AND rating <= 5',
             name='valid_rating_range'
         ),
+        # Keyset pagination: per item newest-first by id, admin listing by (created_at, id)
+        Index('ix_reviews_product_id_id', 'product_id', 'id'),
+        Index('ix_reviews_service_id_id', 'service_id', 'id'),
+        Index('ix_reviews_created_at_id', 'created_at', 'id'),
     )
     
     def __repr__(self):
-        return f"Review(id={self.id}, user_id={self.user_id}, product_id={self.product_id}, rating={self.rating}, comment={self.comment})"
\ No newline at end of file
+        return f"Review(id={self.id}, user_id={self.user_id}, product_id={self.product_id}, rating={self.rating}, comment={self.comment})"
+
+
+class ReviewStats(Base):
+    """
+    Running rating totals per sub-product / sub-service, updated in the same
+    transaction as every review create / update / delete (see
+    reviews/service.py). Catalog queries join it, so rating badges cost no
+    extra query.
+    """
+    __tablename__ = "review_stats"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    product_id = Column(Integer, ForeignKey("sub_products.id", ondelete="CASCADE"), nullable=True, unique=True)
+    service_id = Column(Integer, ForeignKey("sub_services.id", ondelete="CASCADE"), nullable=True, unique=True)
+
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_total = Column(Integer, nullable=False, default=0)
+    stars_1 = Column(Integer, nullable=False, default=0)
+    stars_2 = Column(Integer, nullable=False, default=0)
+    stars_3 = Column(Integer, nullable=False, default=0)
+    stars_4 = Column(Integer, nullable=False, default=0)
+    stars_5 = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        CheckConstraint(
+            '(product_id IS NULL) <> (service_id IS NULL)',
+            name='review_stats_single_target'
+        ),
+    )
+
+
+# ── Loader options ─────────────────────────────────────────────
+def review_response_options() -> tuple:
+    """
+    What ReviewResponse (and the dashboard's review cards) read: the reviewer's
+    name / avatar and the reviewed item's id / name. Their own relationships
+    (addresses, the item's reviews, ...) stay unloaded.
+    """
+    return (
+        joinedload(Review.user).raiseload("*"),
+        joinedload(Review.product).raiseload("*"),
+        joinedload(Review.service).raiseload("*"),
+    )
@@ -1,14 +1,17 @@
 import logging
 
 from app.modules.reviews.schemas import ReviewResponse
-from fastapi import  APIRouter , Depends , HTTPException , status
+from typing import Optional
+from fastapi import  APIRouter , Depends , HTTPException , Query , Response , status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.modules.auth.auth import get_current_admin_user, get_current_user, TokenData
-from sqlalchemy.orm import joinedload
-from app.modules.reviews.models import Review 
+from app.core.catalog_cache import catalog_cache
+from app.modules.reviews.models import Review, review_response_options
 from app.modules.reviews.schemas import ReviewCreate
+from app.modules.reviews.service import record_rating_change
 from app.modules.services.models import SubService
 from app.modules.products.models import SubProduct
 
@@ -46,26 +49,27 @@ async def create_or_update_review(
     if not target_entity:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_msg)
 
-    # 3. Check for Existing Review (using getattr to dynamically filter by product_id or service_id)
-    stmt = select(Review).options(joinedload(Review.user)).where(
+    # 3. Check for Existing Review (using getattr to dynamically filter by product_id or service_id).
+    # Locked so concurrent edits apply their rating deltas against the rating each one replaces.
+    stmt = select(Review).where(
         getattr(Review, id_field) == entity_id, 
         Review.user_id == current_user.id
-    )
+    ).with_for_update()
     existing_review = (await db.execute(stmt)).scalar_one_or_none()
 
     # 4. UPDATE Logic
     if existing_review:
+        await record_rating_change(
+            db, **{id_field: entity_id}, added=review.rating, removed=existing_review.rating
+        )
         existing_review.rating = review.rating
         existing_review.comment = review.comment
         
         await db.commit()
+        await catalog_cache.invalidate()  # catalog responses carry rating summaries
         
         # Needs explicit loading for the Pydantic schema Response
-        stmt_upd = select(Review).options(
-            joinedload(Review.user),
-            joinedload(Review.product),
-            joinedload(Review.service)
-        ).where(Review.id == existing_review.id)
+        stmt_upd = select(Review).options(*review_response_options()).where(Review.id == existing_review.id)
         existing_review_loaded = (await db.execute(stmt_upd)).scalar_one()
         
         return existing_review_loaded
@@ -82,6 +86,7 @@ async def create_or_update_review(
     
     new_review = Review(**review_data)
     db.add(new_review)
+    await record_rating_change(db, **{id_field: entity_id}, added=review.rating)
     
     # Notify admins of new review
     from app.modules.notifications.service import NotificationService
@@ -95,13 +100,10 @@ async def create_or_update_review(
     )
     
     await db.commit()
+    await catalog_cache.invalidate()  # catalog responses carry rating summaries
     
     # Needs explicit loading for the Pydantic schema Response
-    stmt_new = select(Review).options(
-        joinedload(Review.user),
-        joinedload(Review.product),
-        joinedload(Review.service)
-    ).where(Review.id == new_review.id)
+    stmt_new = select(Review).options(*review_response_options()).where(Review.id == new_review.id)
     new_review_loaded = (await db.execute(stmt_new)).scalar_one()
     
     return new_review_loaded
@@ -109,39 +111,43 @@ async def create_or_update_review(
 @router.get("/service/{slug}", response_model=list[ReviewResponse])
 async def get_service_reviews(
     slug: str,
+    response: Response,
     db: AsyncSession = Depends(get_db), 
-    limit: int = 10, 
-    skip: int = 0
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
 ):
+    """
+    Keyset-paginated, newest first; cursors are returned in
+    X-Next-Cursor / X-Prev-Cursor.
+    """
     stmt = (
         select(Review)
         .join(Review.service)
-        .options(joinedload(Review.user))
+        .options(*review_response_options())
         .where(SubService.slug == slug)
-        .limit(limit)
-        .offset(skip)
     )
-    result = await db.execute(stmt)
-    reviews = result.scalars().all()
-    return reviews
+    page = await paginate(db, stmt, keys=(Review.id,), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
 
 @router.get("/product/{product_id}", response_model=list[ReviewResponse])
 async def get_product_reviews(
     product_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db), 
-    limit: int = 10, 
-    skip: int = 0
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
 ):
+    """
+    Keyset-paginated, newest first; cursors are returned in
+    X-Next-Cursor / X-Prev-Cursor.
+    """
     stmt = (
         select(Review)
-        .options(joinedload(Review.user)) 
+        .options(*review_response_options())
         .where(Review.product_id == product_id)
-        .limit(limit)
-        .offset(skip)
     )
-    result = await db.execute(stmt)
-    reviews = result.scalars().all()
-    return reviews
+    page = await paginate(db, stmt, keys=(Review.id,), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_review(
@@ -149,13 +155,18 @@ async def delete_review(
     db: AsyncSession = Depends(get_db), 
     current_user: TokenData = Depends(get_current_admin_user)
 ):
-    stmt = select(Review).where(Review.id == review_id and Review.user_id == current_user.id) 
+    # Locked so a concurrent delete can't subtract the same rating twice
+    stmt = select(Review).where(Review.id == review_id and Review.user_id == current_user.id).with_for_update()
     result = await db.execute(stmt)
     review = result.scalar_one_or_none()
 
     if not review:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
 
+    await record_rating_change(
+        db, product_id=review.product_id, service_id=review.service_id, removed=review.rating
+    )
     await db.delete(review)
     await db.commit()
+    await catalog_cache.invalidate()
     return
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 
 class ReviewBase(BaseModel):
@@ -67,6 +67,13 @@ class ReviewResponse(ReviewBase):
 
 class ReviewListResponse(BaseModel):
     total: int
-    skip: int
     limit: int
-    reviews: List[ReviewResponse]
\ No newline at end of file
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    reviews: List[ReviewResponse]
+
+
+class RatingSummary(BaseModel):
+    count: int = 0
+    average: float = 0.0
+    distribution: Dict[int, int] = Field(default_factory=lambda: {star: 0 for star in range(1, 6)})
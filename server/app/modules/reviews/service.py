@@ -0,0 +1,73 @@
+"""
+Review rating aggregates.
+
+`review_stats` holds one row of running totals per reviewed sub-product /
+sub-service. Review writes call `record_rating_change()` inside their own
+transaction, so the totals commit (or roll back) together with the review;
+the update is a single atomic upsert, safe under concurrent reviews.
+
+Catalog queries joinedload `review_stats` alongside the items and
+`attach_ratings()` turns the row into the response's RatingSummary, so
+rating badges add no queries.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.reviews.models import ReviewStats
+from app.modules.reviews.schemas import RatingSummary
+
+STAR_COLUMNS = {star: f"stars_{star}" for star in range(1, 6)}
+
+
+async def record_rating_change(
+    db: AsyncSession,
+    *,
+    product_id: Optional[int] = None,
+    service_id: Optional[int] = None,
+    added: Optional[int] = None,
+    removed: Optional[int] = None,
+) -> None:
+    """
+    Apply one review change to the item's totals:
+    create → added=rating, delete → removed=rating, edit → both.
+    """
+    if added == removed:
+        return
+
+    deltas = {
+        "review_count": (added is not None) - (removed is not None),
+        "rating_total": (added or 0) - (removed or 0),
+    }
+    for star, column in STAR_COLUMNS.items():
+        deltas[column] = (added == star) - (removed == star)
+
+    stmt = insert(ReviewStats).values(product_id=product_id, service_id=service_id, **deltas)
+    target = ReviewStats.product_id if product_id is not None else ReviewStats.service_id
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[target],
+        set_={
+            **{column: getattr(ReviewStats, column) + getattr(stmt.excluded, column) for column in deltas},
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+def rating_summary(stats: Optional[ReviewStats]) -> RatingSummary:
+    if stats is None or stats.review_count <= 0:
+        return RatingSummary()
+    return RatingSummary(
+        count=stats.review_count,
+        average=round(stats.rating_total / stats.review_count, 2),
+        distribution={star: getattr(stats, column) for star, column in STAR_COLUMNS.items()},
+    )
+
+
+def attach_ratings(items: Iterable) -> None:
+    """Set `.rating` on sub-products / sub-services loaded with their review_stats."""
+    for item in items:
+        item.rating = rating_summary(item.review_stats)
@@ -3,6 +3,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from app.core.catalog_cache import catalog_cache
 from app.core.database import get_db
 from app.modules.auth.auth import get_current_admin_user
 from app.modules.users.models import User
@@ -17,6 +19,18 @@ logger = logging.getLogger("app.modules.services.admin")
 
 router = APIRouter()
 
+
+async def _get_service_with_variants(db: AsyncSession, service_id: int) -> Service:
+    """Reload a service with the sub_services its response includes."""
+    stmt = (
+        select(Service)
+        .where(Service.id == service_id)
+        .options(selectinload(Service.sub_services))
+        .execution_options(populate_existing=True)
+    )
+    return (await db.execute(stmt)).scalar_one()
+
+
 @router.post("/", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_service(
     service_in: ServiceCreate, 
@@ -36,8 +50,8 @@ async def create_service(
     new_service = Service(**service_in.model_dump())
     db.add(new_service)
     await db.commit()
-    await db.refresh(new_service)
-    return new_service
+    await catalog_cache.invalidate()
+    return await _get_service_with_variants(db, new_service.id)
 
 @router.patch("/{service_id}", response_model=ServiceResponse)
 async def update_service(
@@ -67,8 +81,8 @@ async def update_service(
     
     db.add(existing_service)
     await db.commit()
-    await db.refresh(existing_service)
-    return existing_service
+    await catalog_cache.invalidate()
+    return await _get_service_with_variants(db, existing_service.id)
 
 @router.get("/", response_model=List[ServiceResponse])
 async def get_services(
@@ -78,7 +92,7 @@ async def get_services(
     current_user: User = Depends(get_current_admin_user), 
     db: AsyncSession = Depends(get_db)
 ):
-    stmt = select(Service)
+    stmt = select(Service).options(selectinload(Service.sub_services))
     if is_active is not None:
         stmt = stmt.where(Service.is_active == is_active)
     stmt = stmt.offset(skip).limit(limit)
@@ -105,6 +119,7 @@ async def create_service_variant(
     new_variant = SubService(**subservice_in.model_dump())
     db.add(new_variant)
     await db.commit()
+    await catalog_cache.invalidate()
     await db.refresh(new_variant)
     return new_variant
 
@@ -139,6 +154,7 @@ async def update_service_variant(
     
     db.add(existing_variant)
     await db.commit()
+    await catalog_cache.invalidate()
     await db.refresh(existing_variant)
     return existing_variant
 
@@ -169,6 +185,7 @@ async def delete_service(
     
     await db.delete(service)
     await db.commit()
+    await catalog_cache.invalidate()
 
 
 @router.get("/subservices", response_model=List[SubServiceResponse])
@@ -199,4 +216,5 @@ async def delete_service_variant(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Service variant not found")
     
     await db.delete(variant)
-    await db.commit()
\ No newline at end of file
+    await db.commit()
+    await catalog_cache.invalidate()
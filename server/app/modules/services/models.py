@@ -14,7 +14,8 @@ class Service(Base):
     description = Column(String, nullable=True)
     created_at = Column(DateTime(timezone = True) , server_default=func.now())
 
-    sub_services = relationship("SubService", back_populates="service", cascade="all, delete-orphan", lazy="selectin")
+    # Not eager: load with selectinload(Service.sub_services) where a response needs them
+    sub_services = relationship("SubService", back_populates="service", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     def __repr__(self):
         return f"Service(id={self.id}, name={self.name})"
@@ -48,7 +49,10 @@ class SubService(Base):
     unit      = Column(String, default="Nos")
 
     service = relationship("Service", back_populates="sub_services")
-    reviews = relationship("Review", back_populates="service", cascade="all, delete-orphan", lazy="selectin")
+    # Never loaded with the catalog; reviews are queried / aggregated separately
+    reviews = relationship("Review", back_populates="service", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    # Rating totals; joinedload(SubService.review_stats) in catalog queries
+    review_stats = relationship("ReviewStats", uselist=False, viewonly=True, lazy="raise")
 
     def __repr__(self):
         return f"SubService(id={self.id}, name={self.name}, service_id={self.service_id})"
\ No newline at end of file
@@ -1,81 +1,105 @@
 import logging
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession 
 from sqlalchemy import select
-from app.core.database import get_db
+from sqlalchemy.orm import joinedload, selectinload
+from app.core.catalog_cache import catalog_cache, json_response, to_json
 # Ensure auth and models are correctly imported
 from app.modules.services.models import Service, SubService
+from app.modules.reviews.service import attach_ratings
 from app.modules.services.schemas import ServiceResponse, SubServiceResponse 
 
 logger = logging.getLogger("app.modules.services")
 
 router = APIRouter()
 
+# Responses are served from the catalog cache (see app/core/catalog_cache.py);
+# loaders run on a session the cache opens, only on a cache miss.
+_service = TypeAdapter(ServiceResponse)
+_services = TypeAdapter(List[ServiceResponse])
+_sub_service = TypeAdapter(SubServiceResponse)
+_sub_services = TypeAdapter(List[SubServiceResponse])
+
 @router.get("/", response_model=List[ServiceResponse])
 async def get_services(
     skip: int = 0, 
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    limit: int = 100
 ):
-    # selectinload is handled automatically by the model's lazy="selectin"
-    stmt = select(Service).where(Service.is_active == True).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    async def load(db: AsyncSession) -> bytes:
+        stmt = select(Service).where(Service.is_active == True).options(selectinload(Service.sub_services).joinedload(SubService.review_stats)).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        services = result.scalars().all()
+        attach_ratings([ss for s in services for ss in s.sub_services])
+        return to_json(_services, services)
+
+    return json_response(await catalog_cache.get_or_load(f"services:list:{skip}:{limit}", load))
 
 @router.get("/{slug}", response_model=ServiceResponse)
-async def get_service(slug: str, db: AsyncSession = Depends(get_db)):
-    stmt = select(Service).where(Service.slug == slug)
-    result = await db.execute(stmt)
-    service = result.scalar_one_or_none()
+async def get_service(slug: str):
+    async def load(db: AsyncSession) -> bytes:
+        stmt = select(Service).where(Service.slug == slug).options(selectinload(Service.sub_services).joinedload(SubService.review_stats))
+        result = await db.execute(stmt)
+        service = result.scalar_one_or_none()
 
-    if not service:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail="Service not found"
-        )
-    return service
+        if not service:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail="Service not found"
+            )
+        attach_ratings(service.sub_services)
+        return to_json(_service, service)
+
+    return json_response(await catalog_cache.get_or_load(f"services:detail:{slug}", load))
 
 @router.get("/{slug}/subservices", response_model=List[SubServiceResponse])
 async def get_all_service_variants(
     slug: str,
     skip: int = 0, 
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db)
+    limit: int = 10
 ):
-    # Fetch and paginate SubServices, not the Service
-    stmt = (
-        select(SubService)
-        .join(SubService.service)
-        .where(Service.slug == slug, Service.is_active == True)
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    variants = result.scalars().all()
-    
-    return variants
+    async def load(db: AsyncSession) -> bytes:
+        # Fetch and paginate SubServices, not the Service
+        stmt = (
+            select(SubService)
+            .join(SubService.service)
+            .where(Service.slug == slug, Service.is_active == True)
+            .options(joinedload(SubService.review_stats))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        variants = result.scalars().all()
+        attach_ratings(variants)
+        return to_json(_sub_services, variants)
+
+    return json_response(await catalog_cache.get_or_load(f"services:sub_services:{slug}:{skip}:{limit}", load))
 
 @router.get("/subservices/{subservice_slug}", response_model=SubServiceResponse)
 async def get_service_variant(
-    subservice_slug: str,
-    db: AsyncSession = Depends(get_db)
+    subservice_slug: str
 ):
-    # Use .join() to link the tables for filtering
-    stmt = (
-        select(SubService)
-        .where(
-            SubService.slug == subservice_slug, 
-            SubService.is_active == True
+    async def load(db: AsyncSession) -> bytes:
+        # Use .join() to link the tables for filtering
+        stmt = (
+            select(SubService)
+            .where(
+                SubService.slug == subservice_slug, 
+                SubService.is_active == True
+            )
+            .options(joinedload(SubService.review_stats))
         )
-    )
-    
-    result = await db.execute(stmt)
-    variant = result.scalar_one_or_none()
+        
+        result = await db.execute(stmt)
+        variant = result.scalar_one_or_none()
 
-    if not variant:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail="Service variant not found"
-        )
-    return variant
\ No newline at end of file
+        if not variant:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, 
+                detail="Service variant not found"
+            )
+        attach_ratings([variant])
+        return to_json(_sub_service, variant)
+
+    return json_response(await catalog_cache.get_or_load(f"sub_services:detail:{subservice_slug}", load))
\ No newline at end of file
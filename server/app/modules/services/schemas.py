@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field , model_validator, ConfigDict
 from typing import Optional, List, Dict, Any
 from slugify import slugify
 
+from app.modules.reviews.schemas import RatingSummary
+
 
 class SubServiceBase(BaseModel):
     name: str = Field(..., description="Name of the service variant")
@@ -73,6 +75,7 @@ class SubServiceUpdate(BaseModel):
 class SubServiceResponse(SubServiceBase):
     id: int
     service_id: int
+    rating: Optional[RatingSummary] = None  # public catalog responses only
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -3,10 +3,11 @@ from typing import Optional
 from uuid import UUID
 
 from app.modules.tickets.schemas import TicketResponse
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.modules.auth import get_current_admin_user
 from app.modules.users.models import User
 from app.modules.tickets.models import Ticket
@@ -21,8 +22,9 @@ router = APIRouter()
 
 @router.get("/all", response_model=list[TicketResponse])
 async def admin_list_all_tickets(
-    skip: int = 0,
-    limit: int = 50,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(50, ge=1, le=200),
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     priority_filter: Optional[str] = Query(None, description="Filter by priority"),
     admin: User = Depends(get_current_admin_user),
@@ -34,10 +36,8 @@ async def admin_list_all_tickets(
         query = query.where(Ticket.status == status_filter)
     if priority_filter:
         query = query.where(Ticket.priority == priority_filter)
-    query = query.order_by(Ticket.updated_at.desc()).offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    return result.scalars().all()
+    page = await paginate(db, query, keys=(Ticket.updated_at, Ticket.id), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
 
 
 @router.patch("/{ticket_id}/status", response_model=TicketResponse)
@@ -2,7 +2,7 @@
 Support ticket models — Ticket + threaded TicketMessage with read tracking.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func , Uuid , text
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func , Uuid , text, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from app.core.display_id import generate_nanoid
@@ -14,13 +14,19 @@ class Ticket(Base):
     id = Column(Uuid, primary_key=True, server_default=text("uuidv7()"))
     display_id = Column(String, unique=True, nullable=False, index=True,
                         default=lambda: generate_nanoid("TKT", 4))
-    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     subject = Column(String(300), nullable=False)
     status = Column(String, default="OPEN", nullable=False)        # OPEN, IN_PROGRESS, RESOLVED, CLOSED
     priority = Column(String, default="MEDIUM", nullable=False)    # LOW, MEDIUM, HIGH, URGENT
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Listings page by (updated_at, id)
+    __table_args__ = (
+        Index("ix_tickets_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index("ix_tickets_updated_at_id", "updated_at", "id"),
+    )
+
     # Relationships
     user = relationship("User")
     messages = relationship("TicketMessage", back_populates="ticket", cascade="all, delete-orphan",
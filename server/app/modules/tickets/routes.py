@@ -1,12 +1,13 @@
 import logging
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
 from app.modules.auth import get_current_user
 from app.modules.auth.schemas import TokenData
 from app.modules.notifications.service import NotificationService
@@ -79,8 +80,9 @@ async def create_ticket(
 
 @router.get("/", response_model=list[TicketResponse])
 async def list_my_tickets(
-    skip: int = 0,
-    limit: int = 20,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: int = Query(20, ge=1, le=100),
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     current_user: TokenData = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -89,10 +91,8 @@ async def list_my_tickets(
     query = select(Ticket).where(Ticket.user_id == current_user.id)
     if status_filter:
         query = query.where(Ticket.status == status_filter)
-    query = query.order_by(Ticket.updated_at.desc()).offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    return result.scalars().all()
+    page = await paginate(db, query, keys=(Ticket.updated_at, Ticket.id), limit=limit, cursor=cursor)
+    return with_cursor_headers(response, page)
 
 
 from sqlalchemy.orm import selectinload, joinedload
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, or_
 
@@ -9,7 +9,9 @@ from app.modules.users.schemas import UserOut
 from app.modules.users.models import User
 from app.core.database import get_db
 from app.modules.auth import get_current_admin_user
-from app.core.redis import redis_client
+from app.core import presence
+from app.core.pagination import CURSOR_DESCRIPTION, paginate, with_cursor_headers
+from app.modules.notifications.admin_roster import admin_roster
 
 logger = logging.getLogger("app.modules.users.admin")
 
@@ -21,28 +23,8 @@ async def get_online_users_and_count(
     db: AsyncSession = Depends(get_db)
 ):
     """[ADMIN] Get an exact count and list of currently online users. Merges SSE/WS tracking and HTTP tracking."""
-    import time
-    
-    # 1. Clean up stale SSE connections (older than 35s since last heartbeat)
-    cutoff = time.time() - 35
-    await redis_client.zremrangebyscore("active_users", "-inf", cutoff)
-    
-    # 2. Get SSE online users
-    sse_active_ids = await redis_client.zrange("active_users", 0, -1)
-    
-    # 3. Get HTTP active users (from middleware, TTL 5 mins)
-    cursor = 0
-    http_active_ids = set()
-    while True:
-        cursor, keys = await redis_client.scan(cursor=cursor, match="user_active:*", count=100)
-        for key in keys:
-             user_id_str = key.replace("user_active:", "")
-             http_active_ids.add(user_id_str)
-        if cursor == 0:
-            break
-             
-    # Union both tracking sources
-    all_online_ids = list(set(sse_active_ids) | http_active_ids)
+    # Both presence sorted sets are trimmed and read in one round-trip
+    all_online_ids = list(await presence.online_user_ids())
     
     if not all_online_ids:
         return {"count": 0, "users": []}
@@ -66,13 +48,19 @@ async def get_online_users_and_count(
 
 @router.get("/all" , response_model=list[UserOut])
 async def get_all_users(
+    response: Response,
     query : Optional[str] = None,
     admin : Optional[bool] = None,
     db : AsyncSession = Depends(get_db) , 
     current_user : User = Depends(get_current_admin_user),
-    is_active : Optional[bool] = None
+    is_active : Optional[bool] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     ):
-    
+    """
+    Keyset-paginated user list (ordered by id, i.e. signup order).
+    Cursors are returned in X-Next-Cursor / X-Prev-Cursor.
+    """
     stmt = select(User)
     if admin is not None:
         stmt = stmt.where(User.admin == admin)
@@ -85,13 +73,13 @@ async def get_all_users(
             User.phone.ilike(f"%{query}%")
         ))
     
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    page = await paginate(db, stmt, keys=(User.id,), limit=limit, cursor=cursor, descending=False)
+    users = with_cursor_headers(response, page)
     
-    # Check online status for all users in parallel
+    # Online status for the whole page in one Redis round-trip
+    online = await presence.online_flags(u.id for u in users)
     for user in users:
-        is_online = await redis_client.get(f"user_active:{user.id}")
-        user.is_online = bool(is_online)
+        user.is_online = online.get(str(user.id), False)
         
     return users
 
@@ -108,8 +96,8 @@ async def get_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    is_online = await redis_client.get(f"user_active:{user.id}")
-    user.is_online = bool(is_online)
+    online = await presence.online_flags([user.id])
+    user.is_online = online.get(str(user.id), False)
     
     return user
 
@@ -146,4 +134,6 @@ async def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     await db.execute(delete(User).where(User.id == user_id))
-    await db.commit()
\ No newline at end of file
+    await db.commit()
+    if user.admin:
+        await admin_roster.invalidate()
\ No newline at end of file
@@ -25,7 +25,7 @@ class User(Base):
     is_active = Column(Boolean , nullable = False , default = True)
     is_phone_verified = Column(Boolean, nullable=False, default=False)
     admin = Column(Boolean , nullable = False , default = False)
-    created_at = Column(DateTime(timezone = True) , server_default=func.now())
+    created_at = Column(DateTime(timezone = True) , server_default=func.now() , index=True)
     token_version = Column(Integer , nullable = False , default = 1)
     email_bounced = Column(Boolean, nullable = False, default = False)
 
@@ -0,0 +1,22 @@
+import asyncio
+import logging
+from celery import shared_task
+
+from app.modules.notifications.counters import notification_counters
+
+logger = logging.getLogger(__name__)
+
+# Add to celery beat schedule:
+# "reconcile-notification-counters": {"task": "app.tasks.notifications.reconcile_notification_counters", "schedule": crontab(minute="*/15")}
+
+
+async def _reconcile_notification_counters():
+    reconciled = await notification_counters.reconcile()
+    logger.info(f"Reconciled notification counters for {reconciled} users")
+
+
+# ── Celery entry points ─────────────────────────────────────────────────
+
+@shared_task(name="app.tasks.notifications.reconcile_notification_counters")
+def reconcile_notification_counters():
+    asyncio.run(_reconcile_notification_counters())
@@ -0,0 +1,170 @@
+"""
+Admin dashboard query benchmark.
+
+Seeds a synthetic dataset into the database at DATABASE_URL — users, inquiry
+groups, orders (half of them paid, each with a milestone and a transaction),
+spread over the last `--days` days — then times the `DashboardService`
+endpoints: get_overview, get_revenue, get_users, get_orders, get_inquiries
+and get_recent_activity. The overview's Redis cache key is deleted before
+every call, so each run takes the cache-miss path; the first overview run
+also refreshes the rollups for the freshly seeded days.
+
+Point it at a scratch database migrated to head (`alembic upgrade head`);
+Redis comes from the usual REDIS_* settings. Seeded rows are tagged by their
+e-mail domain and deleted afterwards unless --keep is given.
+Run from the server/ directory:
+
+    python -m benchmarks.admin_dashboard --users 20000 --period month --repeat 5
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import delete, insert, select
+
+from app.core.database import AsyncSessionLocal, engine
+from app.core.redis import redis_client
+from app.modules.admin_dashboard.rollups import refresh_rollups
+from app.modules.admin_dashboard.service import DashboardService
+from app.modules.inquiry.models import InquiryGroup
+from app.modules.orders.models import Order, OrderMilestone, Transaction
+from app.modules.users.models import User
+
+BATCH = 5000
+INQUIRY_STATUSES = ["DRAFT", "SUBMITTED", "QUOTED", "ACCEPTED", "REJECTED"]
+ORDER_STATUSES = ["WAITING_PAYMENT", "PARTIALLY_PAID", "PAID", "COMPLETED", "CANCELLED"]
+PAYMENT_MODES = ["ONLINE", "UPI_MANUAL", "CASH"]
+
+
+def _marker(run_id: str) -> str:
+    return f"@bench-{run_id}.invalid"
+
+
+async def _insert(table, rows: list) -> None:
+    async with AsyncSessionLocal() as db:
+        for i in range(0, len(rows), BATCH):
+            await db.execute(insert(table), rows[i:i + BATCH])
+        await db.commit()
+
+
+async def seed(run_id: str, users: int, days: int) -> dict:
+    rng = random.Random(run_id)
+    now = datetime.now(timezone.utc)
+
+    def created() -> datetime:
+        return now - timedelta(seconds=rng.randrange(days * 86400))
+
+    user_rows = [
+        {"id": uuid.uuid4(), "name": f"Bench User {i}", "email": f"user{i}{_marker(run_id)}", "created_at": created()}
+        for i in range(users)
+    ]
+    inquiry_rows = [
+        {
+            "id": uuid.uuid4(), "display_id": f"BENCH-{run_id}-{i}", "user_id": user["id"],
+            "status": rng.choice(INQUIRY_STATUSES), "created_at": user["created_at"],
+        }
+        for i, user in enumerate(user_rows)
+    ]
+
+    order_rows, milestone_rows, txn_rows = [], [], []
+    for inquiry in inquiry_rows[::2]:
+        total = Decimal(rng.randrange(500, 50000))
+        status = rng.choice(ORDER_STATUSES)
+        paid = total if status in ("PAID", "COMPLETED") else Decimal(0)
+        order_id, milestone_id = uuid.uuid4(), uuid.uuid4()
+        order_created = inquiry["created_at"] + timedelta(hours=rng.randrange(1, 72))
+        order_rows.append({
+            "id": order_id, "inquiry_id": inquiry["id"], "user_id": inquiry["user_id"],
+            "total_amount": total, "amount_paid": paid, "status": status, "split_type": "FULL",
+            "is_offline": rng.random() < 0.2, "created_at": order_created,
+        })
+        milestone_rows.append({
+            "id": milestone_id, "order_id": order_id, "split_type": "FULL", "label": "Full payment",
+            "percentage": Decimal(100), "amount": total, "order_index": 0,
+            "status": "PAID" if paid else "UNPAID",
+        })
+        if paid:
+            txn_rows.append({
+                "order_id": order_id, "milestone_id": milestone_id, "amount": paid,
+                "payment_mode": rng.choice(PAYMENT_MODES), "created_at": order_created + timedelta(hours=1),
+            })
+
+    await _insert(User.__table__, user_rows)
+    await _insert(InquiryGroup.__table__, inquiry_rows)
+    await _insert(Order.__table__, order_rows)
+    await _insert(OrderMilestone.__table__, milestone_rows)
+    await _insert(Transaction.__table__, txn_rows)
+    return {"users": len(user_rows), "inquiries": len(inquiry_rows),
+            "orders": len(order_rows), "transactions": len(txn_rows)}
+
+
+async def cleanup(run_id: str) -> None:
+    bench_users = select(User.id).where(User.email.like(f"%{_marker(run_id)}"))
+    bench_orders = select(Order.id).where(Order.user_id.in_(bench_users))
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Transaction).where(Transaction.order_id.in_(bench_orders)))
+        await db.execute(delete(OrderMilestone).where(OrderMilestone.order_id.in_(bench_orders)))
+        await db.execute(delete(Order).where(Order.user_id.in_(bench_users)))
+        await db.execute(delete(InquiryGroup).where(InquiryGroup.user_id.in_(bench_users)))
+        await db.execute(delete(User).where(User.email.like(f"%{_marker(run_id)}")))
+        await db.commit()
+    await refresh_rollups()  # the delete triggers marked the seeded days dirty
+
+
+async def _time(name: str, call, repeat: int, before=None) -> None:
+    samples = []
+    for _ in range(repeat):
+        if before:
+            await before()
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            await call(DashboardService(db))
+            samples.append(time.perf_counter() - start)
+    print(
+        f"{name:<22} first {1000 * samples[0]:8.1f} ms · "
+        f"median {1000 * statistics.median(samples):8.1f} ms · max {1000 * max(samples):8.1f} ms"
+    )
+
+
+async def run(users: int, days: int, period: str, repeat: int, keep: bool) -> None:
+    run_id = uuid.uuid4().hex[:8]
+    start = time.perf_counter()
+    counts = await seed(run_id, users, days)
+    print(f"seeded {counts} in {time.perf_counter() - start:.1f}s (run {run_id})\n")
+
+    async def drop_overview_cache() -> None:
+        await redis_client.delete(f"dashboard:overview:{period}")
+
+    try:
+        await _time("get_overview", lambda s: s.get_overview(period), repeat, before=drop_overview_cache)
+        await _time("get_revenue", lambda s: s.get_revenue(period), repeat)
+        await _time("get_users", lambda s: s.get_users(period), repeat)
+        await _time("get_orders", lambda s: s.get_orders(period), repeat)
+        await _time("get_inquiries", lambda s: s.get_inquiries(period), repeat)
+        await _time("get_recent_activity", lambda s: s.get_recent_activity(), repeat)
+    finally:
+        await drop_overview_cache()
+        if not keep:
+            await cleanup(run_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20000, help="users (and inquiries); half get an order")
+    parser.add_argument("--days", type=int, default=365, help="spread created_at over this many days")
+    parser.add_argument("--period", default="month", choices=["today", "week", "month", "quarter", "year", "all"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="leave the seeded rows in place")
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.days, args.period, args.repeat, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Broadcast notification benchmark.
+
+Seeds `--users` users into the database at DATABASE_URL with one server-side
+INSERT ... SELECT over generate_series (so seeding itself doesn't inflate this
+process's memory), then runs `NotificationService.broadcast()` to every
+active user and reports:
+
+  - elapsed time of the broadcast statement
+  - notification rows it created (checked with a COUNT in the same transaction)
+  - Python heap peak during the call (tracemalloc) and process peak RSS
+    (ru_maxrss) before and after it
+
+The broadcast's transaction is rolled back, so no notifications are kept and
+no counters are touched; the seeded users are deleted afterwards unless
+--keep is given. Every active user in the database receives the benchmark
+notification inside that transaction, so use a scratch database migrated to
+head (`alembic upgrade head`). Redis comes from the usual REDIS_* settings.
+Run from the server/ directory:
+
+    python -m benchmarks.broadcast --users 100000
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import String, cast, delete, func, insert, literal, select
+
+from app.core.database import AsyncSessionLocal, engine
+from app.modules.notifications.models import Notification
+from app.modules.notifications.schemas import NotificationAudience
+from app.modules.notifications.service import NotificationService
+from app.modules.users.models import User
+
+
+def _rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _marker(run_id: str) -> str:
+    return f"@bench-{run_id}.invalid"
+
+
+async def seed(run_id: str, users: int) -> None:
+    n = func.generate_series(1, users).column_valued("n")
+    rows = select(
+        literal("Bench User ") + cast(n, String),
+        literal("user") + cast(n, String) + literal(_marker(run_id)),
+    )
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User).from_select(["name", "email"], rows))
+        await db.commit()
+
+
+async def cleanup(run_id: str) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.email.like(f"%{_marker(run_id)}")))
+        await db.commit()
+
+
+async def run(users: int, keep: bool) -> None:
+    run_id = uuid.uuid4().hex[:8]
+    start = time.perf_counter()
+    await seed(run_id, users)
+    print(f"seeded {users} users in {time.perf_counter() - start:.1f}s (run {run_id})\n")
+
+    title = f"Benchmark broadcast {run_id}"
+    try:
+        async with AsyncSessionLocal() as db:
+            rss_before = _rss_mib()
+            tracemalloc.start()
+            start = time.perf_counter()
+            sent = await NotificationService.broadcast(
+                db, title, "Synthetic broadcast for benchmarking.", NotificationAudience(active=True)
+            )
+            elapsed = time.perf_counter() - start
+            _, heap_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            rss_after = _rss_mib()
+
+            rows = (await db.execute(
+                select(func.count()).select_from(Notification).where(Notification.title == title)
+            )).scalar_one()
+            await db.rollback()
+    finally:
+        if not keep:
+            await cleanup(run_id)
+        await engine.dispose()
+
+    print(f"broadcast returned    {sent}")
+    print(f"notification rows     {rows}")
+    print(f"elapsed               {1000 * elapsed:.0f} ms")
+    print(f"python heap peak      {heap_peak / 1024 / 1024:.2f} MiB (tracemalloc, during broadcast)")
+    print(f"peak RSS              {rss_before:.1f} MiB before → {rss_after:.1f} MiB after")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--keep", action="store_true", help="leave the seeded users in place")
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Email transport micro-benchmark.
+
+Starts two local stubs on 127.0.0.1 — a minimal SMTP relay and a minimal
+HTTP/1.1 JSON endpoint — and times N sends each way:
+
+  - SMTP: a fresh `aiosmtplib.send()` connection per message (the old path)
+          vs sessions borrowed from `SMTPConnectionPool`
+  - HTTP: a fresh `httpx.AsyncClient` per message
+          vs the shared keep-alive client from `get_http_client()`
+
+and reports messages per second, mean time per message and how many TCP
+connections each stub accepted.
+
+The stubs speak plaintext, so there is no STARTTLS or AUTH round-trip and the
+gap is a lower bound of what a remote relay costs. `--handshake-ms` delays
+every new connection's greeting / first response to stand in for that
+handshake. Nothing leaves the machine. Run from the server/ directory:
+
+    python -m benchmarks.email_transport --messages 200 --handshake-ms 50
+"""
+
+import argparse
+import asyncio
+import time
+from email.message import EmailMessage
+
+import aiosmtplib
+import httpx
+
+from app.core.config import settings
+from app.core.email.transport import SMTPConnectionPool, close_email_transport, get_http_client
+
+
+class _Stub:
+    """Counts accepted connections and delays each one by the handshake time."""
+
+    def __init__(self, handshake: float):
+        self.handshake = handshake
+        self.connections = 0
+
+
+async def _smtp_session(stub: _Stub, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    stub.connections += 1
+    await asyncio.sleep(stub.handshake)
+    writer.write(b"220 localhost bench stub\r\n")
+    try:
+        while line := await reader.readline():
+            command = line[:4].upper()
+            if command == b"DATA":
+                writer.write(b"354 end with <CRLF>.<CRLF>\r\n")
+                await writer.drain()
+                while await reader.readline() not in (b".\r\n", b""):
+                    pass
+                writer.write(b"250 queued\r\n")
+            elif command in (b"EHLO", b"HELO"):
+                writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 bye\r\n")
+                await writer.drain()
+                break
+            else:  # MAIL, RCPT, RSET, NOOP
+                writer.write(b"250 ok\r\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _http_session(stub: _Stub, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    stub.connections += 1
+    await asyncio.sleep(stub.handshake)
+    try:
+        while await reader.readline():  # request line
+            length = 0
+            while (header := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = header.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            if length:
+                await reader.readexactly(length)
+            body = b'{"messageId":"bench"}'
+            writer.write(
+                b"HTTP/1.1 201 Created\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+def _message(i: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = "bench@example.com"
+    msg["To"] = f"user{i}@example.com"
+    msg["Subject"] = f"Benchmark message {i}"
+    msg.set_content("Your verification code is 123456.")
+    return msg
+
+
+async def _timed(messages: int, concurrency: int, send) -> float:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _one(i: int) -> None:
+        async with slots:
+            await send(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(messages)))
+    return time.perf_counter() - start
+
+
+def _report(label: str, messages: int, elapsed: float, connections: int) -> None:
+    print(
+        f"{label:<22} {messages / elapsed:8.0f} msg/s · {1000 * elapsed / messages:7.2f} ms/msg"
+        f" · {connections} connections"
+    )
+
+
+async def run(messages: int, concurrency: int, handshake_ms: int) -> None:
+    handshake = handshake_ms / 1000
+    smtp_stub, http_stub = _Stub(handshake), _Stub(handshake)
+    smtp_server = await asyncio.start_server(lambda r, w: _smtp_session(smtp_stub, r, w), "127.0.0.1", 0)
+    http_server = await asyncio.start_server(lambda r, w: _http_session(http_stub, r, w), "127.0.0.1", 0)
+    smtp_port = smtp_server.sockets[0].getsockname()[1]
+    http_url = f"http://127.0.0.1:{http_server.sockets[0].getsockname()[1]}/v3/smtp/email"
+
+    settings.brevo_smtp_host, settings.brevo_smtp_port = "127.0.0.1", smtp_port
+    settings.brevo_smtp_user = settings.brevo_smtp_password = ""
+
+    print(f"{messages} messages, concurrency {concurrency}, handshake {handshake_ms} ms\n")
+
+    async def smtp_fresh(i: int) -> None:
+        await aiosmtplib.send(_message(i), hostname="127.0.0.1", port=smtp_port, start_tls=False)
+
+    elapsed = await _timed(messages, concurrency, smtp_fresh)
+    _report("SMTP fresh per message", messages, elapsed, smtp_stub.connections)
+
+    pool = SMTPConnectionPool(size=concurrency, start_tls=False)
+    smtp_stub.connections = 0
+
+    async def smtp_pooled(i: int) -> None:
+        async with pool.connection() as smtp:
+            await smtp.send_message(_message(i))
+
+    elapsed = await _timed(messages, concurrency, smtp_pooled)
+    await pool.close()
+    _report("SMTP pooled", messages, elapsed, smtp_stub.connections)
+
+    payload = {"sender": {"email": "bench@example.com"}, "subject": "Benchmark", "htmlContent": "<p>123456</p>"}
+
+    async def http_fresh(i: int) -> None:
+        async with httpx.AsyncClient() as client:
+            (await client.post(http_url, json={**payload, "to": [{"email": f"user{i}@example.com"}]})).raise_for_status()
+
+    elapsed = await _timed(messages, concurrency, http_fresh)
+    _report("HTTP fresh per message", messages, elapsed, http_stub.connections)
+
+    http_stub.connections = 0
+
+    async def http_shared(i: int) -> None:
+        client = get_http_client()
+        (await client.post(http_url, json={**payload, "to": [{"email": f"user{i}@example.com"}]})).raise_for_status()
+
+    elapsed = await _timed(messages, concurrency, http_shared)
+    await close_email_transport()
+    _report("HTTP shared client", messages, elapsed, http_stub.connections)
+
+    for server in (smtp_server, http_server):
+        server.close()
+        await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=settings.smtp_pool_size,
+                        help="sends in flight; also the SMTP pool size")
+    parser.add_argument("--handshake-ms", type=int, default=0,
+                        help="delay added to every new connection (stands in for TLS / AUTH)")
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.concurrency, args.handshake_ms))
+
+
+if __name__ == "__main__":
+    main()
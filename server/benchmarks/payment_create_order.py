@@ -0,0 +1,134 @@
+"""
+Create-order concurrency load test.
+
+Builds the real FastAPI app with the mock payment provider and an injected
+gateway latency (MOCK_PAYMENT_LATENCY_MS), then fires K concurrent
+`POST /payments/create-order` calls through `httpx.AsyncClient` over
+`ASGITransport` — the full middleware stack and route run in-process. If the
+gateway call is awaited rather than blocking the event loop, the batch
+finishes in about one latency instead of K × latency.
+
+Auth and the database session are replaced through `app.dependency_overrides`
+with a fixed user and an in-memory order, so the measurement is the gateway
+path alone and not the size of the DB pool. Needs Redis for the rate-limit
+and activity middleware (REDIS_* settings, .env). Keep K under the 200/min
+per-client rate limit. Run from the server/ directory:
+
+    python -m benchmarks.payment_create_order --concurrency 50 --latency-ms 300
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from decimal import Decimal
+
+import httpx
+
+from app.core import payment
+from app.core.config import settings
+from app.core.database import get_db
+from app.main import app
+from app.modules.auth import get_current_user
+from app.modules.auth.schemas import TokenData
+from app.modules.orders.models import Order, OrderMilestone
+
+
+class _Result:
+    def __init__(self, order):
+        self._order = order
+
+    def scalar_one_or_none(self):
+        return self._order
+
+
+class _OrderSession:
+    """Stands in for AsyncSession: every SELECT returns the same unpaid order."""
+
+    def __init__(self, order):
+        self._order = order
+
+    async def execute(self, *args, **kwargs):
+        return _Result(self._order)
+
+    async def commit(self):
+        pass
+
+
+def _order_for(user_id: uuid.UUID) -> Order:
+    order_id = uuid.uuid4()
+    milestone = OrderMilestone(
+        id=uuid.uuid4(),
+        order_id=order_id,
+        split_type="FULL",
+        amount=Decimal("1499.00"),
+        order_index=0,
+        status="UNPAID",
+    )
+    return Order(
+        id=order_id,
+        user_id=user_id,
+        total_amount=Decimal("1499.00"),
+        status="WAITING_PAYMENT",
+        split_type="FULL",
+        milestones=[milestone],
+    )
+
+
+async def run(concurrency: int, latency_ms: int) -> None:
+    settings.razorpay_key_id = ""
+    settings.mock_payment_latency_ms = latency_ms
+    await payment.close_payment_provider()  # drop any cached provider so the latency applies
+
+    user = TokenData(id=uuid.uuid4(), email="bench@example.com", admin=False)
+    order = _order_for(user.id)
+
+    async def _db():
+        yield _OrderSession(order)
+
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_db] = _db
+
+    durations: list = []
+    statuses: dict = {}
+
+    async def _call(client: httpx.AsyncClient) -> None:
+        start = time.perf_counter()
+        response = await client.post("/payments/create-order", json={"order_id": str(order.id)})
+        durations.append(time.perf_counter() - start)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            await _call(client)  # warm-up: imports, provider construction, first middleware pass
+            durations.clear()
+            statuses.clear()
+
+            wall_start = time.perf_counter()
+            await asyncio.gather(*(_call(client) for _ in range(concurrency)))
+            wall = time.perf_counter() - wall_start
+    finally:
+        app.dependency_overrides.clear()
+        await payment.close_payment_provider()
+
+    latency = latency_ms / 1000
+    print(f"concurrent requests   {concurrency}")
+    print(f"status codes          {dict(sorted(statuses.items()))}")
+    print(f"injected latency      {latency_ms} ms")
+    print(f"wall time             {1000 * wall:.0f} ms ({wall / latency:.2f}× one latency)" if latency else
+          f"wall time             {1000 * wall:.0f} ms")
+    print(f"serialised would be   {1000 * latency * concurrency:.0f} ms (K × latency)")
+    print(f"per-request           min {1000 * min(durations):.0f} ms · max {1000 * max(durations):.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=50, help="K concurrent create-order calls")
+    parser.add_argument("--latency-ms", type=int, default=300, help="simulated gateway round-trip")
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
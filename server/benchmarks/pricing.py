@@ -0,0 +1,111 @@
+"""
+Option pricing benchmark — pure Python, no database or Redis.
+
+Builds a synthetic SubProduct whose `config_schema` has `--sections` option
+sections (alternating dropdown / radio, `--options` values each) plus one
+number_input, generates the cartesian product of option selections (capped at
+`--max-items`), and prices them as inquiry items two ways:
+
+  - cached    — `price_items()`, which compiles the schema once through
+                `pricing_engine` and reuses it for every item
+  - recompile — base price + `compile_config(schema).option_total()` for each
+                item, i.e. parsing the raw JSON on every call
+
+Both must produce the same prices; the script checks that before timing.
+Reports µs per item (best of `--repeat`) and the one-off compile cost.
+Run from the server/ directory:
+
+    python -m benchmarks.pricing --sections 6 --options 5 --max-items 20000
+"""
+
+import argparse
+import itertools
+import time
+from datetime import datetime, timezone
+
+from app.modules.inquiry.pricing import compile_config, price_items
+from app.modules.inquiry.schemas import InquiryItemCreate
+from app.modules.products.models import SubProduct
+
+
+def _schema(sections: int, options: int) -> dict:
+    raw = [
+        {
+            "key": f"option_{s}",
+            "label": f"Option {s}",
+            "type": "dropdown" if s % 2 == 0 else "radio",
+            "options": [
+                {"label": f"Choice {o}", "value": f"choice_{o}", "price_mod": o * 12.5}
+                for o in range(options)
+            ],
+        }
+        for s in range(sections)
+    ]
+    raw.append({"key": "sheets", "label": "Sheets", "type": "number_input", "default_val": 10, "price_per_unit": 2})
+    raw.append({"key": "notes", "label": "Notes", "type": "text"})  # display-only
+    return {"sections": raw}
+
+
+def _items(sub_product: SubProduct, sections: int, options: int, max_items: int) -> list:
+    values = [f"choice_{o}" for o in range(options)]
+    combos = itertools.islice(itertools.product(values, repeat=sections), max_items)
+    return [
+        InquiryItemCreate(
+            product_id=sub_product.product_id,
+            subproduct_id=sub_product.id,
+            quantity=sub_product.minimum_quantity,
+            selected_options={**{f"option_{s}": v for s, v in enumerate(combo)}, "sheets": 10 + i % 7},
+        )
+        for i, combo in enumerate(combos)
+    ]
+
+
+def _best(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sections: int, options: int, max_items: int, repeat: int) -> None:
+    sub_product = SubProduct(
+        id=1, product_id=1, name="Bench product", base_price=250.0, minimum_quantity=1,
+        is_active=True, config_schema=_schema(sections, options), updated_at=datetime.now(timezone.utc),
+    )
+    items = _items(sub_product, sections, options, max_items)
+    catalog = {sub_product.id: sub_product}
+
+    def recompiled() -> list:
+        return [
+            sub_product.base_price + compile_config(sub_product.config_schema).option_total(item.selected_options)
+            for item in items
+        ]
+
+    assert price_items(items, catalog, {}) == recompiled(), "cached and recompiled prices differ"
+
+    compile_s = _best(repeat, lambda: compile_config(sub_product.config_schema))
+    cached_s = _best(repeat, lambda: price_items(items, catalog, {}))
+    recompile_s = _best(repeat, recompiled)
+
+    print(f"schema                {sections} option sections × {options} values + number_input + text")
+    print(f"selections priced     {len(items)} (of {options ** sections} combinations)")
+    print(f"compile_config once   {1e6 * compile_s:9.1f} µs")
+    print(f"cached pricing        {1e6 * cached_s / len(items):9.2f} µs/item ({1000 * cached_s:.1f} ms total)")
+    print(f"recompile per item    {1e6 * recompile_s / len(items):9.2f} µs/item ({1000 * recompile_s:.1f} ms total)")
+    print(f"speed-up              {recompile_s / cached_s:9.1f}×")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=6, help="dropdown/radio sections in the schema")
+    parser.add_argument("--options", type=int, default=5, help="values per section")
+    parser.add_argument("--max-items", type=int, default=20000, help="cap on generated selections")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sections, args.options, args.max_items, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
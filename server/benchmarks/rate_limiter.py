@@ -0,0 +1,114 @@
+"""
+RateLimitMiddleware overhead benchmark.
+
+Drives a trivial ASGI app (200 "ok") directly through the ASGI interface,
+with no HTTP client or server in the way, three ways:
+
+  - bare          — no middleware
+  - redis only    — RateLimitMiddleware with the LocalPreCheck disabled, so
+                    every request runs the sliding-window script
+  - local check   — RateLimitMiddleware with LocalPreCheck in front
+
+and reports microseconds per request, the overhead over the bare app, and
+Redis commands per request (counted on the rate limiter's client). Requests
+rotate over `--clients` client IPs; the limit is set high enough that
+nothing is rejected, so only the check itself is measured.
+
+Needs Redis via the usual REDIS_* settings (.env); keys are written under
+`global_limit:`. Run from the server/ directory:
+
+    python -m benchmarks.rate_limiter --requests 20000 --clients 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core import rate_limiter
+from app.core.middleware import RateLimitMiddleware
+from app.core.rate_limiter import LocalPreCheck
+
+
+class _CommandCounter:
+    """Counts commands sent through the rate limiter's Redis client."""
+
+    def __init__(self, client):
+        self.calls = 0
+        self._execute = client.execute_command
+        client.execute_command = self._counted
+
+    async def _counted(self, *args, **options):
+        self.calls += 1
+        return await self._execute(*args, **options)
+
+
+async def _app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _scope(client_ip: str) -> dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/products", "raw_path": b"/products", "query_string": b"",
+        "root_path": "", "headers": [], "client": (client_ip, 50000), "server": ("bench", 80),
+    }
+
+
+async def _measure(app, requests: int, clients: int, counter: _CommandCounter) -> tuple:
+    scopes = [_scope(f"10.0.{i // 250}.{i % 250 + 1}") for i in range(clients)]
+    statuses: dict = {}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            statuses[message["status"]] = statuses.get(message["status"], 0) + 1
+
+    for i in range(min(requests, clients)):  # warm-up: script load, first check per client
+        await app(scopes[i], _receive, send)
+    statuses.clear()
+
+    calls_before = counter.calls
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(scopes[i % clients], _receive, send)
+    elapsed = time.perf_counter() - start
+    return elapsed / requests, (counter.calls - calls_before) / requests, statuses
+
+
+async def run(requests: int, clients: int, sync_interval: float) -> None:
+    counter = _CommandCounter(rate_limiter.redis_client)
+    limit = requests * 10  # never reached: measure the check, not rejections
+
+    redis_only = RateLimitMiddleware(_app, limit=limit, window=60)
+    redis_only.pre_check = None
+
+    local_check = RateLimitMiddleware(_app, limit=limit, window=60)
+    local_check.pre_check = LocalPreCheck(local_check.limiter, sync_interval)
+
+    print(f"{requests} requests over {clients} clients, local sync interval {sync_interval}s\n")
+    bare_us = None
+    for label, app in (("bare", _app), ("redis only", redis_only), ("local check", local_check)):
+        per_request, calls, statuses = await _measure(app, requests, clients, counter)
+        us = per_request * 1e6
+        bare_us = us if bare_us is None else bare_us
+        print(
+            f"{label:<12} {us:9.1f} µs/request · +{us - bare_us:8.1f} µs overhead"
+            f" · {calls:.4f} redis calls/request · status {statuses}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=50, help="distinct client IPs to rotate through")
+    parser.add_argument("--sync-interval", type=float, default=1.0, help="LocalPreCheck sync interval (s)")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.clients, args.sync_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+SSE fan-out benchmark.
+
+Opens N simulated SSE clients through `sse_manager.subscribe()` (so they share
+the worker's single `pubsub_hub` connection exactly as real EventSource
+streams do), publishes timestamped events to every user channel and to the
+broadcast channel, and reports:
+
+  - Redis connections (CLIENT LIST) before / after subscribing, and how many
+    of them are in subscriber mode
+  - process CPU time spent while the events were delivered
+  - publish → SSE chunk delivery latency (p50 / p99 / max)
+
+Needs a running Redis configured through the usual REDIS_* settings (.env).
+Use a local or scratch instance: the benchmark publishes on `sse:broadcast`.
+Run from the server/ directory:
+
+    python -m benchmarks.sse_pubsub --subscribers 1000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import resource
+import time
+import uuid
+
+from app.core.pubsub import pubsub_hub
+from app.core.redis import redis_client
+from app.core.sse import sse_manager
+
+
+class _FakeRequest:
+    """The only part of starlette's Request the SSE stream touches."""
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+def _percentile(samples, pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+async def _client_counts() -> tuple:
+    clients = await redis_client.client_list()
+    subscribers = sum(1 for c in clients if int(c.get("sub", 0)) or int(c.get("psub", 0)))
+    return len(clients), subscribers
+
+
+async def _client(user_id: str, latencies: list, received: asyncio.Semaphore, ready: asyncio.Event):
+    async for chunk in sse_manager.subscribe(user_id, _FakeRequest()):
+        if chunk.startswith("event: connected"):
+            ready.set()
+            continue
+        if not chunk.startswith("event: bench"):
+            continue
+        data = json.loads(chunk.split("data: ", 1)[1])
+        latencies.append(time.perf_counter() - data["sent_at"])
+        received.release()
+
+
+async def run(subscribers: int, rounds: int, timeout: float) -> None:
+    conns_before, _ = await _client_counts()
+
+    latencies: list = []
+    received = asyncio.Semaphore(0)
+    user_ids = [str(uuid.uuid4()) for _ in range(subscribers)]
+    readiness = [asyncio.Event() for _ in user_ids]
+    tasks = [
+        asyncio.create_task(_client(user_id, latencies, received, ready))
+        for user_id, ready in zip(user_ids, readiness)
+    ]
+    await asyncio.gather(*(ready.wait() for ready in readiness))
+    conns_after, sub_conns = await _client_counts()
+
+    expected = rounds * subscribers * 2  # one direct event + one broadcast per client per round
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+
+    for _ in range(rounds):
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                payload = json.dumps({"event": "bench", "data": {"sent_at": time.perf_counter()}})
+                await pipe.publish(f"sse:user:{user_id}", payload)
+            await pipe.execute()
+        await sse_manager.publish_broadcast("bench", {"sent_at": time.perf_counter()})
+
+    delivered = 0
+    deadline = time.perf_counter() + timeout
+    while delivered < expected:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        try:
+            await asyncio.wait_for(received.acquire(), timeout=remaining)
+            delivered += 1
+        except asyncio.TimeoutError:
+            break
+
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await pubsub_hub.shutdown()
+
+    print(f"subscribers           {subscribers}")
+    print(f"redis connections     {conns_before} before → {conns_after} after ({sub_conns} in subscriber mode)")
+    print(f"events delivered      {delivered} / {expected} in {wall:.2f}s")
+    print(f"process CPU           {cpu:.2f}s ({100 * cpu / wall:.0f}% of one core)" if wall else "")
+    print(f"peak RSS              {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+    print(
+        "delivery latency      "
+        f"p50 {1000 * _percentile(latencies, 50):.2f} ms · "
+        f"p99 {1000 * _percentile(latencies, 99):.2f} ms · "
+        f"max {1000 * max(latencies, default=float('nan')):.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20, help="direct + broadcast events per subscriber")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds to wait for deliveries")
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.rounds, args.timeout))
+
+
+if __name__ == "__main__":
+    main()